@@ -0,0 +1,89 @@
+import pygame
+from assets import images
+
+
+class Animation():
+    """
+    A class control the frames of a sprite movement
+    , the left facing frames are mirrored once when the animation is created
+    so a moving sprite does not flip its image every frame
+    ...
+    Attributes:
+    -----------
+    frames: frames of each direction, keyed by 'right' and 'left'
+        dict
+    speed: frame index step of each update
+        float
+    loop: True to start again from the first frame after the last frame
+        bool
+    direction: current direction, 'right' or 'left'
+        string
+    index: current frame index
+        float
+    finished: True when an animation which does not loop reached its last frame
+        bool
+
+    Methods:
+    --------
+    from_files: create an animation from image files through the image cache
+    update: move on to the next frame
+    reset: come back to the first frame
+    image: current frame of the current direction
+    """
+
+    def __init__(self, frames, speed, loop=True, direction='right', mirrored=None):
+        """
+        Initialize animation
+
+            Parameter:
+                frames (list): right facing frames
+                speed (float): frame index step of each update
+                loop (bool): start again after the last frame
+                direction (string): first direction, 'right' or 'left'
+                mirrored (list): left facing frames, mirrored from frames if None
+        """
+        if mirrored is None:
+            mirrored = [pygame.transform.flip(frame, True, False)
+                        for frame in frames]
+        self.frames = {'right': frames, 'left': mirrored}
+        self.speed = speed
+        self.loop = loop
+        self.direction = direction
+        self.index = 0
+        self.finished = False
+
+    @classmethod
+    def from_files(cls, paths, scale, speed, loop=True, direction='right'):
+        """
+        Create an animation from image files, frames of both directions are
+        kept in the image cache and shared by every sprite using them
+        """
+        frames = [images.load(path, scale) for path in paths]
+        mirrored = [images.load(path, scale, flip=True) for path in paths]
+        return cls(frames, speed, loop, direction, mirrored)
+
+    def update(self):
+        """
+        Move on to the next frame
+        """
+        self.index += self.speed
+        if self.index >= len(self.frames[self.direction]):
+            if self.loop:
+                self.index = 0
+            else:
+                self.index = len(self.frames[self.direction]) - 1
+                self.finished = True
+
+    def reset(self):
+        """
+        Come back to the first frame
+        """
+        self.index = 0
+        self.finished = False
+
+    @property
+    def image(self):
+        """
+        Current frame of the current direction
+        """
+        return self.frames[self.direction][int(self.index)]
@@ -0,0 +1,436 @@
+import glob
+import json
+import mmap
+import os
+import struct
+import pygame
+from collections import OrderedDict
+from config import *
+
+
+def baked_name(path, scale=None, size=None):
+    """
+    Return the name of the pre-scaled copy of an image inside the baked folder
+
+        Parameter:
+            path (string): source image path
+            scale (tuple): scale factor of width and height
+            size (tuple): final width and height in pixel
+    """
+    root, ext = os.path.splitext(path)
+    if scale is not None:
+        if not isinstance(scale, tuple):
+            scale = (scale, scale)
+        return '%s@%gx%g%s' % (root, scale[0], scale[1], ext)
+    if size is not None:
+        return '%s@%dx%dpx%s' % (root, size[0], size[1], ext)
+    return path
+
+
+def read_manifest(folder=ASSET_BUILD_DIR):
+    """
+    Return the manifest written by build_assets.py, empty if the assets were not baked
+    """
+    try:
+        with open(os.path.join(folder, 'manifest.json')) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {'images': {}}
+
+
+def read_atlases(folder=ASSET_BUILD_DIR):
+    """
+    Return the atlas image path and the rect of every packed image, keyed by its baked name
+    """
+    frames = {}
+    for index_path in sorted(glob.glob(os.path.join(folder, 'atlas', '*.json'))):
+        try:
+            with open(index_path) as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            continue
+        sheet = '%s/atlas/%s' % (folder, index['image'])
+        for name, rect in index['frames'].items():
+            frames[name] = (sheet, pygame.Rect(rect))
+    return frames
+
+
+class AssetPack():
+    """
+    A class read the asset pack written by build_assets.py
+    , the pack file is mapped in memory once and holds decoded images and sounds
+    ...
+    Attributes:
+    -----------
+    path: pack file path
+        string
+    data: the whole pack file mapped in memory
+        mmap
+    view: view of data, slices of it do not copy the bytes
+        memoryview
+    mixer: frequency, size and channels of the packed sounds
+        tuple
+    images: offset, width and height of each image keyed by file path
+        dict
+    sounds: offset and length of each sound keyed by file path
+        dict
+
+    Methods:
+    --------
+    image: return a surface over the pixels of an image inside the pack
+    sound: return a sound made of the samples inside the pack
+    """
+
+    magic = b'MRVLPACK'
+    version = 1
+    header = struct.Struct('<8sII')
+    align = 16
+
+    def __init__(self, path):
+        """
+        Map the pack file and read its index
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            # Copy on write mapping: pages are shared with the file until they are written
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.data)
+
+        magic, version, index_size = self.header.unpack_from(self.data)
+        if magic != self.magic or version != self.version:
+            raise ValueError('%s is not a version %d asset pack' % (path, self.version))
+        start = self.header.size
+        index = json.loads(bytes(self.view[start:start + index_size]))
+        # Offsets of the index count from the aligned end of the index
+        self.base = -(-(start + index_size) // self.align) * self.align
+        self.mixer = tuple(index['mixer'])
+        self.images = index['images']
+        self.sounds = index['sounds']
+
+    def image(self, path):
+        """
+        Return a surface over the BGRA pixels of path, the pixels are not copied
+        """
+        offset, width, height = self.images[path]
+        offset += self.base
+        pixels = self.view[offset:offset + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), 'BGRA')
+
+    def sound(self, path):
+        """
+        Return the sound of path, its samples are already in the mixer format
+        """
+        offset, length = self.sounds[path]
+        offset += self.base
+        return pygame.mixer.Sound(buffer=self.view[offset:offset + length])
+
+
+def open_pack(path=os.path.join(ASSET_BUILD_DIR, ASSET_PACK)):
+    """
+    Return the asset pack of path, None if there is no usable pack so loose files are read
+    """
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+# Pre-scaled images, atlases and asset pack written by build_assets.py in build_dir
+build_dir = ASSET_BUILD_DIR
+baked_images = set(read_manifest()['images'])
+atlas_frames = read_atlases()
+pack = open_pack()
+
+
+def reload_build(folder=ASSET_BUILD_DIR):
+    """
+    Read again what build_assets.py wrote in folder, images are read from it from then on
+    """
+    global pack, build_dir
+    build_dir = folder
+    baked_images.clear()
+    baked_images.update(read_manifest(folder)['images'])
+    atlas_frames.clear()
+    atlas_frames.update(read_atlases(folder))
+    pack = open_pack(os.path.join(folder, ASSET_PACK))
+
+
+def image_source(path, scale=None, size=None):
+    """
+    Return the file to read for an image, the rect of the image if the file is an atlas
+    and True if the file is already at the display size
+
+        Parameter:
+            path (string): source image path
+            scale (tuple): scale factor of width and height
+            size (tuple): final width and height in pixel
+    """
+    name = baked_name(path, scale, size)
+    if name in atlas_frames:
+        sheet, rect = atlas_frames[name]
+        return sheet, rect, True
+    if name != path and name in baked_images:
+        return '%s/%s' % (build_dir, name), None, True
+    return path, None, False
+
+
+def decode_image(path):
+    """
+    Return the image file of path not converted yet, from the asset pack when it is there.
+    It does not touch the display so it can run outside the main thread
+    """
+    if pack is not None and path in pack.images:
+        return pack.image(path)
+    return pygame.image.load(path)
+
+
+def convert_image(image, alpha=True):
+    """
+    Return image in the display format, must run in the main thread
+    """
+    display = pygame.display.get_surface()
+    if alpha and display is not None and image.get_flags() & pygame.SRCALPHA \
+            and image.get_masks()[:3] == display.get_masks()[:3]:
+        # Already in the display format, e.g. a surface over the pixels of the asset pack
+        return image
+    return image.convert_alpha() if alpha else image.convert()
+
+
+# Display format taken by each normalized image, keyed by image name
+image_formats = {}
+
+
+def alpha_kind(image):
+    """
+    Return 'opaque' if image has no transparent pixel, 'binary' if its pixels are
+    either fully transparent or fully opaque and 'alpha' otherwise
+    """
+    if not image.get_flags() & pygame.SRCALPHA:
+        return 'opaque'
+    size = image.get_width() * image.get_height()
+    opaque = pygame.mask.from_surface(image, 254).count()
+    if opaque == size:
+        return 'opaque'
+    if pygame.mask.from_surface(image, 0).count() == opaque:
+        return 'binary'
+    return 'alpha'
+
+
+def normalize_image(image, name=None):
+    """
+    Return image in the fastest display format which draws it the same way, must run in the main thread:
+    opaque images lose their alpha channel, binary alpha images use a colorkey with RLE
+    acceleration and only the other images keep per-pixel alpha
+
+        Parameter:
+            image (pygame surface): decoded image
+            name (string): image name kept in image_formats with the format it took
+    """
+    kind = alpha_kind(image)
+    if kind == 'opaque':
+        result, route = image.convert(), 'opaque'
+    elif kind == 'binary':
+        result = pygame.Surface(image.get_size()).convert()
+        result.fill(COLORKEY)
+        result.blit(image, (0, 0))
+        transparent = image.get_width() * image.get_height() - \
+            pygame.mask.from_surface(image, 0).count()
+        keyed = pygame.mask.from_threshold(result, COLORKEY, (1, 1, 1, 255)).count()
+        if keyed == transparent:
+            result.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            route = 'colorkey+RLE'
+        else:
+            # An opaque pixel has the colorkey color
+            result, route = convert_image(image), 'alpha'
+    else:
+        result, route = convert_image(image), 'alpha'
+
+    if name is not None:
+        image_formats[name] = route
+    return result
+
+
+def flatten_image(image, color, name=None):
+    """
+    Return image drawn over a plain color in the display format, without alpha channel
+    """
+    result = pygame.Surface(image.get_size()).convert()
+    result.fill(color)
+    result.blit(image, (0, 0))
+    if name is not None:
+        image_formats[name] = 'flattened'
+    return result
+
+
+def read_image(path, alpha=True):
+    """
+    Return the image file of path in the display format
+    """
+    return convert_image(decode_image(path), alpha)
+
+
+def scale_image(image, scale=None, size=None):
+    """
+    Return image scaled by scale, or to size when scale is None
+    """
+    if scale is not None:
+        return pygame.transform.scale_by(image, scale)
+    if size is not None:
+        return pygame.transform.scale(image, size)
+    return image
+
+
+def load_image(path, scale=None, size=None, alpha=True):
+    """
+    Decode an image and convert it to the display format, the baked copy is used
+    when it exists so the image does not need to be scaled
+
+        Parameter:
+            path (string): image file path
+            scale (tuple): scale factor of width and height
+            size (tuple): final width and height in pixel, used when scale is None
+            alpha (bool): False for images without transparent pixels
+    """
+    source, rect, baked = image_source(path, scale, size)
+    image = read_image(source, alpha)
+    if rect is not None:
+        image = image.subsurface(rect).copy()
+    if not baked:
+        image = scale_image(image, scale, size)
+    return image
+
+
+def load_sound(path):
+    """
+    Return the sound of path, from the asset pack when it holds samples in the mixer format
+    """
+    if pack is not None and path in pack.sounds and pack.mixer == pygame.mixer.get_init():
+        return pack.sound(path)
+    return pygame.mixer.Sound(path)
+
+
+class ImageCache():
+    """
+    A class keep every decoded image of the game, so a sprite which is created again
+    does not read or decode its images from disk one more time
+    ...
+    Attributes:
+    -----------
+    policy: eviction policy, 'lru' drops the least recently used image,
+    'fifo' drops the oldest loaded image, 'none' never drops any image
+        string
+    max_size: number of images kept before evicting
+        int
+    hits: number of loads served from the cache
+        int
+    misses: number of loads which decoded the image file
+        int
+    evictions: number of images dropped from the cache
+        int
+    images: cached images keyed by (path, scale, flip)
+        OrderedDict
+    atlases: decoded atlas images keyed by path, packed images are subsurfaces of them
+        dict
+
+    Methods:
+    --------
+    load: return the image of path, scaled and flipped
+    load_atlas: return a decoded atlas image
+    insert: keep an image decoded somewhere else, e.g. by the prefetcher
+    evict: drop images until the cache fits max_size
+    clear: drop all cached images
+    report: return the cache counts as text
+    """
+
+    policies = ('lru', 'fifo', 'none')
+
+    def __init__(self, policy='lru', max_size=256):
+        """
+        Initialize an empty image cache
+        """
+        if policy not in self.policies:
+            raise ValueError('Unknown image cache policy: %r' % (policy,))
+        self.policy = policy
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.images = OrderedDict()
+        self.atlases = {}
+
+    def load(self, path, scale=None, flip=False):
+        """
+        Return the image of path, decoded only the first time it is asked for
+
+            Parameter:
+                path (string): image file path
+                scale (tuple): scale factor of width and height, None to keep the size
+                flip (bool): True to mirror the image horizontally
+        """
+        key = (path, scale, flip)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            if self.policy == 'lru':
+                self.images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        if flip:
+            # Mirror the cached image instead of decoding the file again, the format is kept
+            image = pygame.transform.flip(self.load(path, scale), True, False)
+        else:
+            source, rect, baked = image_source(path, scale)
+            if rect is not None:
+                # Packed image is a view of its atlas, no file is opened
+                image = self.load_atlas(source).subsurface(rect)
+            else:
+                image = load_image(path, scale)
+            image = normalize_image(image, baked_name(path, scale))
+
+        self.insert(key, image)
+        return image
+
+    def insert(self, key, image):
+        """
+        Keep image under key, a (path, scale, flip) tuple
+        """
+        self.images[key] = image
+        self.evict()
+
+    def load_atlas(self, path):
+        """
+        Return the atlas image of path, decoded only the first time it is asked for
+        """
+        if path not in self.atlases:
+            self.atlases[path] = read_image(path)
+        return self.atlases[path]
+
+    def evict(self):
+        """
+        Drop images until the cache fits max_size
+        """
+        if self.policy == 'none':
+            return
+        while len(self.images) > self.max_size:
+            self.images.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drop all cached images
+        """
+        self.images.clear()
+        self.atlases.clear()
+
+    def report(self):
+        """
+        Return the cache counts as text
+        """
+        return 'images: %d of %d kept (%s), %d atlases, %d hits, %d misses, %d evictions' % (
+            len(self.images), self.max_size, self.policy, len(self.atlases),
+            self.hits, self.misses, self.evictions)
+
+
+# Image cache shared by all sprites of the game
+images = ImageCache(IMAGE_CACHE_POLICY, IMAGE_CACHE_SIZE)
@@ -1,128 +1,101 @@
-import pygame
 from config import *
+from assets import load_image, flatten_image, image_formats
+
+# Background image of each round
+BACKGROUNDS = {
+    'start_screen': 'graphics/backgrounds/start_screen.png',
+    'intro': 'graphics/backgrounds/intro_screen.png',
+    'round1_1': 'graphics/backgrounds/round1_1.png',
+    'round1_2': 'graphics/backgrounds/round1_2.png',
+    'round2': 'graphics/backgrounds/round2.png',
+    'round3': 'graphics/backgrounds/round3.png',
+    'round4': 'graphics/backgrounds/round4.png',
+    'round5': 'graphics/backgrounds/round5.png',
+    'round6_1': 'graphics/backgrounds/round6_1.png',
+    'round6_2': 'graphics/backgrounds/round6_2.png',
+    'round7': 'graphics/backgrounds/round7.png',
+    'game_over': 'graphics/backgrounds/game_over_screen.png',
+    'end_screen': 'graphics/backgrounds/end_screen.png',
+}
+
+# Backgrounds with transparent pixels and the color they are drawn over
+BACKGROUND_FILLS = {'round4': (255, 255, 255)}
 
 
 class Background():
     """
-    A class contain all backgrounds of the game
-    , will change the background to suit with the current round
+    A class contain the backgrounds of the game
+    , will change the background to suit with the current round.
+    Only the current and the next round backgrounds are kept, already scaled to the window size
+    , the next one is decoded ahead of time by the prefetcher
     ...
     Attributes:
     -----------
     round: the current round of game class
         string
-    all round surf: the background of each round
-        png
+    rounds: ordered game rounds
+        list
+    surfaces: loaded backgrounds keyed by round
+        dict
     background: the current background
         pygame image
 
     Methods:
+    load: return the background of a round, load it if it is not kept yet
+    keep: keep a background loaded somewhere else, e.g. by the prefetcher
     update: update current background
     draw: draw the background on the game screen
     """
 
-    def __init__(self, round):
+    def __init__(self, round, rounds):
         """
         Initialize background when the game is played
         """
         self.round = round
+        self.rounds = rounds
+        self.surfaces = {}
 
-        self.start_screen_surf = pygame.image.load(
-            'graphics/backgrounds/start_screen.png').convert()
-        self.intro_surf = pygame.image.load(
-            'graphics/backgrounds/intro_screen.png').convert()
-        self.round1_1_surf = pygame.image.load(
-            'graphics/backgrounds/round1_1.png').convert()
-        self.round1_2_surf = pygame.image.load(
-            'graphics/backgrounds/round1_2.png').convert()
-        self.round2_surf = pygame.image.load(
-            'graphics/backgrounds/round2.png').convert()
-        self.round3_surf = pygame.image.load(
-            'graphics/backgrounds/round3.png').convert()
-        self.round4_surf = pygame.image.load(
-            'graphics/backgrounds/round4.png').convert_alpha()
-        self.round5_surf = pygame.image.load(
-            'graphics/backgrounds/round5.png').convert()
-        self.round6_1_surf = pygame.image.load(
-            'graphics/backgrounds/round6_1.png').convert()
-        self.round6_2_surf = pygame.image.load(
-            'graphics/backgrounds/round6_2.png').convert()
-        self.round7_surf = pygame.image.load(
-            'graphics/backgrounds/round7.png').convert()
-        self.end_screen_surf = pygame.image.load(
-            'graphics/backgrounds/end_screen.png').convert()
-        self.game_over_surf = pygame.image.load(
-            'graphics/backgrounds/game_over_screen.png').convert()
+        self.background = self.load(self.round)
 
-        if self.round == 'start_screen':
-            self.background = self.start_screen_surf
-        if self.round == 'intro':
-            self.background = self.intro_surf
-        if self.round == 'round1_1':
-            self.background = self.round1_1_surf
-        if self.round == 'round1_2':
-            self.background = self.round1_2_surf
-        if self.round == 'round2':
-            self.background = self.round2_surf
-        if self.round == 'round3':
-            self.background = self.round3_surf
-        if self.round == 'round4':
-            self.background = self.round4_surf
-        if self.round == 'round5':
-            self.background = self.round5_surf
-        if self.round == 'round6_1':
-            self.background = self.round6_1_surf
-        if self.round == 'round6_2':
-            self.background = self.round6_2_surf
-        if self.round == 'round7':
-            self.background = self.round7_surf
-        if self.round == 'game_over':
-            self.background = self.game_over_surf
-        if self.round == 'end_screen':
-            self.background = self.end_screen_surf
+    def load(self, round):
+        """
+        Return the background of round, scaled to the window size
+        """
+        if round not in self.surfaces:
+            path = BACKGROUNDS[round]
+            if round in BACKGROUND_FILLS:
+                # Flattened once here instead of filling the screen every frame
+                image = load_image(path, size=(WIN_WIDTH, WIN_HEIGHT))
+                image = flatten_image(image, BACKGROUND_FILLS[round], path)
+            else:
+                image = load_image(path, size=(WIN_WIDTH, WIN_HEIGHT), alpha=False)
+                image_formats[path] = 'opaque'
+            self.surfaces[round] = image
+        return self.surfaces[round]
 
-        self.background = pygame.transform.scale(
-            self.background, (WIN_WIDTH, WIN_HEIGHT))
+    def keep(self, round, surface):
+        """
+        Keep the background of round, unless it is already loaded
+        """
+        self.surfaces.setdefault(round, surface)
 
     def update(self, round):
         """
-        Update current background
+        Update current background, the backgrounds of finished rounds are dropped
         """
+        if round == self.round:
+            return
         self.round = round
-        if self.round == 'start_screen':
-            self.background = self.start_screen_surf
-        if self.round == 'intro':
-            self.background = self.intro_surf
-        if self.round == 'round1_1':
-            self.background = self.round1_1_surf
-        if self.round == 'round1_2':
-            self.background = self.round1_2_surf
-        if self.round == 'round2':
-            self.background = self.round2_surf
-        if self.round == 'round3':
-            self.background = self.round3_surf
-        if self.round == 'round4':
-            self.background = self.round4_surf
-        if self.round == 'round5':
-            self.background = self.round5_surf
-        if self.round == 'round6_1':
-            self.background = self.round6_1_surf
-        if self.round == 'round6_2':
-            self.background = self.round6_2_surf
-        if self.round == 'round7':
-            self.background = self.round7_surf
-        if self.round == 'game_over':
-            self.background = self.game_over_surf
-        if self.round == 'end_screen':
-            self.background = self.end_screen_surf
 
-        self.background = pygame.transform.scale(
-            self.background, (WIN_WIDTH, WIN_HEIGHT))
+        for kept in list(self.surfaces):
+            if kept != round and (round not in self.rounds or kept not in self.rounds
+                                  or self.rounds.index(kept) < self.rounds.index(round)):
+                del self.surfaces[kept]
+
+        self.background = self.load(self.round)
 
     def draw(self, screen, round):
         """
         Draw the background on the game screen
         """
-        if round == 'round4':
-            screen.fill((255, 255, 255))
         screen.blit(self.background, (0, 0))
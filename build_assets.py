@@ -0,0 +1,255 @@
+import argparse
+import glob
+import json
+import os
+import pygame
+from config import *
+from assets import AssetPack, baked_name, image_source, reload_build, images, image_formats
+from voice import is_streamed
+from sprite_assets import sprite_scales
+
+
+def background_paths():
+    """
+    Return the path of every background, they are drawn at the window size
+    """
+    return sorted(glob.glob('graphics/backgrounds/*.png'))
+
+
+def is_opaque(image):
+    """
+    Return True if the image has no transparent pixel
+    """
+    opaque = pygame.mask.from_surface(image, 254)
+    return opaque.count() == image.get_width() * image.get_height()
+
+
+def scaled_image(path, scale=None, size=None):
+    """
+    Return the image of path at its final display size, scaled the same way as the game does
+    """
+    image = pygame.image.load(path)
+    if scale is not None:
+        return pygame.transform.scale_by(image, scale)
+    return pygame.transform.scale(image, size)
+
+
+def bake_image(path, name, folder, scale=None, size=None):
+    """
+    Write the image of path at its final display size, opaque images are written
+    without alpha channel
+
+        Return:
+            size of the written file in byte
+    """
+    image = scaled_image(path, scale, size)
+    if is_opaque(image):
+        opaque = pygame.Surface(image.get_size(), 0, 24)
+        opaque.blit(image, (0, 0))
+        image = opaque
+
+    out = os.path.join(folder, name)
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    pygame.image.save(image, out)
+    return os.path.getsize(out)
+
+
+def bake(folder):
+    """
+    Pre-scale every sprite image and background into folder and write its manifest
+    """
+    jobs = [(path, scale, None) for path, scale in sprite_scales() if scale is not None]
+    jobs += [(path, None, (WIN_WIDTH, WIN_HEIGHT)) for path in background_paths()]
+
+    manifest = {'images': {}}
+    source_bytes = 0
+    baked_bytes = 0
+    for path, scale, size in jobs:
+        name = baked_name(path, scale, size)
+        source_bytes += os.path.getsize(path)
+        baked_bytes += bake_image(path, name, folder, scale, size)
+        manifest['images'][name] = {
+            'source': path,
+            'scale': list(scale) if scale is not None else None,
+            'size': list(size) if size is not None else None,
+        }
+
+    with open(os.path.join(folder, 'manifest.json'), 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+
+    print('Baked %d images into %s/ (%.1f MB -> %.1f MB)' % (
+        len(jobs), folder, source_bytes / 2**20, baked_bytes / 2**20))
+
+
+def atlas_group(path):
+    """
+    Return the atlas name of an image: one atlas for each character and one for all items
+    """
+    parts = path.split('/')
+    if parts[1] == 'animals':
+        return parts[2]
+    return parts[1]
+
+
+def pack_frames(frames, max_width=ATLAS_MAX_WIDTH, padding=1):
+    """
+    Place frames on shelves, the tallest frames first
+
+        Parameter:
+            frames (dict): images keyed by name
+            max_width (int): atlas width limit in pixel
+            padding (int): empty pixels around each frame
+
+        Return:
+            atlas size and the rect of each frame keyed by name
+    """
+    order = sorted(frames, key=lambda name: (-frames[name].get_height(), name))
+    rects = {}
+    x = y = shelf_height = width = 0
+    for name in order:
+        w, h = frames[name].get_size()
+        if x + w + padding > max_width and x > 0:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        rects[name] = pygame.Rect(x + padding, y + padding, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h + padding)
+        width = max(width, x + padding)
+    return (width, y + shelf_height + padding), rects
+
+
+def atlas(folder):
+    """
+    Pack the sprite images of each character and the items into atlases at their display size,
+    each atlas is written as a png image with a json index of its frames
+    """
+    groups = {}
+    for path, scale in sprite_scales():
+        groups.setdefault(atlas_group(path), {})[baked_name(path, scale)] = \
+            scaled_image(path, scale)
+
+    out = os.path.join(folder, 'atlas')
+    os.makedirs(out, exist_ok=True)
+    for group, frames in sorted(groups.items()):
+        size, rects = pack_frames(frames)
+        sheet = pygame.Surface(size, pygame.SRCALPHA, 32)
+        for name, rect in rects.items():
+            sheet.blit(frames[name], rect)
+        pygame.image.save(sheet, os.path.join(out, group + '.png'))
+
+        index = {
+            'image': group + '.png',
+            'frames': {name: list(rect) for name, rect in rects.items()},
+        }
+        with open(os.path.join(out, group + '.json'), 'w') as file:
+            json.dump(index, file, indent=1, sort_keys=True)
+
+    print('Packed %d images into %d atlases in %s/' % (
+        sum(len(frames) for frames in groups.values()), len(groups), out))
+
+
+def sound_paths():
+    """
+    Return the path of every sound of the game which is decoded in memory
+    , long voice lines are streamed from their wav file
+    """
+    return sorted(path.replace(os.sep, '/')
+                  for path in glob.glob('sound/**/*.wav', recursive=True)
+                  if not is_streamed(path))
+
+
+def pack(folder):
+    """
+    Write every image and sound the game reads into one asset pack: images as BGRA pixels
+    and sounds as samples in the mixer format, after an index of their offsets
+    """
+    reload_build(folder)
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.mixer.init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS)
+
+    image_paths = {image_source(path, scale)[0] for path, scale in sprite_scales()}
+    image_paths |= {image_source(path, size=(WIN_WIDTH, WIN_HEIGHT))[0]
+                    for path in background_paths()}
+
+    blobs = []
+    index = {'mixer': list(pygame.mixer.get_init()), 'images': {}, 'sounds': {}}
+    offset = 0
+    for path in sorted(image_paths):
+        image = pygame.image.load(path)
+        blobs.append(pygame.image.tobytes(image, 'BGRA'))
+        index['images'][path] = [offset, image.get_width(), image.get_height()]
+        offset += -(-len(blobs[-1]) // AssetPack.align) * AssetPack.align
+    for path in sound_paths():
+        blobs.append(pygame.mixer.Sound(path).get_raw())
+        index['sounds'][path] = [offset, len(blobs[-1])]
+        offset += -(-len(blobs[-1]) // AssetPack.align) * AssetPack.align
+
+    data = json.dumps(index, sort_keys=True).encode()
+    out = os.path.join(folder, ASSET_PACK)
+    os.makedirs(folder, exist_ok=True)
+    with open(out, 'wb') as file:
+        file.write(AssetPack.header.pack(AssetPack.magic, AssetPack.version, len(data)))
+        file.write(data)
+        for blob in [b''] + blobs:
+            file.write(b'\0' * (-file.tell() % AssetPack.align))
+            file.write(blob)
+
+    print('Packed %d images and %d sounds into %s (%.1f MB)' % (
+        len(index['images']), len(index['sounds']), out, os.path.getsize(out) / 2**20))
+
+
+def formats(folder):
+    """
+    Load every sprite image and background the way the game does and print the display
+    format each one took: opaque, colorkey+RLE, flattened or per-pixel alpha
+    """
+    from backgrounds import BACKGROUNDS, Background
+
+    reload_build(folder)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
+
+    for path, scale in sprite_scales():
+        images.load(path, scale)
+    bg = Background('start_screen', [])
+    for round in BACKGROUNDS:
+        bg.load(round)
+
+    counts = {}
+    for name, route in sorted(image_formats.items()):
+        print('%-14s %s' % (route, name))
+        counts[route] = counts.get(route, 0) + 1
+    print(', '.join('%d %s' % (count, route) for route, count in sorted(counts.items())))
+
+
+def main():
+    """
+    Run the asset build command
+    """
+    parser = argparse.ArgumentParser(
+        description='Build the game assets at their final display size')
+    parser.add_argument('command', nargs='?', default='all',
+                        choices=['all', 'bake', 'atlas', 'pack', 'formats'],
+                        help='bake: pre-scale sprite images and backgrounds, '
+                        'atlas: pack sprite images into atlases, '
+                        'pack: write the decoded images and sounds into one file, '
+                        'all: run every step, '
+                        'formats: print the display format each image takes in the game')
+    parser.add_argument('--out', default=ASSET_BUILD_DIR,
+                        help='output folder, the game reads %s/ unless it is run with '
+                        '--assets FOLDER' % ASSET_BUILD_DIR)
+    args = parser.parse_args()
+
+    if args.command in ('all', 'bake'):
+        bake(args.out)
+    if args.command in ('all', 'atlas'):
+        atlas(args.out)
+    if args.command in ('all', 'pack'):
+        pack(args.out)
+    if args.command == 'formats':
+        formats(args.out)
+
+
+if __name__ == '__main__':
+    main()
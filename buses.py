@@ -0,0 +1,170 @@
+import pygame
+from config import *
+
+
+class Bus():
+    """
+    A class group mixer channels reserved for one kind of sound, e.g. the voice lines
+    , the sounds of a bus only take the channels of the bus, so playing one never stops
+    the sounds of another bus. A sound played when every channel of the bus is busy takes
+    the channel of the oldest sound of the bus
+    ...
+    Attributes:
+    -----------
+    name: bus name, e.g. 'voice'
+        string
+    channels: reserved channels of the bus
+        list
+    volume: volume of the bus from 0 to 1
+        float
+    gain: volume scale applied on top of volume, below 1 while the bus is ducked
+        float
+    started: channel indexes of the bus, the channel which played last at the end
+        list
+    plays: number of sounds played on the bus
+        int
+
+    Methods:
+    --------
+    play: play a sound on a channel of the bus
+    stop: stop every sound of the bus
+    get_busy: return True if a sound of the bus is playing
+    set_volume: change the volume of the bus
+    set_gain: change the volume scale of the bus, e.g. to duck it
+    """
+
+    def __init__(self, name, first, count, volume=1.0):
+        """
+        Initialize a bus over the count mixer channels which follow channel first
+        , the mixer is started before and the channels reserved
+        """
+        self.name = name
+        self.channels = [pygame.mixer.Channel(index) for index in range(first, first + count)]
+        self.volume = volume
+        self.gain = 1.0
+        self.started = list(range(count))
+        self.plays = 0
+        self.set_volume(volume)
+
+    def play(self, sound, loops=0):
+        """
+        Play sound on a free channel of the bus, on the channel of its oldest sound if none is
+        free. Playing on a busy channel replaces its sound, it is one channel operation
+
+            Return:
+                the channel the sound plays on
+        """
+        index = next((index for index in self.started if not self.channels[index].get_busy()),
+                     self.started[0])
+        self.started.remove(index)
+        self.started.append(index)
+        channel = self.channels[index]
+        channel.play(sound, loops)
+        channel.set_volume(self.volume * self.gain)
+        self.plays += 1
+        return channel
+
+    def stop(self):
+        """
+        Stop every sound of the bus
+        """
+        for channel in self.channels:
+            channel.stop()
+
+    def get_busy(self):
+        """
+        Return True if a sound of the bus is playing
+        """
+        return any(channel.get_busy() for channel in self.channels)
+
+    def set_volume(self, volume):
+        """
+        Change the volume of the bus, from 0 to 1
+        """
+        self.volume = volume
+        for channel in self.channels:
+            channel.set_volume(self.volume * self.gain)
+
+    def set_gain(self, gain):
+        """
+        Change the volume scale of the bus, 1 for its own volume
+        """
+        if gain != self.gain:
+            self.gain = gain
+            self.set_volume(self.volume)
+
+
+class Buses():
+    """
+    A class reserve the mixer channels of the music, voice and sfx buses
+    , channel 0 is the music, channel 1 the voice lines and the next SFX_CHANNELS channels
+    the sound effects. One voice line plays at a time: a new line takes the voice channel of
+    the line which was playing. The music is ducked while a voice line plays
+    ...
+    Attributes:
+    -----------
+    music: bus of the theme music
+        Bus
+    voice: bus of the voice lines
+        Bus
+    sfx: bus of the sound effects
+        Bus
+    ducked: True while the music is ducked
+        bool
+    ducks: number of times the music was ducked
+        int
+
+    Methods:
+    --------
+    start: reserve the channels of the buses, the mixer is started before
+    bus: return a bus by its name
+    duck: duck the music while dialogue plays, or bring it back
+    report: return the sounds played on each bus as text
+    """
+
+    def __init__(self):
+        """
+        Initialize buses, the channels are reserved by start
+        """
+        self.music = self.voice = self.sfx = None
+        self.ducked = False
+        self.ducks = 0
+
+    def start(self):
+        """
+        Reserve the channels of the buses, so sounds played without a bus never take them
+        """
+        pygame.mixer.set_reserved(2 + SFX_CHANNELS)
+        self.music = Bus('music', 0, 1, MUSIC_VOLUME)
+        self.voice = Bus('voice', 1, 1, VOICE_VOLUME)
+        self.sfx = Bus('sfx', 2, SFX_CHANNELS, SFX_VOLUME)
+
+    def bus(self, name):
+        """
+        Return the bus of name, 'music', 'voice' or 'sfx'
+        """
+        return getattr(self, name)
+
+    def duck(self, dialogue):
+        """
+        Duck the music to DUCK_GAIN of its volume while dialogue plays, back to its volume after
+        """
+        if self.music is None or dialogue == self.ducked:
+            return
+        self.ducked = dialogue
+        if dialogue:
+            self.ducks += 1
+        self.music.set_gain(DUCK_GAIN if dialogue else 1.0)
+
+    def report(self):
+        """
+        Return the sounds played on each bus and the music ducks as text
+        """
+        if self.music is None:
+            return 'buses: not started'
+        return 'buses: %d music, %d voice, %d sfx plays, music ducked %d times' % (
+            self.music.plays, self.voice.plays, self.sfx.plays, self.ducks)
+
+
+# Mixer buses shared by the game and the sound bank
+buses = Buses()
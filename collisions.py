@@ -0,0 +1,238 @@
+from config import *
+
+
+class Pair():
+    """
+    A class hold what is known about two sprites which may touch
+    ...
+    Attributes:
+    -----------
+    sprites: the two sprites
+        tuple
+    touching: True if their rects overlapped at the last check, None before the first one
+        bool
+    enter: functions called when they start touching
+        list
+    exit: functions called when they stop touching
+        list
+    """
+
+    def __init__(self, a, b):
+        """
+        Initialize a pair which was never checked
+        """
+        self.sprites = (a, b)
+        self.touching = None
+        self.enter = []
+        self.exit = []
+
+
+class Collisions():
+    """
+    A class keep track of which watched pairs of sprites touch, so the sprites do not test
+    their rects every step. Pairs are registered by watch or touching. The screen is cut into
+    square cells of COLLISION_CELL pixels and a spatial hash lists each watched sprite in the
+    cells its rect covers. Once a step the rects of the watched sprites are compared with
+    where they were listed, a sprite which moved leaves the cells it no longer covers and
+    joins the cells it entered. Only the pairs of a moved sprite with a sprite of its cells,
+    or which touched at their last check, have their rects tested. The enter and exit
+    functions of a pair are called when its sprites start or stop touching. A killed sprite
+    is forgotten with its pairs at the next update, touching still tests its last rect
+    ...
+    Attributes:
+    -----------
+    cell: size of a cell in pixel
+        int
+    cells: watched sprites listed in each cell keyed by (column, row), a cell without any
+        sprite is deleted
+        dict
+    places: rect of each watched sprite where it was listed and the cells it is listed in
+        dict
+    pairs: watched pairs keyed by frozenset of their two sprites
+        dict
+    partners: pair of each watched sprite with each of its partners, keyed by sprite then
+        partner
+        dict
+    fresh: pairs which were never checked
+        list
+    changes: number of times a pair started or stopped touching, sleeping sprites wake up
+        when it changes
+        int
+    checks: number of pairs checked since the last report
+        int
+    tests: number of rects tested since the last report
+        int
+
+    Methods:
+    --------
+    watch: watch a pair of sprites, with functions called when they start or stop touching
+    touching: return True if two sprites touch
+    moved: return True if a sprite moved since it was listed
+    covered: return the cells a rect covers
+    place: list a sprite in the cells its rect covers
+    unplace: take a sprite out of its cells
+    forget: stop watching a sprite and its pairs
+    update: check the pairs of the sprites which moved and call their functions
+    report: return the checked pairs and tested rects as text
+    """
+
+    def __init__(self, cell=COLLISION_CELL):
+        """
+        Initialize collisions without watched sprites
+        """
+        self.cell = cell
+        self.cells = {}
+        self.places = {}
+        self.pairs = {}
+        self.partners = {}
+        self.fresh = []
+        self.changes = 0
+        self.checks = 0
+        self.tests = 0
+
+    def watch(self, a, b, enter=None, exit=None):
+        """
+        Watch a and b, a pair is watched once whatever the number of times it is asked for
+
+            Parameter:
+                a, b (pygame Sprite): sprites which may touch
+                enter (function): called without argument when they start touching, also
+                    when they touch at the first check
+                exit (function): called without argument when they stop touching
+
+            Return:
+                the Pair of a and b
+        """
+        key = frozenset((a, b))
+        pair = self.pairs.get(key)
+        if pair is None:
+            pair = self.pairs[key] = Pair(a, b)
+            for sprite, partner in ((a, b), (b, a)):
+                if sprite not in self.places:
+                    self.place(sprite)
+                self.partners.setdefault(sprite, {})[partner] = pair
+            self.fresh.append(pair)
+        if enter is not None:
+            pair.enter.append(enter)
+        if exit is not None:
+            pair.exit.append(exit)
+        return pair
+
+    def touching(self, a, b):
+        """
+        Return True if the rects of a and b overlap, the pair is watched from then on while
+        both are alive. What is known about the pair is used unless one of them moved since
+        the last check
+        """
+        if not (a.alive() and b.alive()):
+            # e.g. the saw is killed once it was used, its last rect is still tested
+            self.tests += 1
+            return a.rect.colliderect(b.rect)
+        pair = self.watch(a, b)
+        if pair.touching is None or self.moved(a) or self.moved(b):
+            self.tests += 1
+            return a.rect.colliderect(b.rect)
+        return pair.touching
+
+    def moved(self, sprite):
+        """
+        Return True if the rect of sprite changed since it was listed
+        """
+        return tuple(sprite.rect) != self.places[sprite][0]
+
+    def covered(self, rect):
+        """
+        Return the (column, row) of the cells rect covers
+        """
+        left, top = rect.left // self.cell, rect.top // self.cell
+        right, bottom = (rect.right - 1) // self.cell, (rect.bottom - 1) // self.cell
+        return {(column, row) for column in range(left, right + 1)
+                for row in range(top, bottom + 1)}
+
+    def place(self, sprite):
+        """
+        List sprite in the cells its rect covers, only the cells it left or entered change
+        """
+        rect, cells = self.places.get(sprite, (None, set()))
+        covered = self.covered(sprite.rect)
+        for key in cells - covered:
+            listed = self.cells[key]
+            listed.discard(sprite)
+            if not listed:
+                del self.cells[key]
+        for key in covered - cells:
+            self.cells.setdefault(key, set()).add(sprite)
+        self.places[sprite] = (tuple(sprite.rect), covered)
+
+    def unplace(self, sprite):
+        """
+        Take sprite out of the cells it is listed in
+        """
+        rect, cells = self.places.pop(sprite)
+        for key in cells:
+            listed = self.cells[key]
+            listed.discard(sprite)
+            if not listed:
+                del self.cells[key]
+
+    def forget(self, sprite):
+        """
+        Stop watching sprite and its pairs, a partner left without pairs is not watched either
+        """
+        self.unplace(sprite)
+        for partner, pair in self.partners.pop(sprite).items():
+            del self.pairs[frozenset(pair.sprites)]
+            del self.partners[partner][sprite]
+            if not self.partners[partner]:
+                del self.partners[partner]
+                self.unplace(partner)
+
+    def update(self):
+        """
+        Check the pairs of the sprites which moved and the new pairs, then call the functions
+        of the pairs which started or stopped touching. Called once a step
+        """
+        for sprite in [sprite for sprite in self.places if not sprite.alive()]:
+            if sprite in self.places:
+                self.forget(sprite)
+        moved = [sprite for sprite in self.places if self.moved(sprite)]
+        for sprite in moved:
+            self.place(sprite)
+
+        # Ordered and without duplicates, a pair of two moved sprites is checked once
+        checked = dict.fromkeys(pair for pair in self.fresh
+                                if self.pairs.get(frozenset(pair.sprites)) is pair)
+        self.fresh = []
+        for sprite in moved:
+            near = set()
+            for key in self.places[sprite][1]:
+                near.update(self.cells[key])
+            for partner, pair in self.partners[sprite].items():
+                # A pair which touched is checked for its exit even without a common cell
+                if partner in near or pair.touching:
+                    checked[pair] = None
+
+        calls = []
+        for pair in checked:
+            self.checks += 1
+            self.tests += 1
+            a, b = pair.sprites
+            touching = a.rect.colliderect(b.rect)
+            if touching == bool(pair.touching):
+                pair.touching = touching
+                continue
+            pair.touching = touching
+            self.changes += 1
+            calls.extend(pair.enter if touching else pair.exit)
+        # Called once every pair is checked, a function may kill or move its sprites
+        for call in calls:
+            call()
+
+    def report(self):
+        """
+        Return the pairs checked and the rects tested since the last report as text
+        """
+        text = 'collisions: %d pairs, %d sprites in %d cells, %d checked, %d rects tested' % (
+            len(self.pairs), len(self.places), len(self.cells), self.checks, self.tests)
+        self.checks = self.tests = 0
+        return text
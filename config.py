@@ -8,4 +8,51 @@ PLAYER_MOVEMENT = 0.2
 PLAYER_LAYER = 3
 SUB_CHAR = 2
 BG_LAYER = 1
-ITEMS_LAYER = 4
\ No newline at end of file
+ITEMS_LAYER = 4
+
+IMAGE_CACHE_POLICY = 'lru'
+IMAGE_CACHE_SIZE = 256
+ASSET_BUILD_DIR = 'baked'
+ATLAS_MAX_WIDTH = 1024
+ASSET_PACK = 'assets.pack'
+
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+
+PREFETCH_BUDGET = 4
+VOICE_STREAM_SECONDS = 5
+SOUND_BANK_MB = 32
+
+RENDERER = 'dirty'
+DIRTY_RECTS_MAX = 16
+COLORKEY = (255, 0, 255)
+WINDOW = 'fixed'
+SCALE_FILTER = 'nearest'
+
+IDLE_AFTER_FRAMES = 3
+IDLE_TIMEOUT = 100
+STATS_INTERVAL = 5
+
+STEP_RATE = 60
+STEP_TIME = 1000 / STEP_RATE
+MAX_STEPS = 8
+
+FONT = 'font/Pixeltype.ttf'
+TEXT_CACHE_SIZE = 128
+TEXT_PADDING = 6
+TEXT_LAYER = 5
+SUBTITLE_SIZE = 36
+SUBTITLE_COLOR = (255, 255, 255)
+SUBTITLE_BACKGROUND = (0, 0, 0, 160)
+HUD_SIZE = 28
+HUD_COLOR = (255, 255, 0)
+
+SFX_CHANNELS = 2
+MUSIC_VOLUME = 0.6
+VOICE_VOLUME = 1.0
+SFX_VOLUME = 0.8
+DUCK_GAIN = 0.35
+
+HIT_CELL = 100
+COLLISION_CELL = 100
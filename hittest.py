@@ -0,0 +1,137 @@
+import itertools
+import pygame
+from config import *
+
+
+class HitGroup(pygame.sprite.LayeredUpdates):
+    """
+    A class find the sprite under the mouse without testing every clickable sprite
+    , the screen is cut into square cells of HIT_CELL pixels and each sprite is listed in the
+    cells its rect covers. A click only tests the sprites listed in its cell and the topmost
+    one is hit: highest layer first, then the last added. A killed sprite leaves the group,
+    and so the cells, like it leaves any pygame group
+    ...
+    Attributes:
+    -----------
+    cell: size of a cell in pixel
+        int
+    cells: sprites listed in each cell, keyed by (column, row)
+        dict
+    places: rect and cells of each sprite where it was listed
+        dict
+    orders: number of each sprite in the order they were added, the last added is on top
+        dict
+    counter: numbers given to the sprites when they are added
+        itertools.count
+    hits: number of clicks looked up since the last report
+        int
+    tests: number of rects tested since the last report
+        int
+
+    Methods:
+    --------
+    covered: return the cells a rect covers
+    place: list a sprite in the cells its rect covers
+    unplace: take a sprite out of its cells
+    sync: list again the sprites which moved since they were listed
+    hit: return the topmost sprite at a point
+    report: return the rects tested per click as text
+    """
+
+    def __init__(self, *sprites, cell=HIT_CELL):
+        """
+        Initialize an empty index with cells of cell pixels
+        """
+        self.cell = cell
+        self.cells = {}
+        self.places = {}
+        self.orders = {}
+        self.counter = itertools.count()
+        self.hits = 0
+        self.tests = 0
+        pygame.sprite.LayeredUpdates.__init__(self, *sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Add sprite to the group and list it in its cells
+        """
+        pygame.sprite.LayeredUpdates.add_internal(self, sprite, layer)
+        self.orders[sprite] = next(self.counter)
+        self.place(sprite)
+
+    def remove_internal(self, sprite):
+        """
+        Remove sprite from the group and from its cells
+        """
+        self.unplace(sprite)
+        self.orders.pop(sprite, None)
+        pygame.sprite.LayeredUpdates.remove_internal(self, sprite)
+
+    def covered(self, rect):
+        """
+        Return the (column, row) of the cells rect covers
+        """
+        left, top = rect.left // self.cell, rect.top // self.cell
+        right, bottom = (rect.right - 1) // self.cell, (rect.bottom - 1) // self.cell
+        return [(column, row) for column in range(left, right + 1)
+                for row in range(top, bottom + 1)]
+
+    def place(self, sprite):
+        """
+        List sprite in the cells its rect covers, e.g. after it was dragged. A sprite added
+        to the group before it has a rect is listed by the next sync
+        """
+        if sprite not in self.orders:
+            return
+        self.unplace(sprite)
+        if getattr(sprite, 'rect', None) is None:
+            self.places[sprite] = (None, [])
+            return
+        cells = self.covered(sprite.rect)
+        for key in cells:
+            self.cells.setdefault(key, set()).add(sprite)
+        self.places[sprite] = (tuple(sprite.rect), cells)
+
+    def unplace(self, sprite):
+        """
+        Take sprite out of the cells it is listed in
+        """
+        rect, cells = self.places.pop(sprite, (None, ()))
+        for key in cells:
+            listed = self.cells[key]
+            listed.discard(sprite)
+            if not listed:
+                del self.cells[key]
+
+    def sync(self):
+        """
+        List again the sprites whose rect changed since they were listed, called once a step
+        after the sprites were updated
+        """
+        for sprite, (rect, cells) in list(self.places.items()):
+            if rect is None or tuple(sprite.rect) != rect:
+                self.place(sprite)
+
+    def hit(self, pos):
+        """
+        Return the topmost sprite whose rect holds pos, None if there is none
+        """
+        self.hits += 1
+        top = None
+        key = (pos[0] // self.cell, pos[1] // self.cell)
+        for sprite in self.cells.get(key, ()):
+            self.tests += 1
+            if sprite.rect.collidepoint(pos):
+                order = (self.get_layer_of_sprite(sprite), self.orders[sprite])
+                if top is None or order > top[0]:
+                    top = (order, sprite)
+        return None if top is None else top[1]
+
+    def report(self):
+        """
+        Return the rects tested per click since the last report as text
+        """
+        text = 'clicks: %d, %.1f rects tested per click' % (
+            self.hits, self.tests / max(self.hits, 1))
+        self.hits = self.tests = 0
+        return text
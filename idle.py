@@ -0,0 +1,102 @@
+import time
+import pygame
+from config import *
+
+
+class IdleLoop():
+    """
+    A class decide how the main loop waits after each frame
+    , at FPS while something changes on the screen, then blocked on pygame.event.wait
+    with a timeout once IDLE_AFTER_FRAMES frames in a row changed nothing and got no input.
+    The game logic still runs at least every IDLE_TIMEOUT milliseconds, e.g. to see a sound end
+    ...
+    Attributes:
+    -----------
+    stats: True to print the cpu usage every STATS_INTERVAL seconds
+        bool
+    still_frames: number of frames in a row which changed nothing
+        int
+    frames: number of frames since the last report
+        int
+    idle_frames: number of frames since the last report which waited for an event
+        int
+    cpu_start: process time of the last report
+        float
+    wall_start: time of the last report
+        float
+    cpu: cpu usage between the last two reports, in percent of one core
+        float
+    reports: functions returning more text to print with the cpu usage
+        list
+    pending: events taken from the queue by the idle wait, handled before the queued events
+        list
+
+    Methods:
+    --------
+    wait: wait until the next frame
+    events: return the events of the frame in the order they came
+    report: measure the cpu usage every STATS_INTERVAL seconds
+    """
+
+    def __init__(self, stats=False):
+        """
+        Initialize idle loop
+        """
+        self.stats = stats
+        self.still_frames = 0
+        self.frames = 0
+        self.idle_frames = 0
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+        self.cpu = 0.0
+        self.reports = []
+        self.pending = []
+
+    def wait(self, clock, changed, timeout=IDLE_TIMEOUT):
+        """
+        Wait until the next frame
+
+            Parameter:
+                clock (pygame Clock): game clock
+                changed (bool): True if the frame changed the screen or received input
+                timeout (int): longest idle wait in milliseconds
+        """
+        self.still_frames = 0 if changed else self.still_frames + 1
+        self.frames += 1
+        if self.still_frames >= IDLE_AFTER_FRAMES:
+            self.idle_frames += 1
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                # Kept out of the queue, posting it again would put it after the events
+                # queued since, e.g. a mouse button up before its button down
+                self.pending.append(event)
+            clock.tick()
+        else:
+            clock.tick(FPS)
+        self.report()
+
+    def events(self):
+        """
+        Return the event which ended the idle wait, if any, then the queued events
+        """
+        events = self.pending + pygame.event.get()
+        self.pending = []
+        return events
+
+    def report(self):
+        """
+        Measure the cpu usage every STATS_INTERVAL seconds
+        """
+        wall = time.perf_counter() - self.wall_start
+        if wall < STATS_INTERVAL:
+            return
+        cpu = time.process_time() - self.cpu_start
+        self.cpu = 100 * cpu / wall
+        if self.stats:
+            print('[stats] cpu %.1f%% over %.1f s, %d frames, %d idle' % (
+                self.cpu, wall, self.frames, self.idle_frames))
+            for report in self.reports:
+                print('[stats] %s' % report())
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+        self.frames = self.idle_frames = 0
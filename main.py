@@ -1,8 +1,52 @@
+import argparse
 import pygame
 import sys
+import time
+import sprites
 from sprites import *
 from config import *
 from backgrounds import *
+from assets import load_sound, reload_build, images
+from prefetch import Prefetcher
+from voice import audio_busy, playing_line, finish_lines, VOICE_END
+from buses import buses
+from text import text
+from renderer import RENDERERS
+from presenter import Presenter, FILTERS, WINDOWS
+from idle import IdleLoop
+from scheduler import Scheduler
+from wake import WakeGroup
+from hittest import HitGroup
+from collisions import Collisions
+from motion import Motion
+from script import SCRIPT
+
+
+def parse_options(args=None):
+    """
+    Return the command line options of the game
+    """
+    parser = argparse.ArgumentParser(description='Marvellous game')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the time spent on each round change')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='print the time to the first frame, broken down by phase')
+    parser.add_argument('--renderer', choices=sorted(RENDERERS), default=RENDERER,
+                        help='dirty: redraw only what changed, full: redraw the whole frame')
+    parser.add_argument('--window', choices=WINDOWS, default=WINDOW,
+                        help='fixed: %dx%d window, resizable or fullscreen: the game is scaled '
+                        'to the window' % (WIN_WIDTH, WIN_HEIGHT))
+    parser.add_argument('--filter', choices=sorted(FILTERS), default=SCALE_FILTER,
+                        help='filter used to scale the game to a resizable or fullscreen window')
+    parser.add_argument('--no-idle', dest='idle', action='store_false',
+                        help='draw every frame at FPS even when nothing changes')
+    parser.add_argument('--no-subtitles', dest='subtitles', action='store_false',
+                        help='do not show the captions of the voice lines')
+    parser.add_argument('--hud', action='store_true',
+                        help='show the frame rate and cpu usage on the screen')
+    parser.add_argument('--assets', default=ASSET_BUILD_DIR,
+                        help='folder written by build_assets.py --out')
+    return parser.parse_args(args)
 
 
 class Game:
@@ -12,24 +56,30 @@ class Game:
 
     Attributes
     ----------
-    screen: pygame display class
-        user's monitor
+    options: argparse Namespace
+        command line options
+    presenter: Presenter class
+        show the logical screen in the window
+    screen: pygame surface
+        logical screen the game draws on
     clock: pygame Clock class 
         game clock
-    font: pygame Font class 
-        game font
     running: bool
         True if game is running
     rounds: list
-        Ordered game rounds 
+        Ordered game rounds, the played rounds of the round script
+    script_node: tuple
+        (round id, event) of the round script at the end of the last step
+    script_errors: int
+        number of event changes which did not follow the round script
     skip_btn: None
         Make sure that there is no problem when skip button haven't been created yet
     in_game_music: pygame Sound class
         Theme music
     playing: bool
         True if main function is playing
-    all_sprites: pygame Sprite class
-        Group of game items, characters
+    all_sprites: WakeGroup class
+        Group of game items, characters, sleeping sprites are not updated
     next_round: int
         1 if player passed the round, other case is 0 
     win_round: int
@@ -46,12 +96,42 @@ class Game:
         1 if game ended, 0 if didn't
     current_round: string
         name of current round
+    round_id: int
+        id of current round in the round script
     active_item: pygame sprite class
-        item is clicked
+        item is clicked, the item dragged by the mouse, None if none is
     bg: Background class
         game background
+    renderer: DirtyRenderer or FullRenderer class
+        draw the frames on the screen
+    prefetcher: Prefetcher class
+        decode the assets of the next round while the current round is played
+    idle: IdleLoop class
+        wait for input instead of drawing identical frames
+    scheduler: Scheduler class
+        run delayed callbacks, e.g. script actions, on the main loop
+    event_count: int
+        number of events received in the current frame
+    last_state: tuple
+        round, round event, win flag and items flag of the last frame
+    lag: float
+        milliseconds of game time not simulated yet, less than one step after update
+    alpha: float
+        part of a step elapsed since the last step, moving sprites are drawn between two steps
+    transition_start: float
+        time when the round changed, None once the new round items were created
+    startup_steps: list
+        startup work left after the first frame, one step is run each frame
+    startup_phases: list
+        (phase, seconds) of the startup until the first frame is shown
+    startup_time: float
+        time when the last startup phase ended, None once the first frame is shown
     player_items: list
         list of draggable game items
+    targets: sprites which can be clicked or dragged, looked up by where they are
+        HitGroup
+    collisions: which watched pairs of sprites touch
+        Collisions
 
     Methods
     ------- 
@@ -61,38 +141,86 @@ class Game:
         init items of each new round
     events:
         check player input from keyboard or mouse
+    round_state:
+        return the round controlling attributes
+    motion_state:
+        return the number of moves and the player items positions
     pass_round:
         if player passed current round, change background and reset round attribute
     draw:
         draw sprites, background
     update:
-        update game events
+        run the simulation steps which are due and show the frame
+    step:
+        update game events for one fixed step
+    set_round:
+        change the current round
+    check_script:
+        count the event changes which do not follow the round script
     game_over:
         if player lost the game, kill all sprites and set background to game over screen
     game_end:
         if player won the game, kill all sprites and set background to end screen
+    startup_phase:
+        keep the time spent on a startup phase
+    run_startup_step:
+        run the next startup step left after the first frame
+    finish_startup:
+        run every startup step left
+    init_audio:
+        start the mixer and the theme music
+    prefetch_next:
+        decode the assets of the next round on the prefetcher thread
+    wait:
+        wait until the next frame, longer when the frame changed nothing
     main:
         call all function 
     """
 
-    def __init__(self):
+    def __init__(self, options=None):
         """"
         Initialize game resources
         """
-        pygame.init()
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font('font/Pixeltype.ttf')
+        self.options = options if options is not None else parse_options([])
+        self.startup_phases = []
+        self.startup_time = time.perf_counter()
+        if self.options.assets != ASSET_BUILD_DIR:
+            reload_build(self.options.assets)
+
+        # Only what the start screen needs is started before the first frame
+        pygame.display.init()
+        pygame.font.init()
+        self.startup_phase('pygame init')
+        self.presenter = Presenter(self.options.window, self.options.filter)
+        self.screen = self.presenter.screen
         pygame.display.set_caption('Marvellous')
+        self.startup_phase('window')
+        self.renderer = RENDERERS[self.options.renderer](self.presenter)
+        self.clock = pygame.time.Clock()
+        self.idle = IdleLoop(self.options.stats)
+        self.scheduler = Scheduler()
+        self.idle.reports.append(self.scheduler.report)
+        self.idle.reports.append(lambda: self.all_sprites.report())
+        self.idle.reports.append(lambda: self.targets.report())
+        self.idle.reports.append(lambda: self.collisions.report())
+        self.idle.reports.append(text.report)
+        self.idle.reports.append(images.report)
+        self.idle.reports.append(buses.report)
+        self.lag = 0.0
+        self.alpha = 1.0
+        self.event_count = 0
+        self.last_state = None
         self.running = True
-        self.rounds = ['start_screen', 'intro', 'round1_1', 'round1_2', 'round2',
-                       'round3', 'round4', 'round5', 'round6_1', 'round6_2', 'round7']
+        self.rounds = SCRIPT.played
+        self.script_node = None
+        self.script_errors = 0
+        for problem in SCRIPT.validate(vars(sprites)):
+            print('[script] %s' % problem)
         self.skip_btn = None
 
-        self.in_game_music = pygame.mixer.Sound(
-            'sound/music/in_game_music.wav')
-        self.in_game_music.play(loops=-1)
+        self.prefetcher = Prefetcher(self)
+        # Run one by one in the frames after the first frame
+        self.startup_steps = [self.init_audio, self.prefetch_next]
 
     def new(self):
         """"
@@ -100,7 +228,19 @@ class Game:
         """
         #  A new game start
         self.playing = True
-        self.all_sprites = pygame.sprite.LayeredUpdates()
+        self.collisions = Collisions()
+        self.all_sprites = WakeGroup({
+            'round': self.round_state,
+            'audio': audio_busy,
+            'motion': self.motion_state,
+            'contact': lambda: self.collisions.changes,
+            'sound': playing_line,
+        })
+        self.targets = HitGroup()
+        if self.options.subtitles:
+            self.subtitle = Subtitle(self)
+        if self.options.hud:
+            self.hud = Hud(self)
         self.next_round = 0  # Pass current round
         self.win_round = 0  # Player done all mission in current round
         self.game_over_flag = 0  # Player lost the game
@@ -108,154 +248,85 @@ class Game:
         self.round_index = 0
         self.round_event = 0
         self.end_game = 0
-        self.current_round = self.rounds[self.round_index]
+        self.set_round(self.rounds[self.round_index])
         self.active_item = None
 
-        self.bg = Background(self.current_round)
+        self.bg = Background(self.current_round, self.rounds)
+        self.scheduler.clear()
+        self.renderer.reset()
+        self.startup_phase('background')
+        self.transition_start = None
+        if not self.startup_steps:
+            self.prefetch_next()
 
         self.player_items = []
 
     def init_new_round(self):
         """"
-        Initialize each round items
+        Initialize each round items, the sprites of each event are listed in the round script
         """
         if self.items_created == 0:
-            # Start screen
-            if self.current_round == 'start_screen':
-                self.start_button = StartButton(self)
-                self.game_label = GameLabel(self)
-                self.items_created = 1
-
-            # Intro
-            if self.current_round == 'intro':
-                self.earth = Earth(self)
-                self.fairy = Fairy(self)
-                self.items_created = 1
-
-            # Round 1
-            if self.current_round == 'round1_1':
-                if self.round_event == 0:
-                    self.mouse = Mouse(self)
-                    self.arrow = Arrow(self)
-                    self.items_bar = ItemsBar(self)
-                    self.player = Player(self)
-                    self.items_created = 1
-
-                if self.round_event == 3:
-                    self.horn = Horn(self)
-                    self.first_aid_kit = FirstAidKit(self)
-                    self.saw = Saw(self)
-                    self.player_items.extend(
-                        [self.horn, self.first_aid_kit, self.saw])
-                    self.items_created = 1
-
-            # Round 2
-            if self.current_round == 'round2':
-                if self.round_event == 0:
-                    self.fairy = Fairy(self)
-                    self.items_created = 1
-                elif self.round_event == 1:
-                    self.rhino = Rhino(self)
-                    self.items_created = 1
-                elif self.round_event == 5:
-                    self.seed = Seed(self)
-                    self.player_items.append(self.seed)
-                    self.items_created = 1
-
-            # Round 3
-            if self.current_round == 'round3':
-                self.lion = Lion(self)
-                self.nail = Nail(self)
-                self.items_created = 1
-
-            # Round 4
-            if self.current_round == 'round4':
-                if self.round_event == 0:
-                    self.rabbit = Rabbit(self)
-                    self.items_created = 1
-                elif self.round_event == 1 and pygame.mixer.get_busy() == False:
-                    self.player = Player(self)
-                    self.items_created = 1
-                elif self.round_event == 2 and pygame.mixer.get_busy() == False:
-                    self.carrot = Carrot(self)
-                    self.player_items.append(self.carrot)
-                    self.items_created = 1
-
-            # Round 5
-            if self.current_round == 'round5':
-                if self.round_event == 0:
-                    self.cage = Cage(self)
-                    self.elephant = Elephant(self)
-                    self.items_created = 1
-
-            # Round 6
-            if self.current_round == 'round6_1':
-                if self.round_event == 0:
-                    self.flowerpot = Flowerpot(self)
-                    self.shovel = Shovel(self)
-                    self.watering_can = WateringCan(self)
-                    self.player_items.extend([self.shovel, self.watering_can])
-                    self.items_created = 1
-                elif self.round_event == 2:
-                    self.fairy = Fairy(self)
-                    self.items_created = 1
-            if self.current_round == 'round6_2':
-                if self.round_event == 0:
-                    self.items_created = 1
-                elif self.round_event == 1 and pygame.mixer.get_busy() == False:
-                    self.fairy = Fairy(self)
-                    self.items_created = 1
-
-            # Round 7
-            if self.current_round == 'round7':
-                if self.round_event == 0:
-                    self.man1 = Man1(self)
-                    self.man2 = Man2(self)
-                    self.speaker = Speaker(self)
-                    self.player_items.append(self.speaker)
-                    self.items_created = 1
-
-            # Game over
-            if self.current_round == 'game_over':
-                self.play_again_btn = PlayAgainButton(self)
-                self.items_created = 1
+            event = SCRIPT.spawn(self.round_id, self.round_event)
+            if event is None or (event.quiet and audio_busy()):
+                return
+            for attribute, name, player_item in event.spawn:
+                sprite = getattr(sprites, name)(self)
+                setattr(self, attribute, sprite)
+                if player_item:
+                    self.player_items.append(sprite)
+                    self.targets.add(sprite)
+            self.items_created = 1
 
     def events(self):
         """"
         Check for the events when mouse is clicked
         """
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Click start button
-                if self.start_button.rect.collidepoint(event.pos):
-                    self.start_button.is_clicked()
+        events = self.idle.events()
+        self.event_count = len(events)
+        for event in events:
+            event = self.presenter.logical_event(event)
+            if event.type == pygame.WINDOWSIZECHANGED:
+                self.presenter.resize()
 
-                # Click skip button
-                if self.skip_btn != None:
-                    if self.skip_btn.rect.collidepoint(event.pos):
-                        self.skip_btn.is_clicked()
+            if event.type == VOICE_END:
+                # A voice line ended, sprites waiting for quiet go on
+                finish_lines()
 
-                # Click play again button
-                if self.current_round == 'game_over' and self.play_again_btn.rect.collidepoint(event.pos):
-                    self.play_again_btn.is_clicked()
-
-                # Click player items
-                for num, item in enumerate(self.player_items):
-                    if item.rect.collidepoint(event.pos):
-                        self.active_item = num
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                # Click a button or pick up a player item, only the topmost sprite is hit
+                target = self.targets.hit(event.pos)
+                if hasattr(target, 'draggable'):
+                    self.active_item = target
+                elif target is not None:
+                    target.is_clicked()
 
             if event.type == pygame.MOUSEBUTTONUP:
                 self.active_item = None
 
             if event.type == pygame.MOUSEMOTION:
                 # Drag player items
-                if self.active_item != None and self.player_items[self.active_item].draggable:
-                    self.player_items[self.active_item].rect.move_ip(event.rel)
+                if self.active_item != None and self.active_item.draggable:
+                    self.active_item.rect.move_ip(event.rel)
+                    self.targets.place(self.active_item)
 
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+    def round_state(self):
+        """
+        Return the round controlling attributes, sleeping sprites wake up when they change
+        """
+        return (self.current_round, self.round_event, self.next_round, self.win_round,
+                self.items_created, self.game_over_flag, self.end_game)
+
+    def motion_state(self):
+        """
+        Return the number of moves and where the player items are, sleeping sprites wake up
+        to check their collisions when the characters move or an item is dragged
+        """
+        return (Motion.moves, tuple(item.rect.topleft for item in self.player_items))
+
     def pass_round(self):
         """"
         If received next_round = 1 then reset all round controlling attribute
@@ -263,10 +334,13 @@ class Game:
         """
         # Check if player pass through current round
         if self.next_round == 1:
+            self.transition_start = time.perf_counter()
+            # The next rounds need the mixer, the start screen may be left before the startup ended
+            self.finish_startup()
             self.round_index += 1
 
             # Change background
-            self.current_round = self.rounds[self.round_index]
+            self.set_round(self.rounds[self.round_index])
             self.bg.update(self.current_round)
 
             # Set all flag to origin
@@ -275,29 +349,85 @@ class Game:
             self.round_event = 0
             self.win_round = 0
 
+            # Decode the next round assets while this round is played
+            self.prefetch_next()
+
     def draw(self):
         """"
         Draw all sprites and background on screen
         """
-        self.bg.draw(self.screen, self.current_round)
-        self.all_sprites.draw(self.screen)
+        self.renderer.draw(self.screen, self.bg, self.current_round, self.all_sprites, self.alpha)
 
     def update(self):
         """"
-        Update all events of the game
+        Run the simulation steps which are due, so the game runs at STEP_RATE steps per
+        second whatever the frame rate is, then show the frame
+        """
+        self.lag += self.clock.get_time()
+        steps = 0
+        while self.lag >= STEP_TIME and steps < MAX_STEPS:
+            self.lag -= STEP_TIME
+            steps += 1
+            self.step()
+        if self.lag >= STEP_TIME:
+            # Too far behind, e.g. after a long idle wait: the rest is dropped
+            self.lag %= STEP_TIME
+        self.alpha = self.lag / STEP_TIME
+        self.renderer.present()
+
+    def step(self):
         """
+        Update all events of the game for one step
+        """
+        self.create_round_items()
+        for sprite in self.all_sprites:
+            if hasattr(sprite, 'motion'):
+                sprite.motion.begin_step()
+        self.scheduler.tick()
+        self.collisions.update()
         self.all_sprites.update()
+        self.targets.sync()
         self.pass_round()
         self.game_over()
         self.game_end()
-        pygame.display.update()
+        self.check_script()
+
+    def set_round(self, name):
+        """
+        Change the current round and its id in the round script
+        """
+        self.current_round = name
+        self.round_id = SCRIPT.ids[name]
+
+    def check_script(self):
+        """
+        Count the event changes which do not follow the round script
+        """
+        node = SCRIPT.node(self.round_id, self.round_event)
+        if self.script_node is not None and not SCRIPT.allows(self.script_node, node):
+            self.script_errors += 1
+            if self.options.stats:
+                print('[script] %s -> %s is not in the round script' % (
+                    SCRIPT.describe(self.script_node), SCRIPT.describe(node)))
+        self.script_node = node
+
+    def create_round_items(self):
+        """
+        Create the items of the current round and keep the time of a round change
+        """
+        self.init_new_round()
+        if self.transition_start is not None:
+            # Round change took the background update and the new round items creation
+            self.prefetcher.record_transition(
+                self.current_round, time.perf_counter() - self.transition_start)
+            self.transition_start = None
 
     def game_over(self):
         """"
         When received game_over_flag = 1 then set current round to game_over screen and kill all the sprites
         """
         if self.game_over_flag:
-            self.current_round = 'game_over'
+            self.set_round('game_over')
             self.bg.update(self.current_round)
             for sprite in self.all_sprites:
                 sprite.kill()
@@ -308,27 +438,100 @@ class Game:
         When received end_game = 1 then set current round to end_game screen and kill all the sprites
         """
         if self.end_game:
-            self.current_round = 'end_screen'
+            self.set_round('end_screen')
             self.bg.update(self.current_round)
             for sprite in self.all_sprites:
                 sprite.kill()
 
+    def startup_phase(self, name):
+        """
+        Keep the time spent on a startup phase, until the first frame is shown
+        """
+        if self.startup_time is None:
+            return
+        now = time.perf_counter()
+        self.startup_phases.append((name, now - self.startup_time))
+        self.startup_time = now
+
+        if name == 'first frame':
+            self.startup_time = None
+            if self.options.startup_report:
+                print('[startup] first frame after %.1f ms' %
+                      (sum(seconds for phase, seconds in self.startup_phases) * 1000))
+                for phase, seconds in self.startup_phases:
+                    print('[startup]   %-18s %7.1f ms' % (phase, seconds * 1000))
+
+    def run_startup_step(self):
+        """
+        Run the next startup step left after the first frame
+        """
+        if self.startup_steps:
+            start = time.perf_counter()
+            step = self.startup_steps.pop(0)
+            step()
+            if self.options.startup_report:
+                print('[startup] %s after the first frame: %.1f ms' %
+                      (step.__name__, (time.perf_counter() - start) * 1000))
+
+    def finish_startup(self):
+        """
+        Run every startup step left
+        """
+        while self.startup_steps:
+            self.run_startup_step()
+
+    def init_audio(self):
+        """
+        Start the mixer and the theme music, on the music bus so voice lines never stop it
+        """
+        pygame.mixer.init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS)
+        buses.start()
+        self.in_game_music = load_sound('sound/music/in_game_music.wav')
+        buses.music.play(self.in_game_music, loops=-1)
+
+    def prefetch_next(self):
+        """
+        Decode the assets of the round after the current round on the prefetcher thread
+        """
+        if self.round_index + 1 < len(self.rounds):
+            self.prefetcher.prefetch(self.rounds[self.round_index + 1])
+
+    def wait(self):
+        """
+        Wait until the next frame, longer when the frame changed nothing
+        """
+        state = (self.current_round, self.round_event, self.win_round, self.items_created)
+        changed = not self.options.idle or self.renderer.changed or self.event_count > 0 \
+            or state != self.last_state or self.startup_steps or self.prefetcher.pending()
+        self.last_state = state
+        timeout = IDLE_TIMEOUT
+        if self.scheduler.time_left() is not None:
+            # Wake up in time for the next timer
+            timeout = max(1, min(timeout, int(self.scheduler.time_left())))
+        self.idle.wait(self.clock, changed, timeout)
+
     def main(self):
         """
         Run all functions
         """
         while self.playing:
-            self.init_new_round()
+            self.create_round_items()
+            self.startup_phase('start screen items')
+            self.prefetcher.collect()
 
             self.events()
             self.draw()
             self.update()
-            self.clock.tick(FPS)
+            if self.startup_time is not None:
+                self.startup_phase('first frame')
+            else:
+                self.run_startup_step()
+            self.wait()
         self.running = False
 
 
 # ==============Main==============
-g = Game()
+g = Game(parse_options())
 g.new()
 while g.running:
     g.main()
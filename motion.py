@@ -0,0 +1,76 @@
+class Motion():
+    """
+    A class keep the float position of a moving sprite
+    , the sprite rect follows the rounded position so fractional speeds add up instead of
+    being cut off by the integer rect. The position before the last simulation step is kept
+    to draw the sprite between two steps
+    ...
+    Attributes:
+    -----------
+    sprite: the moving sprite
+        pygame sprite
+    x, y: top left corner of the sprite
+        float
+    last: top left corner before the last simulation step
+        tuple
+    moves: number of moves of all sprites, class attribute, tells sleeping sprites that
+        something moved
+        int
+
+    Methods:
+    --------
+    sync: follow the rect if it was moved without the motion
+    begin_step: keep the position before a simulation step
+    move: move the sprite by a float distance
+    position: return the drawn top left corner between the last two steps
+    """
+    moves = 0
+
+    def __init__(self, sprite):
+        """
+        Initialize motion at the sprite rect
+        """
+        self.sprite = sprite
+        self.x, self.y = map(float, sprite.rect.topleft)
+        self.last = (self.x, self.y)
+
+    def moved(self):
+        """
+        Return True if the rect was moved without the motion, e.g. placed at the start of a round
+        """
+        return self.sprite.rect.topleft != (round(self.x), round(self.y))
+
+    def sync(self):
+        """
+        Follow the rect if it was moved without the motion, the sprite is not drawn sliding there
+        """
+        if self.moved():
+            self.x, self.y = map(float, self.sprite.rect.topleft)
+            self.last = (self.x, self.y)
+            Motion.moves += 1
+
+    def begin_step(self):
+        """
+        Keep the position before a simulation step
+        """
+        self.sync()
+        self.last = (self.x, self.y)
+
+    def move(self, dx=0, dy=0):
+        """
+        Move the sprite by dx and dy pixels, fractions are kept for the next move
+        """
+        self.sync()
+        self.x += dx
+        self.y += dy
+        Motion.moves += 1
+        self.sprite.rect.topleft = (round(self.x), round(self.y))
+
+    def position(self, alpha):
+        """
+        Return the drawn top left corner, alpha is the part of a step elapsed since the last step
+        """
+        if self.moved():
+            return self.sprite.rect.topleft
+        return (round(self.last[0] + (self.x - self.last[0]) * alpha),
+                round(self.last[1] + (self.y - self.last[1]) * alpha))
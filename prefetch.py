@@ -0,0 +1,212 @@
+import queue
+import threading
+import time
+import pygame
+from config import *
+from assets import (images, image_source, decode_image, convert_image, scale_image,
+                    normalize_image, flatten_image, image_formats, baked_name, load_sound)
+from backgrounds import BACKGROUNDS, BACKGROUND_FILLS
+from voice import is_streamed
+from soundbank import sounds, sound_path, decoded_name
+from sprite_assets import round_assets
+from script import SCRIPT
+
+
+class Prefetcher():
+    """
+    A class decode the assets of the next round on a worker thread while the current round is played
+    , decoded assets are handed to the main thread which converts them and keeps them in the caches
+    ...
+    Attributes:
+    -----------
+    game: Game class in main file
+        class
+    jobs: jobs waiting for the worker, (generation, decode, finish)
+        Queue
+    results: decoded jobs waiting for the main thread, (generation, finish, result)
+        Queue
+    generation: number of the latest prefetch, results of older prefetches are dropped
+        int
+    worker: thread which runs the decode function of each job
+        Thread
+    prefetched: number of assets handed to the caches
+        int
+    transitions: time spent by the main thread on each round change, (round, milliseconds)
+        list
+    assets: images (path, scale, flip), sound names and dialogue lines of the sprites created
+        in each round, found in the sprite classes, None until they were scanned
+        dict
+
+    Methods:
+    --------
+    prefetch: decode the assets of a round on the worker thread
+    collect: hand decoded assets to the caches, called every frame by the main thread
+    pending: return True if decoded assets wait for the main thread
+    record_transition: keep the time spent on a round change
+    """
+
+    def __init__(self, game):
+        """
+        Initialize prefetcher and start its worker thread
+        """
+        self.game = game
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.generation = 0
+        self.prefetched = 0
+        self.transitions = []
+        self.assets = None
+        self.worker = threading.Thread(target=self.work, daemon=True)
+        self.worker.start()
+
+    def work(self):
+        """
+        Run the decode function of each job, on the worker thread
+        """
+        while True:
+            generation, decode, finish = self.jobs.get()
+            if generation != self.generation:
+                continue
+            try:
+                result = decode()
+            except (OSError, pygame.error):
+                # Missing asset: the sprite will report it when it loads the asset itself
+                continue
+            self.results.put((generation, finish, result))
+
+    def prefetch(self, round):
+        """
+        Decode the background, images and sounds of round on the worker thread
+        , assets which are already kept are skipped
+        """
+        self.generation += 1
+        generation = self.generation
+
+        if round in BACKGROUNDS and round not in self.game.bg.surfaces:
+            self.add_background(generation, round)
+
+        if self.assets is None:
+            # The sprite classes are scanned once, on the worker thread
+            def finish(assets):
+                self.assets = assets
+                self.add_assets(generation, round)
+            self.jobs.put((generation, lambda: round_assets(SCRIPT), finish))
+        else:
+            self.add_assets(generation, round)
+
+    def add_assets(self, generation, round):
+        """
+        Queue the images and sounds of the sprites created in round
+        """
+        assets = self.assets.get(round, {'images': [], 'sounds': []})
+        atlases = set()
+        for key in assets['images']:
+            if key in images.images:
+                continue
+            source, rect, baked = image_source(key[0], key[1])
+            if rect is not None:
+                if source not in images.atlases and source not in atlases:
+                    atlases.add(source)
+                    self.add_atlas(generation, source)
+            else:
+                self.add_image(generation, key)
+
+        for name in assets['sounds']:
+            # Long voice lines are streamed from disk when they are played
+            if name not in sounds.sounds and not is_streamed(sound_path(name)):
+                self.add_sound(generation, name)
+
+        for name in assets['dialogue']:
+            # A dialogue queues its lines on the voice channel, a streamed line is decoded
+            if is_streamed(sound_path(name)) and decoded_name(name) not in sounds.sounds:
+                self.add_sound(generation, name, decoded_name(name))
+
+    def add_background(self, generation, round):
+        """
+        Queue the background of round, scaled to the window size
+        """
+        path = BACKGROUNDS[round]
+
+        def decode():
+            source, rect, baked = image_source(path, size=(WIN_WIDTH, WIN_HEIGHT))
+            image = decode_image(source)
+            return image if baked else scale_image(image, size=(WIN_WIDTH, WIN_HEIGHT))
+
+        def finish(image):
+            if round in BACKGROUND_FILLS:
+                image = flatten_image(image, BACKGROUND_FILLS[round], path)
+            else:
+                image = convert_image(image, alpha=False)
+                image_formats[path] = 'opaque'
+            self.game.bg.keep(round, image)
+        self.jobs.put((generation, decode, finish))
+
+    def add_atlas(self, generation, path):
+        """
+        Queue an atlas image
+        """
+        def finish(image):
+            if path not in images.atlases:
+                images.atlases[path] = convert_image(image)
+        self.jobs.put((generation, lambda: decode_image(path), finish))
+
+    def add_image(self, generation, key):
+        """
+        Queue an image of the image cache, key is (path, scale, flip)
+        """
+        path, scale, flip = key
+
+        def decode():
+            source, rect, baked = image_source(path, scale)
+            image = decode_image(source)
+            if not baked:
+                image = scale_image(image, scale)
+            if flip:
+                image = pygame.transform.flip(image, True, False)
+            return image
+
+        def finish(image):
+            if key not in images.images:
+                name = baked_name(path, scale) if not flip else None
+                images.insert(key, normalize_image(image, name))
+        self.jobs.put((generation, decode, finish))
+
+    def add_sound(self, generation, name, key=None):
+        """
+        Queue a sound of the sound bank, kept under key if given instead of its name
+        """
+        def finish(sound):
+            sounds.insert(key or name, sound)
+        self.jobs.put((generation, lambda: load_sound(sound_path(name)), finish))
+
+    def collect(self, budget=PREFETCH_BUDGET):
+        """
+        Hand decoded assets to the caches until budget milliseconds are spent
+        , called by the main thread every frame
+        """
+        start = time.perf_counter()
+        while (time.perf_counter() - start) * 1000 < budget:
+            try:
+                generation, finish, result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if generation == self.generation:
+                finish(result)
+                self.prefetched += 1
+
+    def pending(self):
+        """
+        Return True if decoded assets wait for the main thread
+        """
+        return not self.results.empty()
+
+    def record_transition(self, round, seconds):
+        """
+        Keep the time the main thread spent on changing to round
+        """
+        self.transitions.append((round, seconds * 1000))
+        if self.game.options.stats:
+            print('[stats] %s: transition %.1f ms, %d assets prefetched so far' % (
+                round, seconds * 1000, self.prefetched))
+            print('[stats] audio: %s' % sounds.report())
+            print('[stats] %s' % images.report())
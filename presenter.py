@@ -0,0 +1,156 @@
+import math
+from fractions import Fraction
+import pygame
+from config import *
+
+# Scaling filters which can be selected with --filter
+FILTERS = {
+    'nearest': pygame.transform.scale,
+    'smooth': pygame.transform.smoothscale,
+}
+
+# Window modes which can be selected with --window
+WINDOWS = ('fixed', 'resizable', 'fullscreen')
+
+
+class Presenter():
+    """
+    A class show the logical WIN_WIDTH x WIN_HEIGHT screen in the window
+    , the game always draws at the logical size. In a resizable or fullscreen window the screen
+    is an offscreen surface scaled into the window, keeping its aspect ratio. The scaled area
+    is computed again only when the window size changes. With the nearest filter only the
+    updated rects are scaled: the screen is cut into blocks which the ratio scales to a whole
+    number of pixels, e.g. 4 pixels into 5 for a ratio of 1.25, and a rect rounded out to whole
+    blocks is scaled to the very pixels the whole screen would be scaled to. The smooth filter
+    samples from the screen edges, so the whole screen is scaled whenever a rect is updated
+    ...
+    Attributes:
+    -----------
+    mode: window mode, 'fixed', 'resizable' or 'fullscreen'
+        string
+    scale: scaling function of the selected filter
+        function
+    window: display surface
+        pygame surface
+    screen: logical surface the game draws on, the window itself in fixed mode
+        pygame surface
+    target: area of the window covered by the scaled screen
+        pygame rect
+    area: subsurface of the window over target
+        pygame surface
+    block: width and height of a block of the screen
+        tuple
+    scaled_block: width and height of a block scaled into the window
+        tuple
+    full: True if the whole screen has to be scaled next time
+        bool
+
+    Methods:
+    --------
+    resize: compute the scaled area again after the window size changed
+    block_rects: return a rect rounded out to whole blocks and the area it is scaled to
+    update: show the whole screen or some rects of it in the window
+    logical_event: return a mouse event with its position in screen coordinates
+    logical_pos: return a window position in screen coordinates
+    """
+
+    def __init__(self, mode='fixed', filter='nearest'):
+        """
+        Open the game window
+        """
+        self.mode = mode
+        self.scale = FILTERS[filter]
+        if mode == 'fullscreen':
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        elif mode == 'resizable':
+            self.window = pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT), pygame.RESIZABLE)
+        else:
+            self.window = pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
+
+        if mode == 'fixed':
+            self.screen = self.window
+        else:
+            self.screen = pygame.Surface((WIN_WIDTH, WIN_HEIGHT)).convert()
+        self.resize()
+
+    def resize(self):
+        """
+        Compute the scaled area again after the window size changed
+        """
+        self.window = pygame.display.get_surface()
+        width, height = self.window.get_size()
+        ratio = min(width / WIN_WIDTH, height / WIN_HEIGHT)
+        self.target = pygame.Rect(0, 0, round(WIN_WIDTH * ratio), round(WIN_HEIGHT * ratio))
+        self.target.center = (width // 2, height // 2)
+        self.area = self.window.subsurface(self.target)
+        ratios = (Fraction(self.target.width, WIN_WIDTH), Fraction(self.target.height, WIN_HEIGHT))
+        self.block = tuple(ratio.denominator for ratio in ratios)
+        self.scaled_block = tuple(ratio.numerator for ratio in ratios)
+        self.full = True
+        if self.screen is not self.window:
+            self.window.fill((0, 0, 0))
+
+    def block_rects(self, rect):
+        """
+        Return rect rounded out to whole blocks and the area of self.area it is scaled to
+        , the nearest filter picks the same screen pixels for this area as for the whole screen
+        """
+        width, height = self.block
+        scaled_width, scaled_height = self.scaled_block
+        left, top = rect.left // width, rect.top // height
+        right, bottom = -(-rect.right // width), -(-rect.bottom // height)
+        source = pygame.Rect(left * width, top * height,
+                             (right - left) * width, (bottom - top) * height)
+        dest = pygame.Rect(left * scaled_width, top * scaled_height,
+                           (right - left) * scaled_width, (bottom - top) * scaled_height)
+        return source, dest
+
+    def update(self, rects=None):
+        """
+        Show the whole screen, or only rects of it, in the window
+        """
+        if self.screen is self.window:
+            pygame.display.update(rects)
+            return
+
+        if self.full or rects is None:
+            self.scale(self.screen, self.target.size, self.area)
+            pygame.display.update()
+            self.full = False
+            return
+
+        if not rects:
+            return
+        if self.scale is not pygame.transform.scale:
+            self.scale(self.screen, self.target.size, self.area)
+            pygame.display.update(self.target)
+            return
+
+        updated = []
+        for rect in rects:
+            source, dest = self.block_rects(rect)
+            self.scale(self.screen.subsurface(source), dest.size, self.area.subsurface(dest))
+            updated.append(dest.move(self.target.topleft))
+        pygame.display.update(updated)
+
+    def logical_event(self, event):
+        """
+        Return a mouse event with its position and motion in screen coordinates
+        """
+        if self.screen is self.window or not hasattr(event, 'pos'):
+            return event
+        attributes = dict(event.dict)
+        attributes['pos'] = self.logical_pos(event.pos)
+        if 'rel' in attributes:
+            # Difference of the two mapped positions, so a drag does not drift from the mouse
+            x, y = event.pos
+            last = self.logical_pos((x - event.rel[0], y - event.rel[1]))
+            attributes['rel'] = (attributes['pos'][0] - last[0], attributes['pos'][1] - last[1])
+        return pygame.event.Event(event.type, attributes)
+
+    def logical_pos(self, pos):
+        """
+        Return a window position in screen coordinates
+        """
+        return (math.floor((pos[0] - self.target.x) * WIN_WIDTH / self.target.width),
+                math.floor((pos[1] - self.target.y) * WIN_HEIGHT / self.target.height))
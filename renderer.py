@@ -0,0 +1,264 @@
+import pygame
+from config import *
+
+
+def drawn_area(sprite, alpha=1.0):
+    """
+    Return the screen area covered by a sprite, its image may be larger than its rect
+    . A moving sprite is drawn between its last two positions, alpha is the part of
+    a simulation step elapsed since the last step
+    """
+    if hasattr(sprite, 'motion'):
+        return pygame.Rect(sprite.motion.position(alpha), sprite.image.get_size())
+    return pygame.Rect(sprite.rect.topleft, sprite.image.get_size())
+
+
+class StaticLayer():
+    """
+    A class merge the round background and the static sprites into one cached surface
+    , a static sprite is merged only if no sprite drawn before it and left out of the layer
+    covers it, so the frame looks the same as when every sprite is drawn in order.
+    The layer is built again only when the merged sprites change
+    ...
+    Attributes:
+    -----------
+    surface: background and merged static sprites
+        pygame surface
+    sprites: merged static sprites in draw order
+        list
+    background: background merged into the layer
+        pygame image
+    round: round of the merged background
+        string
+    builds: number of times the layer was built
+        int
+
+    Methods:
+    --------
+    update: build the layer again if the background or the merged sprites changed
+    draw: draw the layer on the screen
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty static layer
+        """
+        self.surface = None
+        self.sprites = []
+        self.background = None
+        self.round = None
+        self.builds = 0
+
+    def merged_sprites(self, sprites):
+        """
+        Return the static sprites which can be merged into the layer
+        """
+        merged = []
+        covering = []
+        for sprite in sprites.sprites():
+            area = drawn_area(sprite)
+            if getattr(sprite, 'static', False) and area.collidelist(covering) == -1:
+                merged.append(sprite)
+            else:
+                covering.append(area)
+        return merged
+
+    def update(self, bg, round, sprites):
+        """
+        Build the layer again if the background or the merged sprites changed
+
+            Return:
+                True if the layer was built again
+        """
+        merged = self.merged_sprites(sprites)
+        if self.surface is not None and merged == self.sprites \
+                and bg.background is self.background and round == self.round:
+            return False
+
+        if self.surface is None:
+            self.surface = pygame.Surface((WIN_WIDTH, WIN_HEIGHT)).convert()
+        bg.draw(self.surface, round)
+        for sprite in merged:
+            self.surface.blit(sprite.image, sprite.rect)
+        self.sprites = merged
+        self.background = bg.background
+        self.round = round
+        self.builds += 1
+        return True
+
+    def draw(self, screen):
+        """
+        Draw the layer on the screen
+        """
+        screen.blit(self.surface, (0, 0))
+
+
+class FullRenderer():
+    """
+    A class redraw the whole frame: the static layer, the other sprites,
+    then the whole display is updated
+    ...
+    Attributes:
+    -----------
+    presenter: show the screen in the window
+        Presenter
+    layer: round background and static sprites
+        StaticLayer
+    changed: always True, every frame is drawn again
+        bool
+
+    Methods:
+    --------
+    draw: draw the static layer and the other sprites on the screen
+    present: show the drawn frame
+    reset: forget what was drawn before, e.g. when a new game starts
+    """
+
+    def __init__(self, presenter):
+        """
+        Initialize renderer
+        """
+        self.presenter = presenter
+        self.layer = StaticLayer()
+        self.changed = True
+
+    def draw(self, screen, bg, round, sprites, alpha=1.0):
+        """
+        Draw the static layer and every sprite which is not in it
+        """
+        self.layer.update(bg, round, sprites)
+        self.layer.draw(screen)
+        merged = set(self.layer.sprites)
+        for sprite in sprites.sprites():
+            if sprite not in merged:
+                screen.blit(sprite.image, drawn_area(sprite, alpha))
+
+    def present(self):
+        """
+        Show the whole drawn frame
+        """
+        self.presenter.update()
+
+    def reset(self):
+        """
+        Nothing is kept between frames
+        """
+
+
+class DirtyRenderer():
+    """
+    A class redraw only the parts of the frame which changed
+    , a sprite is dirty when it was added, killed, moved or changed its image since the last frame.
+    The background under the old and new rects of dirty sprites is repainted, the sprites over
+    those rects are drawn again and only those rects are shown in the window
+    ...
+    Attributes:
+    -----------
+    presenter: show the screen in the window
+        Presenter
+    layer: round background and static sprites, the whole frame is redrawn when it changes
+        StaticLayer
+    drawn: image and drawn area of each sprite out of the static layer when it was drawn last
+        dict
+    rects: rects to update on the display
+        list
+    full: True if the whole display has to be updated
+        bool
+    changed: True if the last shown frame was different from the one before
+        bool
+
+    Methods:
+    --------
+    draw: repaint the dirty parts of the screen
+    present: show the repainted rects
+    reset: redraw the whole frame next time, e.g. when a new game starts
+    """
+
+    def __init__(self, presenter):
+        """
+        Initialize renderer, the first frame is fully drawn
+        """
+        self.presenter = presenter
+        self.layer = StaticLayer()
+        self.drawn = {}
+        self.rects = []
+        self.full = True
+        self.changed = True
+
+    def dirty_rects(self, sprites, alpha=1.0):
+        """
+        Return the old and new rects of the sprites which changed since the last frame
+        """
+        rects = []
+        alive = set()
+        for sprite in sprites:
+            alive.add(sprite)
+            last = self.drawn.get(sprite)
+            area = drawn_area(sprite, alpha)
+            if last is None or last[0] is not sprite.image or last[1] != area:
+                if last is not None:
+                    rects.append(last[1])
+                rects.append(area)
+                self.drawn[sprite] = (sprite.image, area)
+        for sprite in list(self.drawn):
+            if sprite not in alive:
+                rects.append(self.drawn.pop(sprite)[1])
+        return rects
+
+    def draw(self, screen, bg, round, sprites, alpha=1.0):
+        """
+        Repaint the background and the sprites under the rects which changed
+        """
+        if self.layer.update(bg, round, sprites):
+            self.full = True
+        merged = set(self.layer.sprites)
+        ordered = [sprite for sprite in sprites.sprites() if sprite not in merged]
+
+        if self.full:
+            self.drawn.clear()
+            self.dirty_rects(ordered, alpha)
+            self.layer.draw(screen)
+            for sprite in ordered:
+                screen.blit(sprite.image, self.drawn[sprite][1])
+            return
+
+        screen_rect = screen.get_rect()
+        self.rects = [rect.clip(screen_rect) for rect in self.dirty_rects(ordered, alpha)]
+        self.rects = [rect for rect in self.rects if rect.width and rect.height]
+        if len(self.rects) > DIRTY_RECTS_MAX:
+            # Many small rects cost more than one larger rect
+            self.rects = [self.rects[0].unionall(self.rects[1:])]
+
+        areas = [(sprite, self.drawn[sprite][1]) for sprite in ordered]
+        for rect in self.rects:
+            screen.set_clip(rect)
+            self.layer.draw(screen)
+            for sprite, area in areas:
+                if area.colliderect(rect):
+                    screen.blit(sprite.image, area)
+        screen.set_clip(None)
+
+    def present(self):
+        """
+        Show the repainted rects, or the whole frame after a full redraw
+        """
+        self.changed = self.full or bool(self.rects)
+        if self.full:
+            self.presenter.update()
+            self.full = False
+        else:
+            self.presenter.update(self.rects)
+        self.rects = []
+
+    def reset(self):
+        """
+        Redraw the whole frame next time
+        """
+        self.full = True
+
+
+# Renderers which can be selected with --renderer
+RENDERERS = {
+    'dirty': DirtyRenderer,
+    'full': FullRenderer,
+}
@@ -0,0 +1,132 @@
+import heapq
+import math
+from config import *
+
+
+class Timer():
+    """
+    A class keep one callback waiting in the scheduler
+    ...
+    Attributes:
+    -----------
+    step: simulation step when the callback runs
+        int
+    callback: function called without argument
+        function
+    owner: sprite the timer belongs to, the callback is dropped once it is killed
+        pygame sprite
+    cancelled: True if the callback must not run any more
+        bool
+    """
+
+    def __init__(self, step, callback, owner=None):
+        """
+        Initialize timer
+        """
+        self.step = step
+        self.callback = callback
+        self.owner = owner
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Do not run the callback
+        """
+        self.cancelled = True
+
+
+class Scheduler():
+    """
+    A class run callbacks after a delay on the main loop
+    , timers are kept in a heap ordered by the simulation step they are due, so they follow
+    the game time and run in the main thread between two sprite updates. Timers due on the
+    same step run in the order they were added
+    ...
+    Attributes:
+    -----------
+    now: number of simulation steps since the scheduler started
+        int
+    timers: waiting timers, (step, order, timer)
+        list
+    order: number of timers added, keeps the order of timers due on the same step
+        int
+    fired: number of callbacks which ran
+        int
+    cancelled: number of timers dropped before they ran
+        int
+
+    Methods:
+    --------
+    after: run a callback after a delay in milliseconds
+    after_steps: run a callback after a number of simulation steps
+    tick: advance one simulation step and run the due callbacks
+    time_left: return the milliseconds until the next timer is due
+    clear: drop every waiting timer, e.g. when a new game starts
+    report: return the live timer counts as text
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty scheduler
+        """
+        self.now = 0
+        self.timers = []
+        self.order = 0
+        self.fired = 0
+        self.cancelled = 0
+
+    def after(self, delay, callback, owner=None):
+        """
+        Run callback after delay milliseconds of game time
+
+            Return:
+                the Timer, which can be cancelled
+        """
+        return self.after_steps(math.ceil(delay / STEP_TIME), callback, owner)
+
+    def after_steps(self, steps, callback, owner=None):
+        """
+        Run callback after a number of simulation steps
+
+            Return:
+                the Timer, which can be cancelled
+        """
+        timer = Timer(self.now + max(steps, 1), callback, owner)
+        heapq.heappush(self.timers, (timer.step, self.order, timer))
+        self.order += 1
+        return timer
+
+    def tick(self):
+        """
+        Advance one simulation step and run the callbacks which are due
+        """
+        self.now += 1
+        while self.timers and self.timers[0][0] <= self.now:
+            timer = heapq.heappop(self.timers)[2]
+            if timer.cancelled or (timer.owner is not None and not timer.owner.alive()):
+                self.cancelled += 1
+                continue
+            self.fired += 1
+            timer.callback()
+
+    def time_left(self):
+        """
+        Return the milliseconds of game time until the next timer is due, None without timers
+        """
+        if not self.timers:
+            return None
+        return (self.timers[0][0] - self.now) * STEP_TIME
+
+    def clear(self):
+        """
+        Drop every waiting timer
+        """
+        self.cancelled += len(self.timers)
+        self.timers = []
+
+    def report(self):
+        """
+        Return the live timer counts as text
+        """
+        live = sum(1 for timer in self.timers if not timer[2].cancelled)
+        return '%d timers waiting, %d fired, %d cancelled' % (live, self.fired, self.cancelled)
@@ -0,0 +1,317 @@
+import sys
+from collections import namedtuple
+
+# A round of the story: its events keyed by event number, played rounds are passed one
+# after the other, the game stays in a final round
+Round = namedtuple('Round', 'name events played final', defaults=(True, False))
+
+# An event of a round:
+#     spawn: sprites created once the items of the event are asked for, as (game attribute,
+#         sprite class name, True for a player item), None if the event creates nothing
+#     quiet: True to wait until no sound plays before creating them
+#     next: events which may follow, or 'next' for the next round, 'game_over' when an
+#         animal is killed, 'end' for the end screen and 'new' for a new game
+Event = namedtuple('Event', 'spawn quiet next', defaults=(None, False, ()))
+
+# Event key of the sprites created at any event of a round, a round without numbered events
+# is one event whatever its event number is, e.g. game over keeps the event of the lost round
+ANY = -1
+
+ROUND_SCRIPT = [
+    Round('start_screen', {
+        0: Event([('start_button', 'StartButton', False), ('game_label', 'GameLabel', False)],
+                 next=['next']),
+    }),
+    Round('intro', {
+        0: Event([('earth', 'Earth', False), ('fairy', 'Fairy', False)], next=[1, 'next']),
+        1: Event(next=['next']),
+    }),
+    Round('round1_1', {
+        0: Event([('mouse', 'Mouse', False), ('arrow', 'Arrow', False),
+                  ('items_bar', 'ItemsBar', False), ('player', 'Player', False)], next=[1]),
+        1: Event(next=[2]),
+        2: Event(next=[3]),
+        3: Event([('horn', 'Horn', True), ('first_aid_kit', 'FirstAidKit', True),
+                  ('saw', 'Saw', True)], next=['next']),
+    }),
+    Round('round1_2', {
+        0: Event(next=[1]),
+        1: Event(next=['next']),
+    }),
+    Round('round2', {
+        0: Event([('fairy', 'Fairy', False)], next=[1]),
+        1: Event([('rhino', 'Rhino', False)], next=[2]),
+        2: Event(next=[3, 'game_over']),
+        3: Event(next=[4]),
+        4: Event(next=[5]),
+        5: Event([('seed', 'Seed', True)], next=['next']),
+    }),
+    Round('round3', {
+        ANY: Event([('lion', 'Lion', False), ('nail', 'Nail', False)]),
+        0: Event(next=[1]),
+        1: Event(next=[2]),
+        2: Event(next=[3]),
+        3: Event(next=[4, 'game_over']),
+        4: Event(next=[5]),
+        5: Event(next=[6]),
+        6: Event(next=[7]),
+        7: Event(next=[8]),
+        8: Event(next=['next']),
+    }),
+    Round('round4', {
+        0: Event([('rabbit', 'Rabbit', False)], next=[1]),
+        1: Event([('player', 'Player', False)], quiet=True, next=[2]),
+        2: Event([('carrot', 'Carrot', True)], quiet=True, next=[3, 'game_over']),
+        3: Event(next=[4]),
+        4: Event(next=[5]),
+        5: Event(next=[6]),
+        6: Event(next=[7]),
+        7: Event(next=[8]),
+        8: Event(next=['next']),
+    }),
+    Round('round5', {
+        0: Event([('cage', 'Cage', False), ('elephant', 'Elephant', False)], next=[1]),
+        1: Event(next=[2]),
+        2: Event(next=[3]),
+        3: Event(next=[4]),
+        4: Event(next=[5]),
+        5: Event(next=[6]),
+        6: Event(next=[7]),
+        7: Event(next=['next']),
+    }),
+    Round('round6_1', {
+        0: Event([('flowerpot', 'Flowerpot', False), ('shovel', 'Shovel', True),
+                  ('watering_can', 'WateringCan', True)], next=[1]),
+        1: Event(next=[2]),
+        2: Event([('fairy', 'Fairy', False)], next=[3]),
+        3: Event(next=['next']),
+    }),
+    Round('round6_2', {
+        0: Event([], next=[1]),
+        1: Event([('fairy', 'Fairy', False)], quiet=True, next=[2]),
+        2: Event(next=[3]),
+        3: Event(next=[6]),
+        6: Event(next=['next']),
+    }),
+    Round('round7', {
+        0: Event([('man1', 'Man1', False), ('man2', 'Man2', False),
+                  ('speaker', 'Speaker', True)], next=[1]),
+        1: Event(next=[2]),
+        2: Event(next=[3]),
+        3: Event(next=[4]),
+        4: Event(next=['end']),
+    }),
+    Round('game_over', {
+        ANY: Event([('play_again_btn', 'PlayAgainButton', False)], next=['new']),
+    }, played=False),
+    Round('end_screen', {
+        ANY: Event(),
+    }, played=False, final=True),
+]
+
+
+class RoundScript():
+    """
+    A class compile the round script once into tables indexed by integer ids
+    , a round is found by its id and an event by its number, so the game does not compare
+    round names every frame. Each (round, event) knows every (round, event) reachable from it,
+    to check the story only moves along the script
+    ...
+    Attributes:
+    -----------
+    rounds: round names by id
+        list
+    ids: round id keyed by round name
+        dict
+    played: names of the played rounds in order
+        list
+    spawns: sprites created at each event of each round, spawns[round id][event], None for
+        no sprites, the last item holds the sprites created at any event
+        list
+    edges: (round id, event) pairs which may follow each (round id, event)
+        dict
+    reach: (round id, event) pairs reachable from each (round id, event)
+        dict
+    script: compiled round script
+        list
+
+    Methods:
+    --------
+    node: return the (round id, event) of the script the game is at
+    spawn: return the Event which creates the sprites of an event of a round
+    allows: return True if the story may move from one event to another
+    validate: return the problems of the script
+    describe: return a (round id, event) as text
+    round_table: return a list of handlers indexed by round id
+    event_table: return a dict of values keyed by (round id, event)
+    lookup: return the value of an event from an event table
+    """
+
+    def __init__(self, script):
+        """
+        Compile script
+        """
+        self.script = script
+        self.rounds = [round.name for round in script]
+        self.ids = {name: id for id, name in enumerate(self.rounds)}
+        self.played = [round.name for round in script if round.played]
+
+        self.spawns = []
+        for round in script:
+            last = max(round.events) if round.events else 0
+            table = [None] * (last + 2)
+            for event, spec in round.events.items():
+                if spec.spawn is not None:
+                    # ANY is the last item
+                    table[event] = spec
+            self.spawns.append(table)
+
+        self.edges = {}
+        for id, round in enumerate(script):
+            for event in self.events(id):
+                steps = round.events[event].next
+                self.edges[(id, event)] = [self.target(id, step) for step in steps]
+        self.reach = {node: self.reachable(node) for node in self.edges}
+
+    def events(self, id):
+        """
+        Return the events of round id, [ANY] for a round without numbered events
+        """
+        events = sorted(event for event in self.script[id].events if event != ANY)
+        return events or [ANY]
+
+    def node(self, id, event):
+        """
+        Return the (round id, event) of the script the game is at
+        """
+        if event in self.script[id].events and event != ANY:
+            return (id, event)
+        return (id, ANY)
+
+    def target(self, id, step):
+        """
+        Return the (round id, event) a step of the script leads to, None if it leads nowhere
+        """
+        if isinstance(step, int):
+            return (id, step)
+        name = None
+        if step == 'next':
+            index = self.played.index(self.rounds[id]) + 1 if self.rounds[id] in self.played else 0
+            name = self.played[index] if 0 < index < len(self.played) else None
+        elif step == 'game_over':
+            name = 'game_over'
+        elif step == 'end':
+            name = 'end_screen'
+        elif step == 'new':
+            name = self.played[0]
+        if name not in self.ids:
+            return None
+        return self.node(self.ids[name], 0)
+
+    def reachable(self, node):
+        """
+        Return every (round id, event) reachable from node
+        """
+        seen = set()
+        stack = [node]
+        while stack:
+            for following in self.edges.get(stack.pop(), []):
+                if following is not None and following not in seen:
+                    seen.add(following)
+                    stack.append(following)
+        return seen
+
+    def spawn(self, id, event):
+        """
+        Return the Event which creates sprites at event of round id, None if it creates none
+        """
+        table = self.spawns[id]
+        if 0 <= event < len(table) - 1 and table[event] is not None:
+            return table[event]
+        return table[-1]
+
+    def allows(self, start, end):
+        """
+        Return True if the story may move from the (round id, event) start to end
+        """
+        return start == end or end in self.reach.get(start, ())
+
+    def validate(self, classes=None):
+        """
+        Return the problems of the script: unknown steps and sprite classes, events which
+        can not be reached from the start and events which lead nowhere
+
+            Parameter:
+                classes (dict): sprite classes keyed by name, None to skip checking them
+        """
+        problems = []
+        for id, round in enumerate(self.script):
+            for event, spec in sorted(round.events.items()):
+                for attribute, name, item in spec.spawn or []:
+                    if classes is not None and name not in classes:
+                        problems.append('%s: unknown sprite class %s'
+                                        % (self.describe((id, event)), name))
+                if event not in self.events(id):
+                    continue
+                for step in spec.next:
+                    following = self.target(id, step)
+                    if following is None or following[1] not in self.script[following[0]].events:
+                        problems.append('%s: %r leads nowhere' % (self.describe((id, event)), step))
+                if not spec.next and not round.final:
+                    problems.append('%s: dead end' % self.describe((id, event)))
+
+        start = self.node(self.ids[self.played[0]], 0)
+        reached = self.reach[start] | {start}
+        for node in sorted(self.edges):
+            if node not in reached:
+                problems.append('%s: unreachable' % self.describe(node))
+        return problems
+
+    def describe(self, node):
+        """
+        Return a (round id, event) as text
+        """
+        id, event = node
+        return '%s event %s' % (self.rounds[id], 'any' if event == ANY else event)
+
+    def round_table(self, handlers):
+        """
+        Return a list of handlers indexed by round id, None for the rounds without one
+
+            Parameter:
+                handlers (dict): handler keyed by round name
+        """
+        table = [None] * len(self.rounds)
+        for name, handler in handlers.items():
+            table[self.ids[name]] = handler
+        return table
+
+    def event_table(self, values):
+        """
+        Return a dict of values keyed by (round id, event)
+
+            Parameter:
+                values (dict): value keyed by (round name, event), event ANY for any event
+        """
+        return {(self.ids[name], event): value for (name, event), value in values.items()}
+
+    def lookup(self, table, id, event):
+        """
+        Return the value of event of round id from an event table, None if it has none
+        """
+        value = table.get((id, event))
+        if value is None:
+            value = table.get((id, ANY))
+        return value
+
+
+# Round script compiled when the game starts
+SCRIPT = RoundScript(ROUND_SCRIPT)
+
+if __name__ == '__main__':
+    import sprites
+    problems = SCRIPT.validate(vars(sprites))
+    for problem in problems:
+        print(problem)
+    print('%d rounds, %d events, %d problems' % (len(SCRIPT.rounds), len(SCRIPT.edges), len(problems)))
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,182 @@
+import pygame
+from collections import OrderedDict
+from config import *
+from voice import load_voice, play_line, play_dialogue, VoiceLine
+from assets import load_sound
+from buses import buses
+
+
+def sound_path(name):
+    """
+    Return the wav file of a sound name, e.g. 'fairy/intro' is sound/fairy/intro.wav
+    """
+    return 'sound/%s.wav' % name
+
+
+def decoded_name(name):
+    """
+    Return the name the decoded samples of a streamed voice line are kept under in the bank
+    , e.g. 'fairy/intro (decoded)'
+    """
+    return '%s (decoded)' % name
+
+
+def sound_size(sound):
+    """
+    Return the memory used by the samples of a sound in byte, streamed voice lines use none
+    """
+    if isinstance(sound, VoiceLine):
+        return 0
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+
+class SoundBank():
+    """
+    A class keep the sounds of the game, sprites ask for a sound by its name
+    , a sound is loaded the first time it is played and shared by every sprite.
+    The least recently played sounds are dropped when the bank is over its memory budget.
+    A streamed voice line played in a dialogue is decoded, its samples are kept under
+    decoded_name and count against the budget like any other sound
+    ...
+    Attributes:
+    -----------
+    budget: memory budget of the kept sounds in byte
+        int
+    sounds: kept sounds keyed by name, least recently played first
+        OrderedDict
+    sizes: memory used by each kept sound in byte
+        dict
+    resident: memory used by all kept sounds in byte
+        int
+    loads: number of sounds read from disk or from the asset pack
+        int
+    evictions: number of sounds dropped from the bank
+        int
+    last: name of the last played sound, e.g. to show its subtitle
+        string
+    plays: number of sounds played
+        int
+
+    Methods:
+    --------
+    load: return the sound of a name, load it if it is not kept yet
+    play: play the sound of a name on a mixer bus
+    play_dialogue: play the lines of a conversation without a gap between them
+    decode: return the decoded sound of a name, also for a streamed voice line
+    insert: keep a sound loaded somewhere else, e.g. by the prefetcher
+    evict: drop the least recently played sounds until the bank fits its budget
+    report: return the resident audio memory as text
+    """
+
+    def __init__(self, budget_mb=32):
+        """
+        Initialize an empty sound bank
+        """
+        self.budget = int(budget_mb * 2**20)
+        self.sounds = OrderedDict()
+        self.sizes = {}
+        self.resident = 0
+        self.loads = 0
+        self.evictions = 0
+        self.last = None
+        self.plays = 0
+
+    def load(self, name):
+        """
+        Return the sound of name, e.g. 'fairy/intro'
+        """
+        if name in self.sounds:
+            self.sounds.move_to_end(name)
+            return self.sounds[name]
+        self.loads += 1
+        sound = load_voice(sound_path(name))
+        self.insert(name, sound)
+        return sound
+
+    def play(self, name, loops=0, bus='voice'):
+        """
+        Play the sound of name as a voice line, or on the bus of its name, e.g. 'sfx'
+
+            Return:
+                the channel the sound plays on for the other buses, None for a voice line
+                , audio_busy tells when voice lines ended
+        """
+        sound = self.load(name)
+        self.last = name
+        self.plays += 1
+        if bus == 'voice':
+            play_line(name, sound, loops)
+            return None
+        return buses.bus(bus).play(sound, loops)
+
+    def play_dialogue(self, conversation):
+        """
+        Play the lines of a conversation one after the other without a gap between them
+
+            Parameter:
+                conversation (list): (sound name, callback) of each line in order, the callback
+                    is called when its line starts, None for no callback
+
+            Return:
+                the Dialogue which plays
+        """
+        lines = [(name, self.decode(name), callback) for name, callback in conversation]
+        self.last = lines[-1][0]
+        self.plays += len(lines)
+        return play_dialogue(lines)
+
+    def decode(self, name):
+        """
+        Return the decoded sound of name, a streamed voice line is decoded unless the
+        prefetcher already did and kept under decoded_name
+        """
+        sound = self.load(name)
+        if not isinstance(sound, VoiceLine):
+            return sound
+        decoded = decoded_name(name)
+        if decoded in self.sounds:
+            self.sounds.move_to_end(decoded)
+            return self.sounds[decoded]
+        self.loads += 1
+        sound = load_sound(sound.path)
+        self.insert(decoded, sound)
+        return sound
+
+    def insert(self, name, sound):
+        """
+        Keep sound under name
+        """
+        if name in self.sounds:
+            return
+        self.sounds[name] = sound
+        self.sizes[name] = sound_size(sound)
+        self.resident += self.sizes[name]
+        self.evict()
+
+    def evict(self):
+        """
+        Drop the least recently played sounds until the bank fits its budget
+        , a sound which is playing is kept
+        """
+        for name in list(self.sounds):
+            if self.resident <= self.budget:
+                return
+            sound = self.sounds[name]
+            if isinstance(sound, pygame.mixer.Sound) and sound.get_num_channels() > 0:
+                continue
+            del self.sounds[name]
+            self.resident -= self.sizes.pop(name)
+            self.evictions += 1
+
+    def report(self):
+        """
+        Return the resident audio memory as text
+        """
+        return '%d sounds, %.1f of %.1f MB resident, %d loads, %d evictions' % (
+            len(self.sounds), self.resident / 2**20, self.budget / 2**20,
+            self.loads, self.evictions)
+
+
+# Sound bank shared by all sprites of the game
+sounds = SoundBank(SOUND_BANK_MB)
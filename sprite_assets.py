@@ -0,0 +1,121 @@
+import ast
+import os
+from soundbank import sound_path
+
+
+def literal(node):
+    """
+    Return the value of a literal in the source, None if it is not a literal
+    """
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def image_keys(call):
+    """
+    Return the (path, scale, flip) of the images an images.load or Animation.from_files call
+    loads, empty for any other call or when its arguments are not literals
+    """
+    if not isinstance(call.func, ast.Attribute) or not isinstance(call.func.value, ast.Name) \
+            or not call.args:
+        return []
+    kind = (call.func.value.id, call.func.attr)
+    if kind not in (('images', 'load'), ('Animation', 'from_files')):
+        return []
+
+    paths = literal(call.args[0])
+    scale = literal(call.args[1]) if len(call.args) > 1 else None
+    flip = False
+    for keyword in call.keywords:
+        if keyword.arg == 'scale':
+            scale = literal(keyword.value)
+        elif keyword.arg == 'flip':
+            flip = literal(keyword.value)
+    if paths is None:
+        return []
+    if kind == ('images', 'load'):
+        return [(paths, scale, bool(flip))]
+    # Animation.from_files keeps the frames of both directions
+    return [(path, scale, flip) for flip in (False, True) for path in paths]
+
+
+def class_assets(source='sprites.py'):
+    """
+    Return the images and sounds each sprite class loads, keyed by class name. The source
+    is read without being imported:
+        images: (path, scale, flip) of its images.load and Animation.from_files calls
+        sounds: its strings which name a sound file, e.g. 'fairy/intro'
+        dialogue: its sounds played through play_dialogue, a dialogue decodes its lines
+        uses: the other sprite classes it creates, e.g. the fairy creates the skip button
+
+        Parameter:
+            source (string): python file of the sprite classes
+    """
+    with open(source) as file:
+        tree = ast.parse(file.read(), source)
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    names = {node.name for node in classes}
+
+    assets = {}
+    for node in classes:
+        found = {'images': set(), 'sounds': set(), 'dialogue': set(), 'uses': set()}
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                found['images'].update(image_keys(child))
+                if isinstance(child.func, ast.Attribute) and child.func.attr == 'play_dialogue':
+                    found['dialogue'].update(
+                        line.value for argument in child.args for line in ast.walk(argument)
+                        if isinstance(line, ast.Constant) and isinstance(line.value, str))
+                if isinstance(child.func, ast.Name) and child.func.id in names \
+                        and child.func.id != node.name:
+                    found['uses'].add(child.func.id)
+            elif isinstance(child, ast.Constant) and isinstance(child.value, str) \
+                    and '/' in child.value and os.path.isfile(sound_path(child.value)):
+                found['sounds'].add(child.value)
+        found['dialogue'] &= found['sounds']
+        assets[node.name] = found
+    return assets
+
+
+def sprite_scales(source='sprites.py'):
+    """
+    Return every (path, scale) pair which the sprite classes load through
+    images.load or Animation.from_files
+
+        Parameter:
+            source (string): python file of the sprite classes
+    """
+    scales = {(path, scale) for found in class_assets(source).values()
+              for path, scale, flip in found['images']}
+    return sorted(scales, key=lambda item: (item[0], str(item[1])))
+
+
+def round_assets(script, source='sprites.py'):
+    """
+    Return the images and sounds of the sprites created in each round, keyed by round name
+    , the sprites of a round are the ones its events spawn in the round script and the
+    sprites they create
+
+        Parameter:
+            script (RoundScript): compiled round script
+            source (string): python file of the sprite classes
+    """
+    assets = class_assets(source)
+    rounds = {}
+    for round in script.script:
+        pending = [name for event in round.events.values() for attribute, name, item
+                   in event.spawn or []]
+        seen = set()
+        while pending:
+            name = pending.pop()
+            if name not in seen and name in assets:
+                seen.add(name)
+                pending.extend(assets[name]['uses'])
+        rounds[round.name] = {
+            'images': sorted({key for name in seen for key in assets[name]['images']}, key=str),
+            'sounds': sorted({sound for name in seen for sound in assets[name]['sounds']}),
+            'dialogue': sorted({sound for name in seen for sound in assets[name]['dialogue']}),
+        }
+    return rounds
@@ -1,7 +1,13 @@
 import pygame
-import time
-import threading
 from config import *
+from assets import images
+from voice import audio_busy, stop_audio, playing_line
+from soundbank import sounds
+from animation import Animation
+from motion import Motion
+from text import text
+from subtitles import SUBTITLES
+from script import SCRIPT, ANY
 
 # ==============Player================
 
@@ -22,13 +28,20 @@ class Player(pygame.sprite.Sprite):
         game sprites
     round_updated: control player update in new round
         bool
-    player_index: control player images
-        int
+    animation: player run frames facing right and left
+        Animation
     image: player's current image
         png file
     rect: image with rectangle around to control position more easily
         pygame rect
-    all sound attribute: player's sound each round
+    motion: float position of the sprite
+        Motion
+    start_positions: start position of each round indexed by round id, class attribute
+        list
+    lines: voice line keyed by (round id, event), class attribute
+        dict
+    round_functions: round function indexed by round id, class attribute
+        list
 
     Methods
     -------
@@ -48,6 +61,25 @@ class Player(pygame.sprite.Sprite):
         run all function 
     """
 
+    # Start position of each round, (5, 600) for the rounds without one
+    start_positions = SCRIPT.round_table({
+        'round1_2': (5, 545), 'round2': (5, 490), 'round3': (5, 530), 'round4': (5, 400),
+        'round5': (5, 450), 'round6_1': (5, 535),
+    })
+    # Voice lines keyed by (round, event)
+    lines = SCRIPT.event_table({
+        ('round1_1', ANY): 'player/round1_1',
+        ('round3', 2): 'player/round3_help_lion',
+        ('round3', 7): 'player/round3_win',
+        ('round4', 1): 'player/round4_see_rabbit',
+        ('round4', 7): 'player/round4_reply',
+        ('round5', 1): 'player/round5_start',
+        ('round6_1', ANY): 'player/round6_1_start',
+        ('round6_2', 0): 'player/round6_2_win',
+        ('round6_2', 2): 'player/round6_2_end',
+        ('round7', ANY): 'player/round7_win',
+    })
+
     def __init__(self, game):
         """
         Initialize player sprite
@@ -64,57 +96,15 @@ class Player(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self, self.groups)
         self.round_updated = False
 
-        player_run1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run1.png').convert_alpha(), (0.8, 0.8))
-        player_run2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run2.png').convert_alpha(), (0.8, 0.8))
-        player_run3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run3.png').convert_alpha(), (0.8, 0.8))
-        player_run4 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run4.png').convert_alpha(), (0.8, 0.8))
-        player_run5 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run5.png').convert_alpha(), (0.8, 0.8))
-        player_run6 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run6.png').convert_alpha(), (0.8, 0.8))
-        player_run7 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run7.png').convert_alpha(), (0.8, 0.8))
-        player_run8 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/player/player_run8.png').convert_alpha(), (0.8, 0.8))
-        self.player_run = [player_run1, player_run2, player_run3,
-                           player_run4, player_run5, player_run6, player_run7, player_run8]
-        self.player_index = 0
-        self.image = self.player_run[self.player_index]
+        self.animation = Animation.from_files(
+            ['graphics/player/player_run1.png', 'graphics/player/player_run2.png',
+             'graphics/player/player_run3.png', 'graphics/player/player_run4.png',
+             'graphics/player/player_run5.png', 'graphics/player/player_run6.png',
+             'graphics/player/player_run7.png', 'graphics/player/player_run8.png'],
+            (0.8, 0.8), PLAYER_MOVEMENT)
+        self.image = self.animation.image
         self.rect = self.image.get_rect(midbottom=(5, 600))
-
-        # Round 1 sound
-        self.round1_sound = pygame.mixer.Sound('sound/player/round1_1.wav')
-
-        # Round 3 sound
-        self.round3_help_lion = pygame.mixer.Sound(
-            'sound/player/round3_help_lion.wav')
-        self.round3_win = pygame.mixer.Sound('sound/player/round3_win.wav')
-
-        # Round 4 sound
-        self.round4_see_rabbit = pygame.mixer.Sound(
-            'sound/player/round4_see_rabbit.wav')
-        self.round4_thanks = pygame.mixer.Sound(
-            'sound/player/round4_thanks.wav')
-        self.round4_reply = pygame.mixer.Sound('sound/player/round4_reply.wav')
-
-        # Round 5 sound
-        self.round5_start = pygame.mixer.Sound('sound/player/round5_start.wav')
-        self.round5_thanks = pygame.mixer.Sound(
-            'sound/player/round5_thanks.wav')
-        self.round5_bye = pygame.mixer.Sound('sound/player/round5_bye.wav')
-
-        # Round 6 sound
-        self.round6_1_start = pygame.mixer.Sound(
-            'sound/player/round6_1_start.wav')
-        self.round6_2_win = pygame.mixer.Sound('sound/player/round6_2_win.wav')
-        self.round6_2_end = pygame.mixer.Sound('sound/player/round6_2_end.wav')
-
-        # Round 7 sound
-        self.round7_sound = pygame.mixer.Sound('sound/player/round7_win.wav')
+        self.motion = Motion(self)
 
     def player_input(self):
         """
@@ -124,92 +114,35 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_RIGHT] and self.rect.x <= 720:
             self.facing = 'right'
             self.animation_state()
-            self.rect.x += PLAYER_SPEED
+            self.motion.move(PLAYER_SPEED)
         if keys[pygame.K_LEFT] and self.rect.x >= 0:
             self.facing = 'left'
             self.animation_state()
-            self.rect.x -= PLAYER_SPEED
+            self.motion.move(-PLAYER_SPEED)
 
     def animation_state(self):
         """"
         Control player directions and x_pos
         """
-        self.player_index += PLAYER_MOVEMENT
-        if self.player_index >= len(self.player_run):
-            self.player_index = 0
-        self.image = self.player_run[int(self.player_index)]
-        if self.facing == 'left':
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.image, False, True), 180)
+        self.animation.direction = self.facing
+        self.animation.update()
+        self.image = self.animation.image
 
     # Update player each new round
     def new_round(self):
         """
         Set player attribute for new round
         """
-        if self.game.current_round == 'round1_2':
-            self.rect.midbottom = (5, 545)
-        elif self.game.current_round == 'round2':
-            self.rect.midbottom = (5, 490)
-        elif self.game.current_round == 'round3':
-            self.rect.midbottom = (5, 530)
-        elif self.game.current_round == 'round4':
-            self.rect.midbottom = (5, 400)
-        elif self.game.current_round == 'round5':
-            self.rect.midbottom = (5, 450)
-        elif self.game.current_round == 'round6_1':
-            self.rect.midbottom = (5, 535)
-        else:
-            self.rect.midbottom = (5, 600)
+        self.rect.midbottom = self.start_positions[self.game.round_id] or (5, 600)
         self.round_updated = True
 
     def play_sound(self):
         """
         Play player's sound
         """
-        pygame.mixer.stop()
-        # Round 1
-        if self.game.current_round == 'round1_1' and pygame.mixer.get_busy() == False:
-            self.round1_sound.play()
-
-        # Round 3
-        elif self.game.current_round == 'round3' and pygame.mixer.get_busy() == False:
-            if self.game.round_event == 2:
-                self.round3_help_lion.play()
-
-            if self.game.round_event == 7:
-                self.round3_win.play()
-
-        # Round 4
-        elif self.game.current_round == 'round4' and pygame.mixer.get_busy() == False:
-            if self.game.round_event == 1:
-                self.round4_see_rabbit.play()
-            if self.game.round_event == 4:
-                self.round4_thanks.play()
-            if self.game.round_event == 7:
-                self.round4_reply.play()
-
-        # Round 5
-        elif self.game.current_round == 'round5' and pygame.mixer.get_busy() == False:
-            if self.game.round_event == 1:
-                self.round5_start.play()
-            elif self.game.round_event == 4:
-                self.round5_thanks.play()
-            elif self.game.round_event == 6:
-                self.round5_bye.play()
-
-        # Round 6
-        elif self.game.current_round == 'round6_1' and pygame.mixer.get_busy() == False:
-            self.round6_1_start.play()
-
-        elif self.game.current_round == 'round6_2' and pygame.mixer.get_busy() == False:
-            if self.game.round_event == 0:
-                self.round6_2_win.play()
-            elif self.game.round_event == 2:
-                self.round6_2_end.play()
-
-        elif self.game.current_round == 'round7' and pygame.mixer.get_busy() == False:
-            self.round7_sound.play()
+        line = SCRIPT.lookup(self.lines, self.game.round_id, self.game.round_event)
+        if line is not None:
+            sounds.play(line)
 
     def round1(self):
         """
@@ -251,19 +184,19 @@ class Player(pygame.sprite.Sprite):
         """
         # Event 2: See the hurt lion
         if self.game.round_event == 2:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.play_sound()
                 self.game.round_event += 1
 
         # Event 7: player script
         if self.game.round_event == 7:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.play_sound()
                 self.game.round_event += 1
 
         # Event 8: Player done script
         if self.game.round_event == 8:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.game.win_round = 1
 
         # Pass round
@@ -278,25 +211,19 @@ class Player(pygame.sprite.Sprite):
         """
         # Event 1: Player see the rabbit, appear
         if self.game.round_event == 1:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.play_sound()
                 self.game.round_event += 1
                 self.game.items_created = 0
 
-        # Event 4: Player thanks
-        if self.game.round_event == 4:
-            if pygame.mixer.get_busy() == False:
-                self.play_sound()
-                self.game.round_event += 1
-
         # Event 7: Player reply
         if self.game.round_event == 7:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.play_sound()
                 self.game.round_event += 1
 
         # Event 8: Player end script and end
-        if self.game.round_event == 8 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 8 and audio_busy() == False:
             self.game.win_round = 1
 
         # Pass round
@@ -309,18 +236,9 @@ class Player(pygame.sprite.Sprite):
         Control round 5 events
         """
         # Event 1: player see elephant is captured
-        if self.game.round_event == 1 and pygame.mixer.get_busy() == False:
-            self.play_sound()
-            self.game.round_event += 1
-        # Event 4: player reply the elephant thanks
-        elif self.game.round_event == 4 and pygame.mixer.get_busy() == False:
-            self.play_sound()
-            self.game.round_event += 1
-        # Event 6: Bye elephant
-        elif self.game.round_event == 6 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 1 and audio_busy() == False:
             self.play_sound()
             self.game.round_event += 1
-
         # Pass round
         elif self.game.win_round == 2 and self.rect.x >= 720:
             self.game.next_round = 1
@@ -338,7 +256,7 @@ class Player(pygame.sprite.Sprite):
             self.play_sound()
             self.game.round_event += 1
         # Event 1: Player done script and collect items
-        elif self.game.round_event == 1 and pygame.mixer.get_busy() == False:
+        elif self.game.round_event == 1 and audio_busy() == False:
             self.game.round_event += 1
             self.game.items_created = 0
         # Win round: Put three items together
@@ -356,11 +274,11 @@ class Player(pygame.sprite.Sprite):
             self.game.round_event += 1
             self.game.items_created = 0
         # Event 2
-        elif self.game.round_event == 2 and pygame.mixer.get_busy() == False:
+        elif self.game.round_event == 2 and audio_busy() == False:
             self.play_sound()
             self.game.round_event += 1
         # Event 3
-        elif self.game.round_event == 3 and pygame.mixer.get_busy() == False:
+        elif self.game.round_event == 3 and audio_busy() == False:
             self.game.win_round += 1
             self.game.round_event += 3
         elif self.game.win_round and self.rect.x >= 720:
@@ -376,13 +294,20 @@ class Player(pygame.sprite.Sprite):
             self.play_sound()
             self.game.round_event += 1
         # Event 3: player done script
-        elif self.game.round_event == 3 and pygame.mixer.get_busy() == False:
+        elif self.game.round_event == 3 and audio_busy() == False:
             self.game.win_round = 1
             self.game.round_event += 1
         # End game
         elif self.game.win_round:
             self.game.end_game = 1
 
+    # Round functions indexed by round id
+    round_functions = SCRIPT.round_table({
+        'round1_1': round1, 'round1_2': round1, 'round2': round2, 'round3': round3,
+        'round4': round4, 'round5': round5, 'round6_1': round6_1, 'round6_2': round6_2,
+        'round7': round7,
+    })
+
     def round_update(self):
         """
         Run round function when current round is this round
@@ -390,22 +315,9 @@ class Player(pygame.sprite.Sprite):
         if self.round_updated == False:
             self.new_round()
 
-        if self.game.current_round == 'round1_1' or self.game.current_round == 'round1_2':
-            self.round1()
-        elif self.game.current_round == 'round2':
-            self.round2()
-        elif self.game.current_round == 'round3':
-            self.round3()
-        elif self.game.current_round == 'round4':
-            self.round4()
-        elif self.game.current_round == 'round5':
-            self.round5()
-        elif self.game.current_round == 'round6_1':
-            self.round6_1()
-        elif self.game.current_round == 'round6_2':
-            self.round6_2()
-        elif self.game.current_round == 'round7':
-            self.round7()
+        function = self.round_functions[self.game.round_id]
+        if function is not None:
+            function(self)
 
     def update(self):
         """
@@ -439,8 +351,14 @@ class Fairy(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
-    all sound file: store fairy sound
-        wav
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
+    start_positions: start position of each round indexed by round id, class attribute
+        list
+    lines: voice line keyed by (round id, event), class attribute
+        dict
+    round_functions: round function indexed by round id, class attribute
+        list
 
     Methods
     -------
@@ -456,31 +374,37 @@ class Fairy(pygame.sprite.Sprite):
         run all functions
     """
 
+    # Start position of each round
+    start_positions = SCRIPT.round_table({
+        'round1_1': (700, 600), 'round2': (600, 320), 'round6_1': (600, 320),
+        'round6_2': (600, 320),
+    })
+    # Voice lines keyed by (round, event)
+    lines = SCRIPT.event_table({
+        ('intro', 0): 'fairy/intro',
+        ('round1_1', ANY): 'fairy/round1',
+        ('round2', ANY): 'fairy/round2',
+        ('round6_1', ANY): 'fairy/round6_1',
+        ('round6_2', ANY): 'fairy/round6_2',
+    })
+
     def __init__(self, game):
         """"
         Initialize fairy
         """
         super().__init__()
-        pygame.mixer.init()
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'motion')
 
         self._layer = SUB_CHAR
         self.sound_is_playing = False
         self.round_updated = False  # Check if start position of each round is updated
 
-        self.image = pygame.transform.scale_by(pygame.image.load(
-            'graphics/fairy/fairy.png').convert_alpha(), (0.8, 0.8))
+        self.image = images.load('graphics/fairy/fairy.png', (0.8, 0.8))
         self.rect = self.image.get_rect(center=(730, 250))
 
-        # Import fairy's voice
-        self.intro_sound = pygame.mixer.Sound('sound/fairy/intro.wav')
-        self.round1_1_sound = pygame.mixer.Sound('sound/fairy/round1.wav')
-        self.round2_sound = pygame.mixer.Sound('sound/fairy/round2.wav')
-        self.round6_1_sound = pygame.mixer.Sound('sound/fairy/round6_1.wav')
-        self.round6_2_sound = pygame.mixer.Sound('sound/fairy/round6_2.wav')
-
     def update(self):
         """
         Run all fairy functions
@@ -492,44 +416,18 @@ class Fairy(pygame.sprite.Sprite):
         Play fairy sound
         """
         self.game.skip_btn = SkipButton(self.game)
-        pygame.mixer.stop()
-        # Intro
-        if self.game.current_round == 'intro' and pygame.mixer.get_busy() == False:
-            if self.game.round_event == 0:
-                self.sound_is_playing = True
-                self.intro_sound.play()
-
-        # Round 1
-        if self.game.current_round == 'round1_1' and pygame.mixer.get_busy() == False:
+        line = SCRIPT.lookup(self.lines, self.game.round_id, self.game.round_event)
+        if line is not None:
             self.sound_is_playing = True
-            self.round1_1_sound.play()
-
-        # Round 2
-        if self.game.current_round == 'round2' and pygame.mixer.get_busy() == False:
-            self.sound_is_playing = True
-            self.round2_sound.play()
-
-        # Round 6
-        if self.game.current_round == 'round6_1' and pygame.mixer.get_busy() == False:
-            self.sound_is_playing = True
-            self.round6_1_sound.play()
-
-        if self.game.current_round == 'round6_2' and pygame.mixer.get_busy() == False:
-            self.sound_is_playing = True
-            self.round6_2_sound.play()
+            sounds.play(line)
 
     def new_round(self):
-        if self.game.current_round == 'round1_1':
-            self.rect.midbottom = (700, 600)
-            self.round_updated = True
-        elif self.game.current_round == 'round2':
-            self.rect.midbottom = (600, 320)
-            self.round_updated = True
-        elif self.game.current_round == 'round6_1':
-            self.rect.midbottom = (600, 320)
-            self.round_updated = True
-        elif self.game.current_round == 'round6_2':
-            self.rect.midbottom = (600, 320)
+        """
+        Move the fairy to where she starts the round
+        """
+        position = self.start_positions[self.game.round_id]
+        if position is not None:
+            self.rect.midbottom = position
             self.round_updated = True
 
     def intro(self):
@@ -541,14 +439,14 @@ class Fairy(pygame.sprite.Sprite):
             self.game.round_event += 1
 
         # Check if the fairy done the intro script
-        if self.game.round_event == 1 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 1 and audio_busy() == False:
             self.sound_is_playing = False
             self.game.next_round = 1
             self.round_updated = False
 
         # Skip button is clicked
         if self.game.next_round == 1:
-            pygame.mixer.stop()
+            stop_audio()
 
     def round1(self):
         """
@@ -556,14 +454,14 @@ class Fairy(pygame.sprite.Sprite):
         """
         if self.game.current_round == 'round1_1':
             # Check if player collide with fairy
-            if self.game.round_event == 0 and self.rect.colliderect(self.game.player):
+            if self.game.round_event == 0 and self.game.collisions.touching(self, self.game.player):
                 self.play_sound()
                 self.rect.x -= 100
                 self.rect.y -= 280
                 self.game.round_event += 1  # Fairy start the script
 
             # Check if the fairy done the round 1_1 script
-            if self.game.round_event == 1 and pygame.mixer.get_busy() == False:
+            if self.game.round_event == 1 and audio_busy() == False:
                 self.game.round_event += 1
                 self.game.items_created = 0
                 self.sound_is_playing = False
@@ -572,7 +470,7 @@ class Fairy(pygame.sprite.Sprite):
 
             # Skip button is clicked
             if self.game.round_event == 2:
-                pygame.mixer.stop()
+                stop_audio()
                 self.game.items_created = 0
                 self.sound_is_playing = False
                 self.round_updated = False
@@ -588,7 +486,7 @@ class Fairy(pygame.sprite.Sprite):
             self.game.round_event += 1
 
         # Event 1: Check if the fairy done script
-        if self.game.round_event == 1 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 1 and audio_busy() == False:
             self.sound_is_playing = False
             self.round_updated = False
             self.game.items_created = 0
@@ -599,11 +497,11 @@ class Fairy(pygame.sprite.Sprite):
         control round6_1 events
         """
         # Event 2
-        if self.game.round_event == 2 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 2 and audio_busy() == False:
             self.play_sound()
             self.game.round_event += 1
         # Event 3: fairy done script
-        if self.game.round_event == 3 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 3 and audio_busy() == False:
             self.sound_is_playing = False
             self.round_updated = False
             self.kill()
@@ -617,11 +515,17 @@ class Fairy(pygame.sprite.Sprite):
             self.play_sound()
             self.game.round_event += 1
         # Event 2
-        elif self.game.round_event == 2 and pygame.mixer.get_busy() == False:
+        elif self.game.round_event == 2 and audio_busy() == False:
             self.sound_is_playing = False
             self.round_updated = False
             self.kill()
 
+    # Round functions indexed by round id
+    round_functions = SCRIPT.round_table({
+        'intro': intro, 'round1_1': round1, 'round2': round2,
+        'round6_1': round6_1, 'round6_2': round6_2,
+    })
+
     def round_update(self):
         """
         run round function if current round is this round
@@ -629,16 +533,9 @@ class Fairy(pygame.sprite.Sprite):
         if self.round_updated == False:
             self.new_round()
 
-        if self.game.current_round == 'intro':
-            self.intro()
-        elif self.game.current_round == 'round1_1':
-            self.round1()
-        elif self.game.current_round == 'round2':
-            self.round2()
-        elif self.game.current_round == 'round6_1':
-            self.round6_1()
-        elif self.game.current_round == 'round6_2':
-            self.round6_2()
+        function = self.round_functions[self.game.round_id]
+        if function is not None:
+            function(self)
 
 # ==============Rhino================
 
@@ -655,20 +552,21 @@ class Rhino(pygame.sprite.Sprite):
         int
     groups: all sprites of the game
         game sprites
-    rhino_before: list of rhino images in start of round
-        pygame image
-    rhino_after: list of rhino images when player make a right move
-        pygame image
-    rhino_index: control rhino move images
-        int
+    rhino_before: rhino move frames in start of round
+        Animation
+    rhino_after: rhino move frames when player make a right move
+        Animation
     image: current image
         png
     rect: image with rectangle around to control position more easily
         pygame rect
-    all sound file: store rhino sound
-        wav
+    motion: float position of the sprite
+        Motion
     die: get to know when rhino is killed by player and game over
         bool
+    wakes_on: what the rhino waits for, it is not updated until one of them changes,
+        None while it runs
+        tuple
 
     Methods
     -------
@@ -693,66 +591,43 @@ class Rhino(pygame.sprite.Sprite):
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
 
-        rhino_before1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/before/rhino_before1.png').convert_alpha(), (0.8, 0.8))
-        rhino_before2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/before/rhino_before2.png').convert_alpha(), (0.8, 0.8))
-        rhino_before3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/before/rhino_before3.png').convert_alpha(), (0.8, 0.8))
-        rhino_before4 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/before/rhino_before4.png').convert_alpha(), (0.8, 0.8))
-        rhino_before5 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/before/rhino_before5.png').convert_alpha(), (0.8, 0.8))
-        rhino_before6 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/before/rhino_before6.png').convert_alpha(), (0.8, 0.8))
-
-        rhino_after1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/after/rhino_after1.png').convert_alpha(), (0.69, 0.69))
-        rhino_after2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/after/rhino_after2.png').convert_alpha(), (0.69, 0.69))
-        rhino_after3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/after/rhino_after3.png').convert_alpha(), (0.69, 0.69))
-        rhino_after4 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/after/rhino_after4.png').convert_alpha(), (0.69, 0.69))
-        rhino_after5 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/after/rhino_after5.png').convert_alpha(), (0.69, 0.69))
-        rhino_after6 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/after/rhino_after6.png').convert_alpha(), (0.69, 0.69))
-
-        self.rhino_die = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rhino/rhino_die.png').convert_alpha(), (0.8, 0.8))
-
-        self.rhino_before = [rhino_before1, rhino_before2,
-                             rhino_before3, rhino_before4, rhino_before5, rhino_before6]
-        self.rhino_after = [rhino_after1, rhino_after2,
-                            rhino_after3, rhino_after4, rhino_after5, rhino_after6]
-
-        self.rhino_index = 0
-        self.image = self.rhino_before[self.rhino_index]
+        self.rhino_before = Animation.from_files(
+            ['graphics/animals/rhino/before/rhino_before1.png',
+             'graphics/animals/rhino/before/rhino_before2.png',
+             'graphics/animals/rhino/before/rhino_before3.png',
+             'graphics/animals/rhino/before/rhino_before4.png',
+             'graphics/animals/rhino/before/rhino_before5.png',
+             'graphics/animals/rhino/before/rhino_before6.png'], (0.8, 0.8), 0.14)
+        self.rhino_after = Animation.from_files(
+            ['graphics/animals/rhino/after/rhino_after1.png',
+             'graphics/animals/rhino/after/rhino_after2.png',
+             'graphics/animals/rhino/after/rhino_after3.png',
+             'graphics/animals/rhino/after/rhino_after4.png',
+             'graphics/animals/rhino/after/rhino_after5.png',
+             'graphics/animals/rhino/after/rhino_after6.png'], (0.69, 0.69), 0.14)
+
+        self.rhino_die = images.load(
+            'graphics/animals/rhino/rhino_die.png', (0.8, 0.8))
+
+        self.image = self.rhino_before.image
         self.rect = self.image.get_rect(midbottom=(800, 490))
+        self.motion = Motion(self)
 
         self.die = False
-        self.rhino_sound = pygame.mixer.Sound('sound/rhino/rhino.wav')
-        self.rhino_die_sound = pygame.mixer.Sound('sound/rhino/rhino_die.wav')
-        self.rhino_win_sound = pygame.mixer.Sound('sound/rhino/rhino_win.wav')
 
     def move(self):
         """"
         Make the rhino move
         """
         if self.game.round_event == 1:
-            self.rhino_index += 0.14
-            self.rect.x -= 3
-            if self.rhino_index >= len(self.rhino_before):
-                self.rhino_index = 0
-            self.image = self.rhino_before[int(self.rhino_index)]
+            self.rhino_before.update()
+            self.motion.move(-3)
+            self.image = self.rhino_before.image
 
         if self.game.round_event == 5:
-            self.rhino_index += 0.14
-            self.rect.x += 3.5
-            if self.rhino_index >= len(self.rhino_after):
-                self.rhino_index = 0
-            self.image = self.rhino_after[int(self.rhino_index)]
+            self.rhino_after.update()
+            self.motion.move(3.5)
+            self.image = self.rhino_after.image
 
         if self.die:
             self.image = self.rhino_die
@@ -762,20 +637,19 @@ class Rhino(pygame.sprite.Sprite):
         Run all function
         """
         self.round_update()
+        # Updated every step while running, otherwise only when something it waits for changes
+        self.wakes_on = None if self.game.round_event in (1, 5) else ('round', 'audio', 'motion')
 
     def play_sound(self):
         """"
         Play Rhino sounds
         """
-        pygame.mixer.stop()
-        if self.game.round_event == 1 and pygame.mixer.get_busy() == False:
-            self.rhino_sound.play()
-
-        if self.game.round_event == 3 and pygame.mixer.get_busy() == False:
-            self.rhino_win_sound.play()
-
-        if self.die and pygame.mixer.get_busy() == False:
-            self.rhino_die_sound.play()
+        if self.game.round_event == 1:
+            sounds.play('rhino/rhino')
+        elif self.game.round_event == 3:
+            sounds.play('rhino/rhino_win')
+        elif self.die:
+            sounds.play('rhino/rhino_die')
 
     def round_update(self):
         """"
@@ -790,15 +664,14 @@ class Rhino(pygame.sprite.Sprite):
                 self.game.round_event += 1
 
         # Event 3: Get the horn
-        if self.game.round_event == 3 and pygame.mixer.get_busy() == False:
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.rhino_after[0], False, True), 180)
+        if self.game.round_event == 3 and audio_busy() == False:
+            self.image = self.rhino_after.frames['left'][0]
             self.play_sound()
             self.game.round_event += 1
 
         # Event 4: Done script
         if self.game.round_event == 4:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.game.items_created = 0
                 self.game.round_event += 1
 
@@ -810,13 +683,13 @@ class Rhino(pygame.sprite.Sprite):
                 self.kill()
 
         # Killed by the saw
-        if self.game.round_event == 2 and self.rect.colliderect(self.game.saw) and self.die == False:
+        if self.game.round_event == 2 and self.game.collisions.touching(self, self.game.saw) and self.die == False:
             self.die = True
             self.play_sound()
             self.game.items_created = 0
 
         # Game_over
-        if self.die and pygame.mixer.get_busy() == False:
+        if self.die and audio_busy() == False:
             self.game.game_over_flag = 1
             self.kill()
 
@@ -835,18 +708,19 @@ class Lion(pygame.sprite.Sprite):
         int
     groups: all sprites of the game
         game sprites
-    lion_run: list of lion run movement images
-        pygame image
-    lion_run_index: control lion run movement
-        int
+    lion_run: lion run movement frames
+        Animation
     image: current image
         png
     rect: image with rectangle around to control position more easily
         pygame rect
-    all sound file: store rabbit sound
-        wav
+    motion: float position of the sprite
+        Motion
     die: get to know when rabbit is killed by player and game over
         bool
+    wakes_on: what the lion waits for, it is not updated until one of them changes,
+        None while it runs
+        tuple
 
     Methods
     -------
@@ -871,67 +745,55 @@ class Lion(pygame.sprite.Sprite):
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
 
-        lion_run1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/lion/lion_run1.png').convert_alpha(), (0.8, 0.8))
-        lion_run2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/lion/lion_run2.png').convert_alpha(), (0.8, 0.8))
-        lion_run3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/lion/lion_run3.png').convert_alpha(), (0.8, 0.8))
-        self.lion_win = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/lion/lion_win.png').convert_alpha(), (0.8, 0.8))
-        self.lion_die = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/lion/lion_die.png').convert_alpha(), (0.8, 0.8))
-        self.lion_hurt = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/lion/lion_hurt.png').convert_alpha(), (0.8, 0.8))
-
-        self.lion_run = [lion_run1, lion_run2, lion_run3]
-        self.lion_run_index = 0
-        self.image = self.lion_run[self.lion_run_index]
+        self.lion_run = Animation.from_files(
+            ['graphics/animals/lion/lion_run1.png',
+             'graphics/animals/lion/lion_run2.png',
+             'graphics/animals/lion/lion_run3.png'], (0.8, 0.8), 0.14)
+        self.lion_win = images.load(
+            'graphics/animals/lion/lion_win.png', (0.8, 0.8))
+        self.lion_die = images.load(
+            'graphics/animals/lion/lion_die.png', (0.8, 0.8))
+        self.lion_hurt = images.load(
+            'graphics/animals/lion/lion_hurt.png', (0.8, 0.8), flip=True)
+
+        self.image = self.lion_run.image
         self.rect = self.image.get_rect(midbottom=(800, 530))
+        self.motion = Motion(self)
 
         self.die = False
 
-        self.touch_nail_sound = pygame.mixer.Sound('sound/lion/touch_nail.wav')
-        self.win_sound = pygame.mixer.Sound('sound/lion/win.wav')
-        self.die_sound = pygame.mixer.Sound('sound/lion/die.wav')
-
     def move(self):
         """"
         Control the lion movement
         """
         if self.game.round_event == 6:
-            self.lion_run_index += 0.14
-            self.rect.x += 3.5
-            if self.lion_run_index >= len(self.lion_run):
-                self.lion_run_index = 0
-        self.image = self.lion_run[int(self.lion_run_index)]
+            self.lion_run.direction = 'right'
+            self.lion_run.update()
+            self.motion.move(3.5)
         if self.game.round_event == 0:
-            self.lion_run_index += 0.14
-            self.rect.x -= 3
-            if self.lion_run_index >= len(self.lion_run):
-                self.lion_run_index = 0
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.image, False, True), 180)
+            self.lion_run.direction = 'left'
+            self.lion_run.update()
+            self.motion.move(-3)
+        self.image = self.lion_run.image
 
     def update(self):
         """
         Run all round update function
         """
         self.round_update()
+        # Updated every step while running, otherwise only when something it waits for changes
+        self.wakes_on = None if self.game.round_event in (0, 6) else ('round', 'audio', 'motion')
 
     def play_sound(self):
         """
         Play the lion sound
         """
-        pygame.mixer.stop()
-        if self.game.round_event == 1 and pygame.mixer.get_busy() == False:
-            self.touch_nail_sound.play()
-
-        if self.game.round_event == 4 and pygame.mixer.get_busy() == False:
-            self.win_sound.play()
-
-        if self.die and pygame.mixer.get_busy() == False:
-            self.die_sound.play()
+        if self.game.round_event == 1:
+            sounds.play('lion/touch_nail')
+        elif self.game.round_event == 4:
+            sounds.play('lion/win')
+        elif self.die:
+            sounds.play('lion/die')
 
     def round_update(self):
         """"
@@ -944,8 +806,7 @@ class Lion(pygame.sprite.Sprite):
         # Event 1: Wait for player help
         if self.game.round_event == 1:
             self.play_sound()
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.lion_hurt, False, True), 180)
+            self.image = self.lion_hurt
             self.game.round_event += 1
 
         # Event 4: Get player help
@@ -956,7 +817,7 @@ class Lion(pygame.sprite.Sprite):
 
         # Event 5: Done script
         if self.game.round_event == 5:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.game.round_event += 1
 
         # Event 6: Lion run away
@@ -967,13 +828,13 @@ class Lion(pygame.sprite.Sprite):
                 self.kill()
 
         # Killed by the saw
-        if self.game.round_event == 3 and self.rect.colliderect(self.game.saw) and self.die == False:
+        if self.game.round_event == 3 and self.game.collisions.touching(self, self.game.saw) and self.die == False:
             self.die = True
             self.play_sound()
             self.game.items_created = 1
 
         # Game_over
-        if self.die and pygame.mixer.get_busy() == False:
+        if self.die and audio_busy() == False:
             self.game.game_over_flag = 1
             self.kill()
 
@@ -992,23 +853,28 @@ class Rabbit(pygame.sprite.Sprite):
         int
     groups: all sprites of the game
         game sprites
-    rabbit_run: list of rabbit run movement images
-        pygame image
-    rabbit_run_index: control rabbit run movement
-        int
+    rabbit_run: rabbit run movement frames
+        Animation
     image: current image
         png
     rect: image with rectangle around to control position more easily
         pygame rect
-    all sound file: store rabbit sound
-        wav
+    motion: float position of the sprite
+        Motion
     die: get to when the rabbit is killed by player and game over
         bool
+    wakes_on: what the rabbit waits for, it is not updated until one of them changes,
+        None while it runs
+        tuple
 
     Methods
     -------
     play_sound:
         play player sound
+    talk:
+        play the talk with the player
+    talk_event:
+        move the round on when a line of the talk starts
     round_update:
         run round function if its condition is true
     update:
@@ -1026,72 +892,69 @@ class Rabbit(pygame.sprite.Sprite):
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
 
-        rabbit_run1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rabbit/rabbit_run1.png').convert_alpha(), (0.8, 0.8))
-        rabbit_run2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rabbit/rabbit_run2.png').convert_alpha(), (0.8, 0.8))
-        rabbit_run3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rabbit/rabbit_run3.png').convert_alpha(), (0.8, 0.8))
-        self.rabbit_cry = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/rabbit/rabbit_cry.png').convert_alpha(), (0.8, 0.8))
-
-        self.rabbit_run = [rabbit_run1, rabbit_run2, rabbit_run3]
-        self.rabbit_run_index = 0
-        self.image = self.rabbit_run[self.rabbit_run_index]
+        self.rabbit_run = Animation.from_files(
+            ['graphics/animals/rabbit/rabbit_run1.png',
+             'graphics/animals/rabbit/rabbit_run2.png',
+             'graphics/animals/rabbit/rabbit_run3.png'], (0.8, 0.8), 0.14,
+            direction=self.direction)
+        self.rabbit_cry = images.load(
+            'graphics/animals/rabbit/rabbit_cry.png', (0.8, 0.8), flip=True)
+
+        self.image = self.rabbit_run.image
         self.rect = self.image.get_rect(midbottom=(800, 600))
+        self.motion = Motion(self)
         # Count round rabbit run in event 0
         self.round_count = 0
 
         self.die = False
 
-        self.rabbit_hungry_sound = pygame.mixer.Sound(
-            'sound/rabbit/rabbit_hungry.wav')
-        self.rabbit_get_food = pygame.mixer.Sound(
-            'sound/rabbit/rabbit_get_food.wav')
-        self.rabbit_win = pygame.mixer.Sound('sound/rabbit/rabbit_win.wav')
-        self.rabbit_die_sound = pygame.mixer.Sound(
-            'sound/rabbit/rabbit_die.wav')
-
     def move(self):
         """
         Control rabbit movement
         """
+        self.rabbit_run.direction = self.direction
+        self.rabbit_run.update()
         if self.direction == 'right':
-            self.rabbit_run_index += 0.14
-            self.rect.x += 5
-            if self.rabbit_run_index >= len(self.rabbit_run):
-                self.rabbit_run_index = 0
-        self.image = self.rabbit_run[int(self.rabbit_run_index)]
-        if self.direction == 'left':
-            self.rabbit_run_index += 0.14
-            self.rect.x -= 5
-            if self.rabbit_run_index >= len(self.rabbit_run):
-                self.rabbit_run_index = 0
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.image, False, True), 180)
+            self.motion.move(5)
+        else:
+            self.motion.move(-5)
+        self.image = self.rabbit_run.image
 
     def update(self):
         """
         Run all round update functions
         """
         self.round_update()
+        # Updated every step while running, otherwise only when something it waits for changes
+        self.wakes_on = None if self.game.round_event in (0, 6) else ('round', 'audio', 'motion')
 
     def play_sound(self):
         """"
         Play rabbit sounds
         """
-        pygame.mixer.stop()
-        if self.game.round_event == 0 and pygame.mixer.get_busy() == False:
-            self.rabbit_hungry_sound.play()
-
-        if self.game.round_event == 3 and pygame.mixer.get_busy() == False:
-            self.rabbit_get_food.play()
+        if self.game.round_event == 0:
+            sounds.play('rabbit/rabbit_hungry')
+        elif self.die:
+            sounds.play('rabbit/rabbit_die')
 
-        if self.game.round_event == 5 and pygame.mixer.get_busy() == False:
-            self.rabbit_win.play()
+    def talk(self):
+        """
+        Play the talk with the player once the rabbit got the carrot, each line moves the
+        round to the next event when it starts
+        """
+        sounds.play_dialogue([
+            ('rabbit/rabbit_get_food', None),
+            ('player/round4_thanks', lambda: self.talk_event(5)),
+            ('rabbit/rabbit_win', lambda: self.talk_event(6)),
+        ])
 
-        if self.die and pygame.mixer.get_busy() == False:
-            self.rabbit_die_sound.play()
+    def talk_event(self, event):
+        """
+        Move the round to event when a line of the talk starts, if the round is still at the
+        event before it
+        """
+        if self.alive() and self.game.round_event == event - 1:
+            self.game.round_event = event
 
     def round_update(self):
         """"
@@ -1101,8 +964,7 @@ class Rabbit(pygame.sprite.Sprite):
         if self.game.round_event == 0:
             self.move()
             if self.round_count == 2 and self.rect.x <= 580:
-                self.image = pygame.transform.rotate(
-                    pygame.transform.flip(self.rabbit_cry, False, True), 180)
+                self.image = self.rabbit_cry
                 self.rect = self.image.get_rect(midbottom=(580, 600))
                 self.play_sound()
                 self.game.round_event += 1
@@ -1115,19 +977,15 @@ class Rabbit(pygame.sprite.Sprite):
                     self.direction = 'left'
                     self.round_count += 1
 
-        # Event 3: Get food, start script
-        if self.game.round_event == 3 and pygame.mixer.get_busy() == False:
-            self.play_sound()
-            self.game.round_event += 1
-
-        # Event 5: Rabbit reply
-        if self.game.round_event == 5 and pygame.mixer.get_busy() == False:
-            self.play_sound()
+        # Event 3: Get food, start the talk, the player thanks at event 4 and the rabbit
+        # replies at event 5
+        if self.game.round_event == 3 and audio_busy() == False:
+            self.talk()
             self.game.round_event += 1
 
         # Event 6: Rabbit run away
         if self.game.round_event == 6:
-            if pygame.mixer.get_busy() == False:
+            if audio_busy() == False:
                 self.direction = 'right'
                 self.move()
                 if self.rect.x >= 720:
@@ -1135,13 +993,13 @@ class Rabbit(pygame.sprite.Sprite):
                     self.kill()
 
         # Killed by the saw
-        if self.game.round_event == 2 and self.rect.colliderect(self.game.saw) and self.die == False:
+        if self.game.round_event == 2 and self.game.collisions.touching(self, self.game.saw) and self.die == False:
             self.die = True
             self.play_sound()
             self.game.items_created = 1
 
         # Game_over
-        if self.die and pygame.mixer.get_busy() == False:
+        if self.die and audio_busy() == False:
             self.game.game_over_flag = 1
             self.kill()
 
@@ -1160,23 +1018,28 @@ class Elephant(pygame.sprite.Sprite):
         int
     groups: all sprites of the game
         game sprites
-    elephant_run: list of elephant run movement images
-        pygame image
-    elephant_run_index: control elephant run movement
-        int
+    elephant_run: elephant run movement frames
+        Animation
     image: current image
         png
     rect: image with rectangle around to control position more easily
         pygame rect
-    all sound file: store elephant sound
-        wav
+    motion: float position of the sprite
+        Motion
     die: get to when the elephant is killed by player and game over
         bool
+    wakes_on: what the elephant waits for, it is not updated until one of them changes,
+        None while it runs
+        tuple
 
     Methods
     -------
     play_sound:
         play player sound
+    talk:
+        play the talk with the player
+    talk_event:
+        move the round on when a line of the talk starts
     round_update:
         run round function if its condition is true
     update:
@@ -1197,77 +1060,77 @@ class Elephant(pygame.sprite.Sprite):
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
 
-        elephant_run1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/elephant/elephant_run1.png').convert_alpha(), (0.8, 0.8))
-        elephant_run2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/elephant/elephant_run2.png').convert_alpha(), (0.8, 0.8))
-        elephant_run3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/elephant/elephant_run3.png').convert_alpha(), (0.8, 0.8))
-        elephant_run4 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/animals/elephant/elephant_run4.png').convert_alpha(), (0.8, 0.8))
-
-        self.elephant_run = [elephant_run1,
-                             elephant_run2, elephant_run3, elephant_run4]
-        self.elephant_run_index = 0
-        self.image = self.elephant_run[self.elephant_run_index]
-        self.rect = self.image.get_rect(midbottom=(500, 450))\
-
-        self.elephant_start_sound = pygame.mixer.Sound(
-            'sound/elephant/elephant_start.wav')
-        self.elephant_reply_sound = pygame.mixer.Sound(
-            'sound/elephant/elephant_reply.wav')
-        self.elephant_win_sound = pygame.mixer.Sound(
-            'sound/elephant/elephant_win.wav')
+        self.elephant_run = Animation.from_files(
+            ['graphics/animals/elephant/elephant_run1.png',
+             'graphics/animals/elephant/elephant_run2.png',
+             'graphics/animals/elephant/elephant_run3.png',
+             'graphics/animals/elephant/elephant_run4.png'], (0.8, 0.8), 0.14)
+        self.image = self.elephant_run.image
+        self.rect = self.image.get_rect(midbottom=(500, 450))
+        self.motion = Motion(self)
 
     def move(self):
         """
         Control the elephant movement
         """
-        self.elephant_run_index += 0.14
-        self.rect.x += 5
-        if self.elephant_run_index >= len(self.elephant_run):
-            self.elephant_run_index = 0
-        self.image = self.elephant_run[int(self.elephant_run_index)]
+        self.elephant_run.direction = 'right'
+        self.elephant_run.update()
+        self.motion.move(5)
+        self.image = self.elephant_run.image
 
     def update(self):
         """"
         Run un round update functions
         """
         self.round_update()
+        # Updated every step while running, otherwise only when something it waits for changes
+        self.wakes_on = None if self.game.round_event == 7 else ('round', 'audio', 'motion')
 
     def play_sound(self):
         """"
         Play elephant sounds
         """
-        pygame.mixer.stop()
         if self.game.round_event == 0:
-            self.elephant_start_sound.play()
-        elif self.game.round_event == 3:
-            self.elephant_win_sound.play()
-        elif self.game.round_event == 5:
-            self.elephant_reply_sound.play()
+            sounds.play('elephant/elephant_start')
+
+    def talk(self):
+        """
+        Play the talk with the player once the elephant is free, each line moves the round to
+        the next event when it starts
+        """
+        sounds.play_dialogue([
+            ('elephant/elephant_win', None),
+            ('player/round5_thanks', lambda: self.talk_event(5)),
+            ('elephant/elephant_reply', lambda: self.talk_event(6)),
+            ('player/round5_bye', lambda: self.talk_event(7)),
+        ])
+
+    def talk_event(self, event):
+        """
+        Move the round to event when a line of the talk starts, if the round is still at the
+        event before it
+        """
+        if self.alive() and self.game.round_event == event - 1:
+            self.game.round_event = event
 
     def round_update(self):
         """"
         Update elephant events all over the round
         """
         # Event 0: Elephant is being captured
-        if self.game.round_event == 0 and pygame.mixer.get_busy() == False:
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.image, False, True), 180)
+        if self.game.round_event == 0 and audio_busy() == False:
+            self.elephant_run.direction = 'left'
+            self.image = self.elephant_run.image
             self.play_sound()
             self.game.round_event += 1
-        # Event 3
-        elif self.game.round_event == 3 and pygame.mixer.get_busy() == False:
-            self.play_sound()
-            self.game.round_event += 1
-        # Event 5
-        elif self.game.round_event == 5 and pygame.mixer.get_busy() == False:
-            self.play_sound()
+        # Event 3: Elephant is free, start the talk, the player thanks at event 4, the
+        # elephant replies at event 5 and the player says goodbye at event 6
+        elif self.game.round_event == 3 and audio_busy() == False:
+            self.talk()
             self.game.round_event += 1
 
         # Event 7: Elephant run away
-        if self.game.round_event == 7 and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 7 and audio_busy() == False:
             if self.rect.x >= 720:
                 self.game.win_round += 1
                 self.kill()
@@ -1291,14 +1154,14 @@ class Man1(pygame.sprite.Sprite):
         game sprites
     direction: control man1 direction
         string
-    man1_walk: list of man1 walk movement images
-        pygame image
-    man1_walk_index: control man1 walk movement
-        int
+    man_walk: man1 walk movement frames
+        Animation
     image: current image
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    motion: float position of the sprite
+        Motion
     Methods
     -------
     round_update:
@@ -1321,39 +1184,26 @@ class Man1(pygame.sprite.Sprite):
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
 
-        man_walk1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man1/man_walk1.png').convert_alpha(), (0.8, 0.8))
-        man_walk2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man1/man_walk2.png').convert_alpha(), (0.8, 0.8))
-        man_walk3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man1/man_walk3.png').convert_alpha(), (0.8, 0.8))
-        man_walk4 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man1/man_walk4.png').convert_alpha(), (0.8, 0.8))
-        man_walk5 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man1/man_walk5.png').convert_alpha(), (0.8, 0.8))
-
-        self.man_walk = [man_walk1, man_walk2, man_walk3, man_walk4, man_walk5]
-        self.man_walk_index = 0
-        self.image = self.man_walk[self.man_walk_index]
+        self.man_walk = Animation.from_files(
+            ['graphics/man1/man_walk1.png', 'graphics/man1/man_walk2.png',
+             'graphics/man1/man_walk3.png', 'graphics/man1/man_walk4.png',
+             'graphics/man1/man_walk5.png'], (0.8, 0.8), 0.14,
+            direction=self.direction)
+        self.image = self.man_walk.image
         self.rect = self.image.get_rect(midbottom=(0, 600))
+        self.motion = Motion(self)
 
     def move(self):
         """
         Control man1 movement
         """
+        self.man_walk.direction = self.direction
+        self.man_walk.update()
         if self.direction == 'right':
-            self.man_walk_index += 0.14
-            self.rect.x += 2
-            if self.man_walk_index >= len(self.man_walk):
-                self.man_walk_index = 0
-        self.image = self.man_walk[int(self.man_walk_index)]
-        if self.direction == 'left':
-            self.man_walk_index += 0.14
-            self.rect.x -= 2
-            if self.man_walk_index >= len(self.man_walk):
-                self.man_walk_index = 0
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.image, False, True), 180)
+            self.motion.move(2)
+        else:
+            self.motion.move(-2)
+        self.image = self.man_walk.image
 
     def update(self):
         """
@@ -1396,14 +1246,14 @@ class Man2(pygame.sprite.Sprite):
         game sprites
     direction: control man2 direction
         string
-    man2_walk: list of man2 walk movement images
-        pygame image
-    man2_walk_index: control man2 walk movement
-        int
+    man_walk: man2 walk movement frames
+        Animation
     image: current image
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    motion: float position of the sprite
+        Motion
     Methods
     -------
     round_update:
@@ -1426,39 +1276,26 @@ class Man2(pygame.sprite.Sprite):
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
 
-        man_walk1 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man2/man_walk1.png').convert_alpha(), (0.8, 0.8))
-        man_walk2 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man2/man_walk2.png').convert_alpha(), (0.8, 0.8))
-        man_walk3 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man2/man_walk3.png').convert_alpha(), (0.8, 0.8))
-        man_walk4 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man2/man_walk4.png').convert_alpha(), (0.8, 0.8))
-        man_walk5 = pygame.transform.scale_by(pygame.image.load(
-            'graphics/man2/man_walk5.png').convert_alpha(), (0.8, 0.8))
-
-        self.man_walk = [man_walk1, man_walk2, man_walk3, man_walk4, man_walk5]
-        self.man_walk_index = 0
-        self.image = self.man_walk[self.man_walk_index]
+        self.man_walk = Animation.from_files(
+            ['graphics/man2/man_walk1.png', 'graphics/man2/man_walk2.png',
+             'graphics/man2/man_walk3.png', 'graphics/man2/man_walk4.png',
+             'graphics/man2/man_walk5.png'], (0.8, 0.8), 0.14,
+            direction=self.direction)
+        self.image = self.man_walk.image
         self.rect = self.image.get_rect(midbottom=(800, 600))
+        self.motion = Motion(self)
 
     def move(self):
         """
         Control man2 movement
         """
+        self.man_walk.direction = self.direction
+        self.man_walk.update()
         if self.direction == 'right':
-            self.man_walk_index += 0.14
-            self.rect.x += 2
-            if self.man_walk_index >= len(self.man_walk):
-                self.man_walk_index = 0
-        self.image = self.man_walk[int(self.man_walk_index)]
-        if self.direction == 'left':
-            self.man_walk_index += 0.14
-            self.rect.x -= 2
-            if self.man_walk_index >= len(self.man_walk):
-                self.man_walk_index = 0
-            self.image = pygame.transform.rotate(
-                pygame.transform.flip(self.image, False, True), 180)
+            self.motion.move(2)
+        else:
+            self.motion.move(-2)
+        self.image = self.man_walk.image
 
     def update(self):
         """
@@ -1504,6 +1341,8 @@ class ItemsBar(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
     """
 
     def __init__(self, game):
@@ -1513,10 +1352,10 @@ class ItemsBar(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.static = True
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/items_bar.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.8, 0.8))
+        self.image = images.load(
+            'graphics/items/player_items/items_bar.png', (0.8, 0.8))
         self.rect = self.image.get_rect(center=(400, 100))
 
 # =============Start Screen=============
@@ -1531,7 +1370,7 @@ class StartButton(pygame.sprite.Sprite):
     -----------
     game: Game class in main file
         class
-    groups: all sprites group
+    groups: all sprites group and the click targets
         pygame sprite
     _layer: sprite draw order
         int
@@ -1539,6 +1378,8 @@ class StartButton(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     update: update start button events
@@ -1550,13 +1391,15 @@ class StartButton(pygame.sprite.Sprite):
         Initialize start button in start screen
         """
         self.game = game
-        self.groups = self.game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
-
-        self.image = pygame.transform.scale_by(pygame.image.load(
-            'graphics/items/start_game/start_button.png').convert_alpha(), (0.65, 0.65))
+        # The rect is set before the button joins the targets, so it is hit from the start
+        self.image = images.load(
+            'graphics/items/start_game/start_button.png', (0.65, 0.65))
         self.rect = self.image.get_rect(midbottom=(495, 615))
 
+        self.groups = self.game.all_sprites, self.game.targets
+        pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round',)
+
     def update(self):
         """
         Update start button events
@@ -1589,6 +1432,10 @@ class GameLabel(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     update: delete game label sprite in which round is different with start screen
@@ -1601,10 +1448,11 @@ class GameLabel(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round',)
+        self.static = True
 
-        self.image = pygame.image.load(
-            'graphics/items/start_game/game_label.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.92, 0.92))
+        self.image = images.load(
+            'graphics/items/start_game/game_label.png', (0.92, 0.92))
         self.rect = self.image.get_rect(midbottom=(415, 300))
 
     def update(self):
@@ -1634,6 +1482,10 @@ class Earth(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    timer: scheduled change of the earth image, None until the fairy starts her script
+        Timer
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -1648,20 +1500,20 @@ class Earth(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round',)
 
-        self.earth1 = pygame.image.load(
-            'graphics/items/intro/earth1.png').convert_alpha()
-        self.earth2 = pygame.image.load(
-            'graphics/items/intro/earth2.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.earth1, (0.6, 0.6))
+        self.earth1 = images.load('graphics/items/intro/earth1.png', (0.6, 0.6))
+        self.earth2 = images.load('graphics/items/intro/earth2.png', (0.6, 0.6))
+        self.image = self.earth1
         self.rect = self.image.get_rect(center=(400, 300))
+        self.timer = None
 
     def update(self):
         """
         Update events of earth
         """
-        if self.game.round_event == 1:
-            threading.Thread(target=self.change).start()
+        if self.game.round_event == 1 and self.timer is None:
+            self.timer = self.game.scheduler.after(9000, self.change, self)
         if self.game.current_round != 'intro':
             self.kill()
 
@@ -1669,10 +1521,8 @@ class Earth(pygame.sprite.Sprite):
         """
         Change earth image follow up to the fairy script
         """
-        if self.game.round_event == 1:
-            time.sleep(9)
-            self.image = pygame.transform.scale_by(self.earth2, (0.6, 0.6))
-            self.rect = self.image.get_rect(center=(400, 300))
+        self.image = self.earth2
+        self.rect = self.image.get_rect(center=(400, 300))
 
 # =============Round 1=============
 
@@ -1693,6 +1543,10 @@ class Mouse(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -1706,10 +1560,11 @@ class Mouse(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round',)
+        self.static = True
 
-        self.image = pygame.image.load(
-            'graphics/items/round1/mouse_click.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/round1/mouse_click.png', (0.6, 0.6))
         self.rect = self.image.get_rect(center=(450, 220))
 
     def update(self):
@@ -1736,6 +1591,10 @@ class Arrow(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -1749,10 +1608,10 @@ class Arrow(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round',)
+        self.static = True
 
-        self.image = pygame.image.load(
-            'graphics/items/round1/arrow.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load('graphics/items/round1/arrow.png', (0.6, 0.6))
         self.rect = self.image.get_rect(center=(300, 250))
 
     def update(self):
@@ -1783,6 +1642,8 @@ class Horn(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the horn is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -1798,20 +1659,20 @@ class Horn(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/horn.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/horn.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(320, 600))
+        self.game.collisions.watch(self, self.game.player, enter=self.put_in_bag)
 
     def update(self):
         """
         Update all horn events
         """
         self.win_round()
-        self.put_in_bag()
 
     def win_round(self):
         """
@@ -1819,7 +1680,7 @@ class Horn(pygame.sprite.Sprite):
         """
         # Event 2: Wait for player's help
         if self.game.current_round == 'round2':
-            if self.game.round_event == 2 and self.rect.colliderect(self.game.rhino) and self.game.rhino.die == False and pygame.mixer.get_busy() == False:
+            if self.game.round_event == 2 and self.game.collisions.touching(self, self.game.rhino) and self.game.rhino.die == False and audio_busy() == False:
                 self.game.round_event += 1
                 self.kill()
 
@@ -1827,7 +1688,7 @@ class Horn(pygame.sprite.Sprite):
         """
         When touches the player in round1_1, the horn will be placed in items bar
         """
-        if self.game.current_round == 'round1_1' and self.rect.colliderect(self.game.player):
+        if self.game.current_round == 'round1_1':
             self.rect = self.image.get_rect(center=(210, 110))
             self.game.win_round += 1
             self.draggable = True
@@ -1853,6 +1714,8 @@ class FirstAidKit(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the first aid kit is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -1865,27 +1728,27 @@ class FirstAidKit(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/first_aid_kit.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/first_aid_kit.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(500, 600))
+        self.game.collisions.watch(self, self.game.player, enter=self.put_in_bag)
 
     def update(self):
         self.win_round()
-        self.put_in_bag()
 
     def win_round(self):
         # Event 3: Wait for player's help
         if self.game.current_round == 'round3':
-            if self.game.round_event == 3 and self.rect.colliderect(self.game.lion) and self.game.lion.die == False and pygame.mixer.get_busy() == False:
+            if self.game.round_event == 3 and self.game.collisions.touching(self, self.game.lion) and self.game.lion.die == False and audio_busy() == False:
                 self.game.round_event = 4
                 self.kill()
 
     def put_in_bag(self):
-        if self.game.current_round == 'round1_1' and self.rect.colliderect(self.game.player):
+        if self.game.current_round == 'round1_1':
             self.rect = self.image.get_rect(center=(360, 110))
             self.game.win_round += 1
             self.draggable = True
@@ -1907,10 +1770,11 @@ class Nail(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
 
     Methods:
     --------
-    update: update all horn events
     touch_lion: move on to the next event of round 3 when the nail touches the lion
     """
 
@@ -1921,26 +1785,19 @@ class Nail(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.static = True
 
-        self.image = pygame.image.load(
-            'graphics/items/round3/nail.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load('graphics/items/round3/nail.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(350, 530))
-
-    def update(self):
-        """
-        Update lion events
-        """
-        self.touch_lion()
+        self.game.collisions.watch(self, self.game.lion, enter=self.touch_lion)
 
     def touch_lion(self):
         """
         Move on to the next event of round 3 when the nail touches the lion
         """
         # Event 0: Lion is running then touch the nail
-        if self.rect.colliderect(self.game.lion):
-            self.game.round_event += 1
-            self.kill()
+        self.game.round_event += 1
+        self.kill()
 
 # =============Round 4=============
 
@@ -1963,6 +1820,8 @@ class Carrot(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the carrot is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -1978,12 +1837,12 @@ class Carrot(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/carrot.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/carrot.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(500, 400))
 
     def update(self):
@@ -1999,7 +1858,7 @@ class Carrot(pygame.sprite.Sprite):
         """
         # Event 2: Wait for player's help
         if self.game.current_round == 'round4':
-            if self.game.round_event == 2 and self.rect.colliderect(self.game.rabbit) and self.game.lion.die == False and pygame.mixer.get_busy() == False:
+            if self.game.round_event == 2 and self.game.collisions.touching(self, self.game.rabbit) and self.game.lion.die == False and audio_busy() == False:
                 self.game.round_event += 1
                 self.kill()
 
@@ -2007,7 +1866,7 @@ class Carrot(pygame.sprite.Sprite):
         """
         Be placed in items bag when touches the player
         """
-        if self.game.current_round == 'round4' and self.rect.colliderect(self.game.player) and self.game.round_event == 2:
+        if self.game.current_round == 'round4' and self.game.collisions.touching(self, self.game.player) and self.game.round_event == 2:
             self.rect = self.image.get_rect(center=(360, 110))
             self.draggable = True
 
@@ -2030,6 +1889,8 @@ class Saw(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the saw is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -2047,27 +1908,27 @@ class Saw(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/saw.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/saw.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(700, 600))
+        self.game.collisions.watch(self, self.game.player, enter=self.put_in_bag)
 
     def update(self):
         """
         Update all saw events
         """
         self.win_round()
-        self.put_in_bag()
         self.kill_animal()
 
     def win_round(self):
         """
         When the saw touches the cage in round5, move on to the next event of this round
         """
-        if self.game.current_round == 'round5' and self.game.round_event == 2 and self.rect.colliderect(self.game.cage) and pygame.mixer.get_busy() == False:
+        if self.game.current_round == 'round5' and self.game.round_event == 2 and self.game.collisions.touching(self, self.game.cage) and audio_busy() == False:
             # Event 2: Saw touch the cage
             self.game.round_event += 1
             self.kill()
@@ -2077,7 +1938,7 @@ class Saw(pygame.sprite.Sprite):
         """
         Place the saw in items bar when it touches the player
         """
-        if self.game.current_round == 'round1_1' and self.rect.colliderect(self.game.player):
+        if self.game.current_round == 'round1_1':
             self.rect = self.image.get_rect(center=(500, 110))
             self.game.win_round += 1
             self.draggable = True
@@ -2086,11 +1947,11 @@ class Saw(pygame.sprite.Sprite):
         """
         Kill the animal when drag the saw to them
         """
-        if self.game.current_round == 'round2' and self.game.round_event == 2 and self.rect.colliderect(self.game.rhino):
+        if self.game.current_round == 'round2' and self.game.round_event == 2 and self.game.collisions.touching(self, self.game.rhino):
             self.kill()
-        elif self.game.current_round == 'round3' and self.rect.colliderect(self.game.lion) and self.game.round_event == 3:
+        elif self.game.current_round == 'round3' and self.game.collisions.touching(self, self.game.lion) and self.game.round_event == 3:
             self.kill()
-        elif self.game.current_round == 'round4' and self.rect.colliderect(self.game.lion) and self.game.round_event == 2:
+        elif self.game.current_round == 'round4' and self.game.collisions.touching(self, self.game.lion) and self.game.round_event == 2:
             self.kill()
 
 
@@ -2110,6 +1971,8 @@ class Cage(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
     """
 
     def __init__(self, game):
@@ -2120,10 +1983,9 @@ class Cage(pygame.sprite.Sprite):
         self._layer = ITEMS_LAYER
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.static = True
 
-        self.image = pygame.image.load(
-            'graphics/items/round5/cage.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load('graphics/items/round5/cage.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(500, 450))
 
 # =============Round 6=============
@@ -2147,6 +2009,8 @@ class Seed(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the seed is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -2162,12 +2026,12 @@ class Seed(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/seed.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/seed.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(400, 490))
 
     def update(self):
@@ -2181,8 +2045,8 @@ class Seed(pygame.sprite.Sprite):
         """
         When touches to the flower pot with shovel and watering can, move on to the next event of round 6
         """
-        if self.game.current_round == 'round6_1' and pygame.mixer.get_busy() == False:
-            if self.game.round_event == 3 and self.rect.colliderect(self.game.flowerpot):
+        if self.game.current_round == 'round6_1' and audio_busy() == False:
+            if self.game.round_event == 3 and self.game.collisions.touching(self, self.game.flowerpot):
                 self.game.win_round += 1
                 self.kill()
 
@@ -2190,7 +2054,7 @@ class Seed(pygame.sprite.Sprite):
         """
         when the player touches, the seed will be placed in items bar in round 2
         """
-        if self.game.current_round == 'round2' and self.rect.colliderect(self.game.player) and (self.game.win_round == 0 or self.game.win_round == 1):
+        if self.game.current_round == 'round2' and self.game.collisions.touching(self, self.game.player) and (self.game.win_round == 0 or self.game.win_round == 1):
             self.rect.center = (210, 110)
             self.draggable = True
             self.game.win_round += 1
@@ -2214,6 +2078,8 @@ class Shovel(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the seed is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -2229,12 +2095,12 @@ class Shovel(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/shovel.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/shovel.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(450, 535))
 
     def update(self):
@@ -2248,7 +2114,7 @@ class Shovel(pygame.sprite.Sprite):
         """
         When touches to the flower pot with seed and watering can, move on to the next event of round 6
         """
-        if self.game.round_event == 3 and self.rect.colliderect(self.game.flowerpot) and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 3 and self.game.collisions.touching(self, self.game.flowerpot) and audio_busy() == False:
             self.game.win_round += 1
             self.kill()
 
@@ -2257,7 +2123,7 @@ class Shovel(pygame.sprite.Sprite):
         When the player touches, the seed will be placed in items bar
         """
         if self.game.round_event in range(1, 4):
-            if self.rect.colliderect(self.game.player):
+            if self.game.collisions.touching(self, self.game.player):
                 self.rect.center = (500, 110)
                 self.draggable = True
 
@@ -2280,6 +2146,8 @@ class WateringCan(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the seed is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -2295,12 +2163,12 @@ class WateringCan(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'audio', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/watering_can.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/watering_can.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(250, 535))
 
     def update(self):
@@ -2314,7 +2182,7 @@ class WateringCan(pygame.sprite.Sprite):
         """
         When touches to the flower pot with shovel and seed, move on to the next event of round 6
         """
-        if self.game.round_event == 3 and self.rect.colliderect(self.game.flowerpot) and pygame.mixer.get_busy() == False:
+        if self.game.round_event == 3 and self.game.collisions.touching(self, self.game.flowerpot) and audio_busy() == False:
             self.game.win_round += 1
             self.kill()
 
@@ -2323,7 +2191,7 @@ class WateringCan(pygame.sprite.Sprite):
         When the player touches, the seed will be placed in items bar
         """
         if self.game.round_event in range(1, 4):
-            if self.rect.colliderect(self.game.player):
+            if self.game.collisions.touching(self, self.game.player):
                 self.rect.center = (360, 110)
                 self.draggable = True
 
@@ -2344,6 +2212,10 @@ class Flowerpot(pygame.sprite.Sprite):
         png
     rect: image with rectangle around to control position more easily
         pygame rect
+    static: never moves, drawn into the static layer of the round
+        bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -2357,12 +2229,13 @@ class Flowerpot(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round',)
+        self.static = True
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/round6/flowerpot.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/round6/flowerpot.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(400, 535))
 
     def update(self):
@@ -2393,6 +2266,8 @@ class Speaker(pygame.sprite.Sprite):
         pygame rect
     draggable: get to know when the seed is draggable
         bool
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
 
     Methods:
     --------
@@ -2408,12 +2283,12 @@ class Speaker(pygame.sprite.Sprite):
         self.game = game
         self.groups = self.game.all_sprites
         pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('round', 'contact')
         self.draggable = False
         self._layer = ITEMS_LAYER
 
-        self.image = pygame.image.load(
-            'graphics/items/player_items/speaker.png').convert_alpha()
-        self.image = pygame.transform.scale_by(self.image, (0.6, 0.6))
+        self.image = images.load(
+            'graphics/items/player_items/speaker.png', (0.6, 0.6))
         self.rect = self.image.get_rect(midbottom=(450, 535))
 
     def update(self):
@@ -2428,7 +2303,7 @@ class Speaker(pygame.sprite.Sprite):
         When touches player, move on to the next event of last round 
         """
         # Event 1: speaker touch player
-        if self.game.round_event == 1 and self.rect.colliderect(self.game.player):
+        if self.game.round_event == 1 and self.game.collisions.touching(self, self.game.player):
             self.game.round_event += 1
             self.kill()
 
@@ -2437,7 +2312,7 @@ class Speaker(pygame.sprite.Sprite):
         When the player touches, the seed will be placed in items bar
         """
         # Event 0: player collect speaker
-        if self.game.round_event == 0 and self.rect.colliderect(self.game.player):
+        if self.game.round_event == 0 and self.game.collisions.touching(self, self.game.player):
             self.rect.center = (500, 110)
             self.game.round_event += 1
             self.draggable = True
@@ -2453,7 +2328,7 @@ class SkipButton(pygame.sprite.Sprite):
     -----------
     game: Game class in main file
         class
-    groups: all sprites group
+    groups: all sprites group and the click targets
         pygame sprite
     _layer: sprite draw order
         int
@@ -2473,13 +2348,13 @@ class SkipButton(pygame.sprite.Sprite):
         """
         self.game = game
         self._layer = ITEMS_LAYER
-        self.groups = self.game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
-
-        self.image = pygame.transform.scale_by(pygame.image.load(
-            'graphics/items/game_control/skip_button.png').convert_alpha(), (0.065, 0.065))
+        self.image = images.load(
+            'graphics/items/game_control/skip_button.png', (0.065, 0.065))
         self.rect = self.image.get_rect(center=(680, 130))
 
+        self.groups = self.game.all_sprites, self.game.targets
+        pygame.sprite.Sprite.__init__(self, self.groups)
+
     def update(self):
         """
         Update all skip button events
@@ -2493,26 +2368,26 @@ class SkipButton(pygame.sprite.Sprite):
         """
         # Intro
         if self.game.current_round == 'intro':
-            pygame.mixer.stop()
+            stop_audio()
             self.game.next_round = 1
             self.kill()
         # Round 1
         elif self.game.current_round == 'round1_1':
-            pygame.mixer.stop()
+            stop_audio()
             self.game.round_event += 1
             self.kill()
         # Round 2
         elif self.game.current_round == 'round2':
-            pygame.mixer.stop()
+            stop_audio()
             self.game.round_event = 1
             self.kill()
         # Round 6_1
         elif self.game.current_round == 'round6_1':
-            pygame.mixer.stop()
+            stop_audio()
             self.kill()
         # Round 6_2
         elif self.game.current_round == 'round6_2':
-            pygame.mixer.stop()
+            stop_audio()
             self.kill()
 
 
@@ -2525,7 +2400,7 @@ class PlayAgainButton(pygame.sprite.Sprite):
     -----------
     game: Game class in main file
         class
-    groups: all sprites group
+    groups: all sprites group and the click targets
         pygame sprite
     _layer: sprite draw order
         int
@@ -2545,15 +2420,118 @@ class PlayAgainButton(pygame.sprite.Sprite):
         """
         self.game = game
         self._layer = ITEMS_LAYER
-        self.groups = self.game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
-
-        self.image = pygame.transform.scale_by(pygame.image.load(
-            'graphics/items/game_control/play_again_btn.png').convert_alpha(), (0.3, 0.3))
+        self.image = images.load(
+            'graphics/items/game_control/play_again_btn.png', (0.3, 0.3))
         self.rect = self.image.get_rect(center=(400, 440))
 
+        self.groups = self.game.all_sprites, self.game.targets
+        pygame.sprite.Sprite.__init__(self, self.groups)
+
     def is_clicked(self):
         """
         When play again button is clicked, come back to start screen 
         """
         self.game.new()
+
+
+class Subtitle(pygame.sprite.Sprite):
+    """
+    A class shows the caption of the sound which is playing at the bottom of the screen
+    ...
+    Attributes:
+    -----------
+    game: Game class in main file
+        class
+    groups: all sprites group
+        pygame sprite
+    _layer: sprite draw order
+        int
+    wakes_on: what the sprite waits for, it is not updated until one of them changes
+        tuple
+    line: caption on the screen, None when no sound plays
+        string
+    image: rendered caption, empty without caption
+        pygame surface
+    rect: image with rectangle around to control position more easily
+        pygame rect
+
+    Methods:
+    --------
+    update: show the caption of the sound which is playing
+    """
+
+    def __init__(self, game):
+        """
+        Initialize subtitle without caption
+        """
+        self.game = game
+        self._layer = TEXT_LAYER
+        self.groups = self.game.all_sprites
+        pygame.sprite.Sprite.__init__(self, self.groups)
+        self.wakes_on = ('sound',)
+
+        self.line = None
+        self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(midbottom=(WIN_WIDTH // 2, WIN_HEIGHT - 20))
+
+    def update(self):
+        """
+        Show the caption of the sound which is playing, rendered only the first time
+        """
+        line = SUBTITLES.get(playing_line())
+        if line == self.line:
+            return
+        self.line = line
+        if line is None:
+            self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
+        else:
+            self.image = text.render(line, SUBTITLE_SIZE, SUBTITLE_COLOR, SUBTITLE_BACKGROUND)
+        self.rect = self.image.get_rect(midbottom=(WIN_WIDTH // 2, WIN_HEIGHT - 20))
+
+
+class Hud(pygame.sprite.Sprite):
+    """
+    A class shows the frame rate and the cpu usage at the top left corner of the screen
+    ...
+    Attributes:
+    -----------
+    game: Game class in main file
+        class
+    groups: all sprites group
+        pygame sprite
+    _layer: sprite draw order
+        int
+    line: text on the screen
+        string
+    image: text put together from cached glyphs
+        pygame surface
+    rect: image with rectangle around to control position more easily
+        pygame rect
+
+    Methods:
+    --------
+    update: show the current frame rate and cpu usage
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the HUD
+        """
+        self.game = game
+        self._layer = TEXT_LAYER
+        self.groups = self.game.all_sprites
+        pygame.sprite.Sprite.__init__(self, self.groups)
+
+        self.line = None
+        self.update()
+
+    def update(self):
+        """
+        Show the current frame rate and cpu usage, the line changes only a few times a second
+        """
+        line = '%d fps  %d%% cpu' % (self.game.clock.get_fps(), self.game.idle.cpu)
+        if line == self.line:
+            return
+        self.line = line
+        self.image = text.render_glyphs(line, HUD_SIZE, HUD_COLOR)
+        self.rect = self.image.get_rect(topleft=(10, 10))
@@ -0,0 +1,39 @@
+# Caption shown while a sound plays, keyed by sound name
+SUBTITLES = {
+    'fairy/intro': '[Fairy speaks]',
+    'fairy/round1': '[Fairy speaks]',
+    'fairy/round2': '[Fairy speaks]',
+    'fairy/round6_1': '[Fairy speaks]',
+    'fairy/round6_2': '[Fairy speaks]',
+
+    'player/round1_1': '[Player speaks]',
+    'player/round3_help_lion': '[Player offers to help the lion]',
+    'player/round3_win': '[Player is glad]',
+    'player/round4_see_rabbit': '[Player sees the rabbit]',
+    'player/round4_reply': '[Player replies]',
+    'player/round4_thanks': '[Player says thanks]',
+    'player/round5_start': '[Player sees the elephant]',
+    'player/round5_thanks': '[Player says thanks]',
+    'player/round5_bye': '[Player says goodbye]',
+    'player/round6_1_start': '[Player speaks]',
+    'player/round6_2_win': '[Player is glad]',
+    'player/round6_2_end': '[Player speaks]',
+    'player/round7_win': '[Player is glad]',
+
+    'rhino/rhino': '[Rhino roars]',
+    'rhino/rhino_win': '[Rhino thanks the player]',
+    'rhino/rhino_die': '[Rhino dies]',
+
+    'lion/touch_nail': '[Lion steps on a nail]',
+    'lion/win': '[Lion thanks the player]',
+    'lion/die': '[Lion dies]',
+
+    'rabbit/rabbit_hungry': '[Rabbit is hungry]',
+    'rabbit/rabbit_get_food': '[Rabbit gets the carrot]',
+    'rabbit/rabbit_win': '[Rabbit thanks the player]',
+    'rabbit/rabbit_die': '[Rabbit dies]',
+
+    'elephant/elephant_start': '[Elephant calls for help]',
+    'elephant/elephant_win': '[Elephant is free]',
+    'elephant/elephant_reply': '[Elephant replies]',
+}
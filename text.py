@@ -0,0 +1,140 @@
+import pygame
+from collections import OrderedDict
+from config import *
+
+
+class TextCache():
+    """
+    A class keep rendered text, so a line shown again is not rendered one more time
+    , whole lines are kept keyed by (text, size, color, background). Text which changes
+    often, e.g. the numbers of the HUD, is put together from kept glyphs instead of keeping
+    every line. The least recently used lines and glyphs are dropped over max_size
+    ...
+    Attributes:
+    -----------
+    path: font file
+        string
+    max_size: number of lines, and of glyphs, kept before evicting
+        int
+    fonts: loaded fonts keyed by size
+        dict
+    lines: rendered lines keyed by (text, size, color, background)
+        OrderedDict
+    glyphs: rendered characters keyed by (character, size, color)
+        OrderedDict
+    hits: number of lines and glyphs served from the cache
+        int
+    misses: number of lines and glyphs rendered with the font
+        int
+    evictions: number of lines and glyphs dropped from the cache
+        int
+
+    Methods:
+    --------
+    font: return the font of a size, loaded the first time
+    render: return a rendered line
+    render_glyphs: return a line put together from rendered glyphs
+    evict: drop the least recently used lines or glyphs until they fit max_size
+    report: return the cache counts as text
+    """
+
+    def __init__(self, path, max_size=128):
+        """
+        Initialize an empty text cache, fonts are loaded when first used
+        """
+        self.path = path
+        self.max_size = max_size
+        self.fonts = {}
+        self.lines = OrderedDict()
+        self.glyphs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size):
+        """
+        Return the font of size
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(self.path, size)
+        return font
+
+    def render(self, text, size, color, background=None):
+        """
+        Return text rendered the first time it is asked for
+
+            Parameter:
+                text (string): line of text
+                size (int): font size
+                color (tuple): text color
+                background (tuple): color of a box behind the text, with alpha, None for no box
+        """
+        key = (text, size, color, background)
+        line = self.lines.get(key)
+        if line is not None:
+            self.hits += 1
+            self.lines.move_to_end(key)
+            return line
+
+        self.misses += 1
+        line = self.font(size).render(text, True, color)
+        if background is not None:
+            box = pygame.Surface((line.get_width() + 2 * TEXT_PADDING,
+                                  line.get_height() + 2 * TEXT_PADDING), pygame.SRCALPHA)
+            box.fill(background)
+            box.blit(line, (TEXT_PADDING, TEXT_PADDING))
+            line = box
+        line = line.convert_alpha()
+        self.lines[key] = line
+        self.evict(self.lines)
+        return line
+
+    def glyph(self, char, size, color):
+        """
+        Return one character rendered the first time it is asked for
+        """
+        key = (char, size, color)
+        glyph = self.glyphs.get(key)
+        if glyph is not None:
+            self.hits += 1
+            self.glyphs.move_to_end(key)
+            return glyph
+
+        self.misses += 1
+        glyph = self.font(size).render(char, True, color).convert_alpha()
+        self.glyphs[key] = glyph
+        self.evict(self.glyphs)
+        return glyph
+
+    def render_glyphs(self, text, size, color):
+        """
+        Return text put together from rendered glyphs, for text which changes every few frames
+        """
+        glyphs = [self.glyph(char, size, color) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        line = pygame.Surface((max(width, 1), self.font(size).get_height()), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            line.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return line
+
+    def evict(self, cache):
+        """
+        Drop the least recently used lines or glyphs until they fit max_size
+        """
+        while len(cache) > self.max_size:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def report(self):
+        """
+        Return the cache counts as text
+        """
+        return 'text: %d lines, %d glyphs, %d hits, %d misses, %d evictions' % (
+            len(self.lines), len(self.glyphs), self.hits, self.misses, self.evictions)
+
+
+# Text cache shared by all sprites of the game
+text = TextCache(FONT, TEXT_CACHE_SIZE)
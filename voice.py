@@ -0,0 +1,313 @@
+import itertools
+import struct
+import pygame
+from config import *
+from assets import load_sound
+from buses import buses
+
+# Posted by the mixer when the channel of a voice line or the streamed line stopped playing
+VOICE_END = pygame.event.custom_type()
+
+# Voice lines which are playing, (sound name, channel or VoiceLine) keyed by line id, the
+# last started line has the highest id. Sprites see a line end through audio_busy
+lines = {}
+line_ids = itertools.count(1)
+
+# Dialogue playing on the voice channel, None if none is
+dialogue = None
+
+# Length in second of each wav file, read from its header
+lengths = {}
+
+
+def wav_length(path):
+    """
+    Return the length in second of a wav file, only its chunk headers are read
+    """
+    if path not in lengths:
+        byte_rate = data_size = None
+        with open(path, 'rb') as file:
+            riff, size, wave = struct.unpack('<4sI4s', file.read(12))
+            if riff != b'RIFF' or wave != b'WAVE':
+                raise ValueError('%s is not a wav file' % path)
+            while byte_rate is None or data_size is None:
+                header = file.read(8)
+                if len(header) < 8:
+                    raise ValueError('%s has no fmt or data chunk' % path)
+                chunk, size = struct.unpack('<4sI', header)
+                if chunk == b'fmt ':
+                    byte_rate = struct.unpack('<HHII', file.read(12))[3]
+                    file.seek(size - 12 + (size & 1), 1)
+                else:
+                    if chunk == b'data':
+                        data_size = size
+                    file.seek(size + (size & 1), 1)
+        lengths[path] = data_size / byte_rate
+    return lengths[path]
+
+
+def is_streamed(path):
+    """
+    Return True if the voice line of path is streamed from disk instead of decoded in memory
+    """
+    try:
+        return wav_length(path) > VOICE_STREAM_SECONDS
+    except (OSError, ValueError, struct.error):
+        return False
+
+
+class VoiceLine():
+    """
+    A class play a long voice line streamed from disk through pygame.mixer.music
+    , only a small buffer of the line is decoded at a time so the memory used by dialogue
+    does not grow with the number of lines. One streamed line plays at a time.
+    ...
+    Attributes:
+    -----------
+    path: wav file path
+        string
+    length: length of the line in second
+        float
+    playing: the line which was streamed last, shared by all lines
+        VoiceLine
+
+    Methods:
+    --------
+    play: start streaming the line, VOICE_END is posted when it finished
+    stop: stop the line if it is playing
+    get_busy: return True if the line is playing
+    get_length: return the length of the line in second
+    """
+
+    playing = None
+
+    def __init__(self, path):
+        """
+        Initialize voice line, the file is not opened until the line is played
+        """
+        self.path = path
+        self.length = wav_length(path)
+
+    def play(self, loops=0):
+        """
+        Start streaming the line, the line which was streamed before is stopped
+        """
+        pygame.mixer.music.load(self.path)
+        pygame.mixer.music.set_endevent(VOICE_END)
+        pygame.mixer.music.set_volume(buses.voice.volume)
+        pygame.mixer.music.play(loops)
+        VoiceLine.playing = self
+
+    def stop(self):
+        """
+        Stop the line if it is playing
+        """
+        if self.get_busy():
+            pygame.mixer.music.stop()
+
+    def get_busy(self):
+        """
+        Return True if the line is playing
+        """
+        return VoiceLine.playing is self and pygame.mixer.music.get_busy()
+
+    def get_length(self):
+        """
+        Return the length of the line in second
+        """
+        return self.length
+
+
+class Dialogue():
+    """
+    A class play the voice lines of a conversation one after the other on the voice channel
+    , the line after the playing one is queued on the channel, so the mixer starts it as
+    soon as the line ended instead of a frame seeing the channel free. The lines are decoded
+    sounds, a queue can not hold a streamed line. A line may come with a callback called when
+    it starts, e.g. to move the round on or change the pose of its speaker
+    ...
+    Attributes:
+    -----------
+    lines: (sound name, sound, callback) of each line in order, callback None for no callback
+        list
+    index: index of the line which plays
+        int
+    channel: voice channel the conversation plays on
+        pygame Channel
+    id: line id of the line which plays
+        int
+
+    Methods:
+    --------
+    play: play the first line
+    start_line: track the line which started, queue the next one and call its callback
+    advance: move on to the line the mixer started from the queue
+    """
+
+    def __init__(self, lines):
+        """
+        Initialize a conversation, it does not play until play is called
+        """
+        self.lines = lines
+        self.index = 0
+        self.channel = None
+        self.id = None
+
+    def play(self):
+        """
+        Play the first line on the voice channel
+        """
+        self.channel = buses.voice.play(self.lines[0][1])
+        self.channel.set_endevent(VOICE_END)
+        self.start_line()
+
+    def start_line(self):
+        """
+        Track the line at index, queue the line after it and call its callback
+        """
+        name, sound, callback = self.lines[self.index]
+        self.id = next(line_ids)
+        lines[self.id] = (name, self.channel)
+        if self.index + 1 < len(self.lines):
+            self.channel.queue(self.lines[self.index + 1][1])
+        if callback is not None:
+            callback()
+
+    def advance(self):
+        """
+        Move on to the line the mixer started from the queue, called when VOICE_END is received
+
+            Return:
+                False once the last line plays, nothing is left to queue
+        """
+        following = self.index + 1
+        if following >= len(self.lines):
+            return False
+        if self.channel.get_sound() is self.lines[following][1]:
+            end_line(self.id)
+            self.index = following
+            self.start_line()
+        elif not self.channel.get_busy():
+            # The queued line ended before the event was received, play the next one
+            end_line(self.id)
+            self.index = following
+            self.channel.play(self.lines[following][1])
+            self.start_line()
+        return True
+
+
+def load_voice(path):
+    """
+    Return the voice line of path, streamed if it is longer than VOICE_STREAM_SECONDS
+    and a decoded sound otherwise
+    """
+    if is_streamed(path):
+        return VoiceLine(path)
+    return load_sound(path)
+
+
+def play_line(name, sound, loops=0):
+    """
+    Play a voice line on the voice bus, VOICE_END is posted by the mixer when it stopped
+    , the line takes the place of the voice line which was playing, the music and the sound
+    effects go on. The music is ducked until no voice line plays
+
+        Parameter:
+            name (string): sound name of the line, e.g. 'fairy/intro'
+            sound (pygame Sound or VoiceLine): samples of the line
+            loops (int): number of times the line is repeated
+    """
+    stop_dialogue()
+    for id, (playing, channel) in list(lines.items()):
+        # A decoded line is replaced on the voice channel and a streamed line by loading the
+        # next one, the line only needs stopping when the new one plays the other way
+        if isinstance(channel, VoiceLine) != isinstance(sound, VoiceLine):
+            channel.stop()
+        end_line(id)
+    if isinstance(sound, VoiceLine):
+        sound.play(loops)
+        buses.voice.plays += 1
+        channel = sound
+    else:
+        channel = buses.voice.play(sound, loops)
+        channel.set_endevent(VOICE_END)
+    lines[next(line_ids)] = (name, channel)
+    buses.duck(True)
+
+
+def play_dialogue(conversation):
+    """
+    Play the lines of a conversation without a gap between them, on the voice bus like
+    play_line: the voice line which was playing is stopped
+
+        Parameter:
+            conversation (list): (sound name, decoded sound, callback) of each line in order
+
+        Return:
+            the Dialogue which plays
+    """
+    global dialogue
+    stop_audio()
+    dialogue = Dialogue(conversation)
+    dialogue.play()
+    buses.duck(True)
+    return dialogue
+
+
+def stop_dialogue():
+    """
+    Forget the dialogue which plays, its queued line is dropped when its channel is played
+    again or stopped
+    """
+    global dialogue
+    dialogue = None
+
+
+def end_line(id):
+    """
+    Forget the voice line of id, it stopped or was replaced
+    """
+    del lines[id]
+
+
+def finish_lines():
+    """
+    Forget the voice lines which stopped
+    , called when VOICE_END is received, only the channels of the playing lines are asked.
+    The music is back to its volume once no voice line plays
+    """
+    if dialogue is not None and not dialogue.advance():
+        stop_dialogue()
+    for id, (name, channel) in list(lines.items()):
+        if not channel.get_busy():
+            end_line(id)
+    if not lines:
+        buses.duck(False)
+
+
+def audio_busy():
+    """
+    Return True if a voice line is playing, the mixer is not asked: lines are forgotten
+    when their end event is received. The theme music does not count
+    """
+    return bool(lines)
+
+
+def playing_line():
+    """
+    Return the sound name of the last started voice line which is playing, None if none is
+    """
+    if not lines:
+        return None
+    return lines[max(lines)][0]
+
+
+def stop_audio():
+    """
+    Stop every voice line, the music and the sound effects go on
+    """
+    stop_dialogue()
+    for id, (name, channel) in list(lines.items()):
+        channel.stop()
+        end_line(id)
+    buses.duck(False)
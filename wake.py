@@ -0,0 +1,103 @@
+import pygame
+
+
+class WakeGroup(pygame.sprite.LayeredUpdates):
+    """
+    A class update only the sprites which have something to do
+    , a sprite can set wakes_on to the names of the conditions it waits for, e.g.
+    ('round', 'audio'). It sleeps until the value of one of them differs from the value it saw
+    at its last update. A sprite without wakes_on, or with wakes_on None, is updated every time.
+    Each condition is read once a pass and the sleeping sprites are listed under the value
+    they saw of each condition they wait for, so a condition which did not change wakes nobody
+    ...
+    Attributes:
+    -----------
+    conditions: function returning the current value of each condition, keyed by name
+        dict
+    seen: values of its conditions each sleeping sprite saw at its last update, keyed by name
+        dict
+    waiting: sleeping sprites keyed by condition name, then by the value they saw of it
+        dict
+    passes: number of update passes since the last report
+        int
+    updates: number of sprite updates run since the last report
+        int
+    skips: number of sprite updates skipped since the last report
+        int
+
+    Methods:
+    --------
+    sleep: list a sprite under the values it saw of its conditions
+    wake: take a sprite off the lists of its conditions
+    update: update the sprites which are awake
+    report: return the run and skipped updates per pass as text
+    """
+
+    def __init__(self, conditions, *sprites):
+        """
+        Initialize an empty group with the wake conditions of the game
+        """
+        self.conditions = conditions
+        self.seen = {}
+        self.waiting = {name: {} for name in conditions}
+        self.passes = 0
+        self.updates = 0
+        self.skips = 0
+        pygame.sprite.LayeredUpdates.__init__(self, *sprites)
+
+    def remove_internal(self, sprite):
+        """
+        Forget what a removed sprite saw
+        """
+        self.wake(sprite)
+        pygame.sprite.LayeredUpdates.remove_internal(self, sprite)
+
+    def sleep(self, sprite, values):
+        """
+        List sprite under the value it saw of each condition of its wakes_on
+        """
+        self.seen[sprite] = {name: values[name] for name in sprite.wakes_on}
+        for name, value in self.seen[sprite].items():
+            self.waiting[name].setdefault(value, set()).add(sprite)
+
+    def wake(self, sprite):
+        """
+        Take sprite off the lists of its conditions, if it sleeps
+        """
+        for name, value in self.seen.pop(sprite, {}).items():
+            sleepers = self.waiting[name][value]
+            sleepers.discard(sprite)
+            if not sleepers:
+                del self.waiting[name][value]
+
+    def update(self, *args, **kwargs):
+        """
+        Update the sprites which are awake, in draw order like pygame groups
+        """
+        self.passes += 1
+        # Values before the pass, so a sprite also wakes up for its own changes
+        values = {name: condition() for name, condition in self.conditions.items()}
+        woken = set()
+        for name, value in values.items():
+            for seen, sleepers in self.waiting[name].items():
+                if seen != value:
+                    woken.update(sleepers)
+        self.skips += len(self.seen) - len(woken)
+
+        for sprite in [sprite for sprite in self.sprites()
+                       if sprite not in self.seen or sprite in woken]:
+            self.wake(sprite)
+            sprite.update(*args, **kwargs)
+            self.updates += 1
+            if getattr(sprite, 'wakes_on', None) is not None and sprite.alive():
+                self.sleep(sprite, values)
+
+    def report(self):
+        """
+        Return the run and skipped sprite updates per pass since the last report as text
+        """
+        passes = max(self.passes, 1)
+        text = 'sprites: %.1f updates, %.1f skipped per step' % (
+            self.updates / passes, self.skips / passes)
+        self.passes = self.updates = self.skips = 0
+        return text